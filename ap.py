@@ -10,6 +10,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 from logs.logger import Logger
 from portfolioManagerApp import PortfolioManagerApp
 from controllers import ControllerClass
+from portfolio_manager.rate_limiter import RateLimitExceeded
 
 # Initialize Flask app, logger, and controller
 app = Flask(__name__)
@@ -22,6 +23,11 @@ def handle_error(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
+        except RateLimitExceeded as e:
+            logger.log_warning(f"Rate limited: {e}")
+            response = jsonify({"status": "error", "message": str(e), "retry_after": round(e.retry_after, 2)})
+            response.headers["Retry-After"] = str(max(1, int(e.retry_after + 0.999)))
+            return response, 429
         except Exception as e:
             logger.log_error(f"Error: {traceback.format_exc()}")
             print(traceback.format_exc())
@@ -46,11 +52,14 @@ def perform_analysis():
     ticker = data.get("ticker")
     start_date = data.get("start_date")
     end_date = data.get("end_date")
+    indicators = data.get("indicators")
 
     if not all([ticker, start_date, end_date]):
         return jsonify({"status": "error", "message": "Missing required fields: ticker, start_date, end_date"}), 400
+    if indicators is not None and (not isinstance(indicators, list) or not all(isinstance(name, str) for name in indicators)):
+        return jsonify({"status": "error", "message": "indicators must be a list of indicator names."}), 400
 
-    analysis_data, status_code = controller.perform_stock_analysis(ticker, start_date, end_date)
+    analysis_data, status_code = controller.perform_stock_analysis(ticker, start_date, end_date, indicators)
     
     if status_code != 200:
         return jsonify({"status": "error", "message": "Failed to analyze stock."}), status_code
@@ -90,6 +99,48 @@ def portfolio_operations():
     """API endpoint for portfolio operations."""
     return jsonify(controller.portfolio_operations())
 
+@app.route("/api/portfolio/risk", methods=["POST"])
+@handle_error
+def portfolio_risk():
+    """API endpoint reporting portfolio and per-holding risk metrics."""
+    data = request.get_json()
+
+    if not data:
+        return jsonify({"status": "error", "message": "Invalid JSON payload."}), 400
+
+    email = data.get("email")
+    start_date = data.get("start_date")
+    end_date = data.get("end_date")
+
+    if not all([email, start_date, end_date]):
+        return jsonify({"status": "error", "message": "Missing required fields: email, start_date, end_date"}), 400
+
+    risk, status_code = controller.portfolio_risk(email, start_date, end_date, data.get("benchmark"))
+    return jsonify(risk), status_code
+
+@app.route("/api/symbols", methods=["GET"])
+@handle_error
+def symbols():
+    """API endpoint suggesting symbols for a partial symbol or company name."""
+    query = request.args.get("q", "")
+    limit = min(request.args.get("limit", 10, type=int), 50)
+    suggestions, status_code = controller.symbol_suggestions(query, limit)
+    return jsonify(suggestions), status_code
+
+@app.route("/api/cache/stats", methods=["GET"])
+@handle_error
+def cache_stats():
+    """API endpoint reporting cache hit/miss/eviction counters."""
+    stats, status_code = controller.cache_stats()
+    return jsonify(stats), status_code
+
+@app.route("/api/cache/warmer", methods=["GET"])
+@handle_error
+def cache_warmer():
+    """API endpoint reporting the background cache warmer's progress."""
+    progress, status_code = controller.warmer_progress()
+    return jsonify(progress), status_code
+
 # ---------- Web Interface Routes ----------
 
 @app.route("/")
@@ -0,0 +1,92 @@
+"""
+Benchmark the columnar PriceStore against the previous pickle cache files.
+
+Writes a synthetic daily OHLCV history per ticker in both formats, then loads it back
+in a fresh subprocess per scenario and reports wall time and peak RSS growth.
+
+Usage:
+    python benchmarks/cache_format_benchmark.py --years 20 --tickers 50
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager.memory_cache import MemoryCache
+from file_manager.price_store import PriceStore
+
+
+def _synthetic_history(years: int, seed: int) -> pd.DataFrame:
+    index = pd.bdate_range("2000-01-03", periods=years * 252, name="Date")
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+    return pd.DataFrame(
+        {
+            "Open": close * (1 + rng.normal(0, 0.002, len(index))),
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 50_000_000, len(index)),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=index,
+    )
+
+
+def _prepare(root: str, tickers: list, years: int):
+    store = PriceStore(store_dir=os.path.join(root, "store"))
+    for seed, ticker in enumerate(tickers):
+        data = _synthetic_history(years, seed)
+        start, end = data.index[0].strftime("%Y-%m-%d"), (data.index[-1] + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+        pd.to_pickle(data, os.path.join(root, f"{ticker}_{start}_{end}.pkl"))
+        store.merge(ticker, data, start, end)
+
+
+def _scenario(root: str, tickers: list, scenario: str, queue):
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    store = PriceStore(store_dir=os.path.join(root, "store"), memory_cache=MemoryCache(0))
+    started = time.perf_counter()
+    frames = []
+    for ticker in tickers:
+        if scenario == "pickle":
+            pickle_file = next(f for f in os.listdir(root) if f.startswith(f"{ticker}_"))
+            frames.append(pd.read_pickle(os.path.join(root, pickle_file))["Close"])
+        elif scenario == "columnar (all columns)":
+            frames.append(store.load_range(ticker, "1900-01-01", "2100-01-01")["Close"])
+        else:
+            frames.append(store.load_range(ticker, "1900-01-01", "2100-01-01", columns=["Close"])["Close"])
+    elapsed = time.perf_counter() - started
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base_rss
+    queue.put((elapsed, rss_kb, sum(len(frame) for frame in frames)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--tickers", type=int, default=50)
+    args = parser.parse_args()
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+
+    with tempfile.TemporaryDirectory() as root:
+        _prepare(root, tickers, args.years)
+        context = multiprocessing.get_context("spawn")
+        print(f"{args.tickers} tickers x {args.years} years of daily bars, loading the Close column")
+        print(f"{'format':<28}{'load time (ms)':>16}{'peak RSS growth (MiB)':>24}")
+        for scenario in ("pickle", "columnar (all columns)", "columnar (Close only)"):
+            queue = context.Queue()
+            process = context.Process(target=_scenario, args=(root, tickers, scenario, queue))
+            process.start()
+            elapsed, rss_kb, _ = queue.get()
+            process.join()
+            print(f"{scenario:<28}{elapsed * 1000:>16.1f}{rss_kb / 1024:>24.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from pathlib import Path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 
 from portfolioManagerApp import PortfolioManagerApp
+from portfolio_manager.rate_limiter import RateLimitExceeded
 from logs.logger import Logger
 
 
@@ -22,9 +23,9 @@ class ControllerClass:
         self.base_dir = Path(base_dir or ".").resolve()
         self.portfolio_manager = PortfolioManagerApp(base_dir=self.base_dir)
 
-    def perform_stock_analysis(self, ticker, start_date, end_date):
+    def perform_stock_analysis(self, ticker, start_date, end_date, indicators=None):
         try:
-            result = self.portfolio_manager.perform_analysis(ticker, start_date, end_date)
+            result = self.portfolio_manager.perform_analysis(ticker, start_date, end_date, indicators)
             
             if not result:
                 self.logger.log_error(f"Analysis returned empty for {ticker}.")
@@ -41,6 +42,8 @@ class ControllerClass:
                 "message": f"Stock analysis for {ticker} completed successfully.",
                 "data": result  # Ensure this is correctly structured
             }, 200
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             return self.handle_error("perform_stock_analysis", e)
 
@@ -85,6 +88,67 @@ class ControllerClass:
         except Exception as e:
             return self.handle_error("search_stocks", e)
 
+    def symbol_suggestions(self, query, limit=10):
+        """
+        Handle symbol typeahead request.
+
+        Args:
+            query (str): Partial symbol or company name.
+            limit (int): Maximum number of suggestions.
+
+        Returns:
+            tuple: JSON response and HTTP status code.
+        """
+        try:
+            return self.portfolio_manager.suggest_symbols(query, limit), 200
+        except Exception as e:
+            return self.handle_error("symbol_suggestions", e)
+
+    def cache_stats(self):
+        """
+        Handle cache statistics request.
+
+        Returns:
+            tuple: JSON response and HTTP status code.
+        """
+        try:
+            return self.portfolio_manager.cache_stats(), 200
+        except Exception as e:
+            return self.handle_error("cache_stats", e)
+
+    def warmer_progress(self):
+        """
+        Handle cache warmer progress request.
+
+        Returns:
+            tuple: JSON response and HTTP status code.
+        """
+        try:
+            return self.portfolio_manager.warmer_progress(), 200
+        except Exception as e:
+            return self.handle_error("warmer_progress", e)
+
+    def portfolio_risk(self, user_email, start_date, end_date, benchmark=None):
+        """
+        Handle portfolio risk request.
+
+        Args:
+            user_email (str): Owner of the portfolio.
+            start_date (str): Start date in YYYY-MM-DD format.
+            end_date (str): End date in YYYY-MM-DD format.
+            benchmark (Optional[str]): Benchmark ticker for beta.
+
+        Returns:
+            tuple: JSON response and HTTP status code.
+        """
+        try:
+            result = self.portfolio_manager.portfolio_risk(user_email, start_date, end_date, benchmark)
+            return result, 200 if result.get("status") == "success" else 400
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            return self.handle_error("portfolio_risk", e)
+
     def portfolio_operations(self):
         """
         Handle portfolio operations request.
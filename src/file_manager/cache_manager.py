@@ -0,0 +1,277 @@
+import os
+import sys
+import json
+import time
+import shutil
+import threading
+from typing import Dict, Optional
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+
+
+class CacheManager:
+    """
+    Keeps a cache directory within a byte budget.
+
+    Entries are the top-level files of the cache directory plus the children of its
+    top-level subdirectories (e.g. ``store/AAPL`` for a PriceStore ticker directory).
+    Access metadata (size, last access, access count) is kept in memory and persisted to
+    an index file, and entries are evicted least-recently-used (``lru``) or
+    least-frequently-used (``lfu``) first. The budget is enforced after every recorded
+    write and by an optional background sweeper, which also picks up files written by
+    other processes. Eviction stops at ``low_watermark`` of the budget to avoid thrashing.
+    """
+
+    POLICIES = ("lru", "lfu")
+    INDEX_FILE = ".cache_index.json"
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 1024 ** 3,
+        policy: str = "lru",
+        sweep_interval: float = 300,
+        low_watermark: float = 0.9,
+    ):
+        """
+        Initialize the CacheManager instance.
+
+        Args:
+            cache_dir (str): Cache directory to manage.
+            max_bytes (int): Byte budget for the directory.
+            policy (str): Eviction policy, "lru" or "lfu".
+            sweep_interval (float): Seconds between background sweeps (0 disables the sweeper).
+            low_watermark (float): Fraction of the budget to evict down to.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown eviction policy '{policy}'. Expected one of {self.POLICIES}.")
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.sweep_interval = sweep_interval
+        self.low_watermark = low_watermark
+        self.logger = Logger("CacheManager")
+        self.lock = threading.RLock()
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0, "evicted_bytes": 0}
+        self._entries: Dict[str, dict] = {}
+        self._stop_event = threading.Event()
+        self._sweeper = None
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+        self.scan()
+        if self.sweep_interval > 0:
+            self.start_sweeper()
+
+    # ---------- Index persistence ----------
+
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, self.INDEX_FILE)
+
+    def _load_index(self):
+        """Restore access metadata written by a previous run."""
+        try:
+            with open(self._index_path(), "r") as f:
+                self._entries = json.load(f).get("entries", {})
+        except FileNotFoundError:
+            self._entries = {}
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.log_warning(f"Ignoring unreadable cache index: {e}")
+            self._entries = {}
+
+    def _save_index(self):
+        """Persist access metadata atomically."""
+        tmp_file = f"{self._index_path()}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"entries": self._entries}, f)
+        os.replace(tmp_file, self._index_path())
+
+    # ---------- Entry bookkeeping ----------
+
+    def _entry_key(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.cache_dir)
+
+    @staticmethod
+    def _measure(path: str) -> int:
+        """Return the size of a file, or the total size of files below a directory."""
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except FileNotFoundError:
+                    pass
+        return total
+
+    def _iter_entry_paths(self):
+        """Yield the paths of all cache entries currently on disk."""
+        with os.scandir(self.cache_dir) as top:
+            for item in top:
+                if item.name.startswith(".") or item.name.endswith(".tmp"):
+                    continue
+                if item.is_dir():
+                    with os.scandir(item.path) as children:
+                        for child in children:
+                            if not child.name.endswith(".tmp"):
+                                yield child.path
+                else:
+                    yield item.path
+
+    def scan(self):
+        """Reconcile the metadata with the directory contents."""
+        with self.lock:
+            seen = {}
+            for path in self._iter_entry_paths():
+                key = self._entry_key(path)
+                entry = self._entries.get(key) or {"last_access": os.path.getmtime(path), "accesses": 0}
+                entry["size"] = self._measure(path)
+                seen[key] = entry
+            self._entries = seen
+
+    def total_bytes(self) -> int:
+        with self.lock:
+            return sum(entry["size"] for entry in self._entries.values())
+
+    def record_hit(self):
+        """Count a request answered from the cache."""
+        with self.lock:
+            self.counters["hits"] += 1
+
+    def record_miss(self):
+        """Count a request that had to go upstream."""
+        with self.lock:
+            self.counters["misses"] += 1
+
+    def record_access(self, path: str):
+        """Update the recency and frequency of an entry that was read."""
+        with self.lock:
+            entry = self._entries.get(self._entry_key(path))
+            if entry is not None:
+                entry["last_access"] = time.time()
+                entry["accesses"] += 1
+
+    def record_write(self, path: str):
+        """Re-measure an entry that was written and enforce the budget."""
+        with self.lock:
+            key = self._entry_key(path)
+            entry = self._entries.setdefault(key, {"accesses": 0})
+            entry["size"] = self._measure(path)
+            entry["last_access"] = time.time()
+            entry["accesses"] += 1
+            self.enforce_budget(protect=key)
+
+    # ---------- Eviction ----------
+
+    def _eviction_order(self):
+        if self.policy == "lfu":
+            return sorted(self._entries, key=lambda k: (self._entries[k]["accesses"], self._entries[k]["last_access"]))
+        return sorted(self._entries, key=lambda k: self._entries[k]["last_access"])
+
+    def _evict(self, key: str):
+        path = os.path.join(self.cache_dir, key)
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            self.logger.log_error(f"Failed to evict cache entry {path}: {e}")
+            return
+        entry = self._entries.pop(key)
+        self.counters["evictions"] += 1
+        self.counters["evicted_bytes"] += entry["size"]
+        self.logger.log_info(f"Evicted cache entry {key} ({entry['size']} bytes, policy={self.policy}).")
+
+    def enforce_budget(self, protect: Optional[str] = None):
+        """
+        Evict entries until the directory fits the budget.
+
+        Args:
+            protect (Optional[str]): Entry key that must not be evicted (e.g. the one just written).
+        """
+        with self.lock:
+            total = self.total_bytes()
+            if total <= self.max_bytes:
+                return
+            target = self.max_bytes * self.low_watermark
+            for key in self._eviction_order():
+                if total <= target:
+                    break
+                if key == protect:
+                    continue
+                size = self._entries[key]["size"]
+                self._evict(key)
+                if key not in self._entries:
+                    total -= size
+            self._save_index()
+
+    # ---------- Background sweeper ----------
+
+    def sweep(self):
+        """Rescan the directory, enforce the budget and persist the metadata."""
+        with self.lock:
+            self.scan()
+            self.enforce_budget()
+            self._save_index()
+
+    def _sweep_loop(self):
+        while not self._stop_event.wait(self.sweep_interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                self.logger.log_error(f"Cache sweep failed: {e}")
+
+    def start_sweeper(self):
+        """Start the background sweeper thread."""
+        if self._sweeper is None or not self._sweeper.is_alive():
+            self._stop_event.clear()
+            self._sweeper = threading.Thread(target=self._sweep_loop, name="CacheSweeper", daemon=True)
+            self._sweeper.start()
+
+    def stop_sweeper(self):
+        """Stop the background sweeper thread."""
+        self._stop_event.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+
+    def get_stats(self) -> dict:
+        """Return hit/miss/eviction counters and the current footprint."""
+        with self.lock:
+            requests = self.counters["hits"] + self.counters["misses"]
+            return {
+                **self.counters,
+                "hit_ratio": round(self.counters["hits"] / requests, 4) if requests else None,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes(),
+                "max_bytes": self.max_bytes,
+                "policy": self.policy,
+            }
+
+
+_managers: Dict[str, CacheManager] = {}
+_managers_lock = threading.Lock()
+_manager_settings = {}
+
+
+def configure_cache_managers(max_bytes: int = 1024 ** 3, policy: str = "lru", sweep_interval: float = 300):
+    """Set the settings used for cache managers created by ``get_cache_manager``."""
+    if policy not in CacheManager.POLICIES:
+        raise ValueError(f"Unknown eviction policy '{policy}'. Expected one of {CacheManager.POLICIES}.")
+    with _managers_lock:
+        _manager_settings.update(max_bytes=max_bytes, policy=policy, sweep_interval=sweep_interval)
+        for manager in _managers.values():
+            manager.max_bytes, manager.policy = max_bytes, policy
+
+
+def get_cache_manager(cache_dir: str) -> CacheManager:
+    """Return the process-wide manager for a cache directory, creating it on first use."""
+    key = os.path.abspath(cache_dir)
+    with _managers_lock:
+        if key not in _managers:
+            _managers[key] = CacheManager(cache_dir, **_manager_settings)
+        return _managers[key]
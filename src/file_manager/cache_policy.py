@@ -0,0 +1,143 @@
+import time
+import threading
+from datetime import datetime, timedelta, time as dt_time
+from typing import Optional
+from zoneinfo import ZoneInfo
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar, GoodFriday, Holiday, USLaborDay, USMartinLutherKingJr, USMemorialDay,
+    USPresidentsDay, USThanksgivingDay, nearest_workday, sunday_to_monday,
+)
+
+
+class ExchangeHolidayCalendar(AbstractHolidayCalendar):
+    """Full-day NYSE holidays."""
+
+    rules = [
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-06-19", observance=nearest_workday),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas Day", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+class FreshnessPolicy:
+    """
+    Decides how long cached price data stays valid.
+
+    - Bars from closed sessions never change, so ranges ending before the current session
+      are immutable and cached indefinitely.
+    - Ranges touching the current session (or the future) get a short TTL, so the partial
+      bar of a live session is refreshed.
+    - Intraday bars expire on the next bar boundary, when a new bar becomes available.
+
+    A session counts as closed ``settle_minutes`` after the exchange close; weekends and
+    exchange holidays have no session.
+    """
+
+    INTERVAL_SECONDS = {"1m": 60, "2m": 120, "5m": 300, "15m": 900, "30m": 1800, "60m": 3600, "1h": 3600, "90m": 5400}
+
+    def __init__(
+        self,
+        live_ttl: float = 60,
+        market_timezone: str = "America/New_York",
+        market_close: dt_time = dt_time(16, 0),
+        settle_minutes: int = 30,
+    ):
+        """
+        Initialize the FreshnessPolicy instance.
+
+        Args:
+            live_ttl (float): Seconds data touching the current session stays valid.
+            market_timezone (str): Exchange timezone.
+            market_close (datetime.time): Exchange close in exchange time.
+            settle_minutes (int): Minutes after the close until the day's bar is final.
+        """
+        self.live_ttl = live_ttl
+        self.market_timezone = ZoneInfo(market_timezone)
+        self.market_close = market_close
+        self.settle_minutes = settle_minutes
+
+    def session_cutoff(self, now: Optional[float] = None) -> str:
+        """
+        Return the first date whose daily bar may still change.
+
+        Args:
+            now (Optional[float]): Unix timestamp to evaluate at (defaults to the current time).
+
+        Returns:
+            str: Date in YYYY-MM-DD format; every earlier date is final.
+        """
+        local_now = datetime.fromtimestamp(time.time() if now is None else now, self.market_timezone)
+        settled = datetime.combine(local_now.date(), self.market_close, self.market_timezone) + timedelta(
+            minutes=self.settle_minutes
+        )
+        if local_now.weekday() >= 5 or local_now >= settled:
+            return (local_now.date() + timedelta(days=1)).strftime("%Y-%m-%d")
+        return local_now.strftime("%Y-%m-%d")
+
+    @staticmethod
+    def has_sessions(start_date: str, end_date: str) -> bool:
+        """
+        Return True if the exchange trades on any day of ``[start_date, end_date)``.
+
+        Args:
+            start_date (str): Start date in YYYY-MM-DD format (inclusive).
+            end_date (str): End date in YYYY-MM-DD format (exclusive).
+        """
+        days = pd.bdate_range(start_date, end_date, inclusive="left")
+        if days.empty:
+            return False
+        holidays = ExchangeHolidayCalendar().holidays(days[0], days[-1])
+        return len(days.difference(holidays)) > 0
+
+    def expires_at(self, end_date: str, fetched_at: Optional[float] = None, interval: str = "1d") -> Optional[float]:
+        """
+        Return when data for a range fetched at ``fetched_at`` stops being valid.
+
+        Args:
+            end_date (str): Exclusive end date of the range in YYYY-MM-DD format.
+            fetched_at (Optional[float]): Unix timestamp of the fetch (defaults to now).
+            interval (str): Bar interval, e.g. "1d" or "5m".
+
+        Returns:
+            Optional[float]: Unix timestamp of expiry, or None if the data is immutable.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        if end_date <= self.session_cutoff(fetched_at):
+            return None
+        bar_seconds = self.INTERVAL_SECONDS.get(interval)
+        if bar_seconds:
+            return (int(fetched_at) // bar_seconds + 1) * bar_seconds
+        return fetched_at + self.live_ttl
+
+    def is_fresh(self, expires_at: Optional[float], now: Optional[float] = None) -> bool:
+        """Return True if data with the given expiry is still valid."""
+        return expires_at is None or (time.time() if now is None else now) < expires_at
+
+
+_default_policy = None
+_default_lock = threading.Lock()
+
+
+def configure_freshness_policy(live_ttl: float = 60, settle_minutes: int = 30) -> FreshnessPolicy:
+    """Replace the policy used by caches that are not given one explicitly."""
+    global _default_policy
+    with _default_lock:
+        _default_policy = FreshnessPolicy(live_ttl=live_ttl, settle_minutes=settle_minutes)
+        return _default_policy
+
+
+def get_freshness_policy() -> FreshnessPolicy:
+    """Return the process-wide freshness policy."""
+    global _default_policy
+    with _default_lock:
+        if _default_policy is None:
+            _default_policy = FreshnessPolicy()
+        return _default_policy
@@ -1,81 +1,68 @@
 import os
 import sys
-from datetime import datetime, timedelta
-import pickle
 from typing import Union
 import pandas as pd
 
 # Add the `src` directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
-from file_manager.fileManager import FileManager
 from logs.logger import Logger
+from file_manager.cache_manager import get_cache_manager
+from file_manager.price_store import get_price_store
 
 class CacheData:
-    """Handles cached stock data retrieval."""
+    """
+    Handles cached stock data retrieval.
 
-    CACHE_EXPIRATION_TIME = timedelta(hours=24)  # Cache expiration time (24 hours by default)
+    Reads and writes go through the same price store as DataFetcher (memory tier in
+    front of the columnar files), so both share one cache, one expiry policy and one set
+    of hit/miss statistics. Old ``{ticker}_{start}_{end}.pkl`` files in ``cache_dir`` are
+    folded into the store on first access.
+    """
 
-    def __init__(self, ticker: str, start_date: str, end_date: str, cache_dir: str = "data/sys_file/cache_dir", cache_expiration: timedelta = None):
+    def __init__(self, ticker: str, start_date: str, end_date: str, cache_dir: str = "data/sys_file/cache_dir"):
         self.ticker = ticker
         self.start_date = start_date
         self.end_date = end_date
         self.cache_dir = cache_dir
-        self.cache_expiration = cache_expiration if cache_expiration else self.CACHE_EXPIRATION_TIME
-        self.file_manager = FileManager()
         self.logger = Logger("CacheData")
 
         # Ensure the cache directory exists
         self.ensure_directories_exist()
+        self.cache_manager = get_cache_manager(self.cache_dir)
+        self.price_store = get_price_store(
+            os.path.join(self.cache_dir, "store", ""),
+            legacy_dir=self.cache_dir,
+            cache_manager=self.cache_manager,
+        )
 
     def ensure_directories_exist(self):
         """Ensure the cache directory exists. Create it if necessary."""
         try:
-            self.file_manager.ensure_directory_exists(self.cache_dir)
+            os.makedirs(self.cache_dir, exist_ok=True)
             self.logger.log_info(f"Cache directory ensured: {self.cache_dir}")
         except Exception as e:
             self.logger.log_error(f"Error ensuring cache directory exists: {e}")
             raise
 
-    def _get_cache_filename(self) -> str:
-        """Generate a unique cache filename based on the ticker and dates."""
-        filename = f"{self.ticker}_{self.start_date}_{self.end_date}.pkl"
-        return os.path.join(self.cache_dir, filename)
-
     def _load_cache(self) -> Union[pd.DataFrame, None]:
-        """Load cached data from the file, considering expiration time."""
-        cache_filename = self._get_cache_filename()
-        if self.file_manager.read_file(cache_filename):
-            try:
-                with open(cache_filename, "rb") as f:
-                    cache_data = pickle.load(f)
-                    cache_timestamp = cache_data.get('timestamp')
-                    if cache_timestamp and datetime.now() - cache_timestamp < self.cache_expiration:
-                        if cache_data['data'].empty:
-                            self.logger.log_warning(f"Cache for {cache_filename} is empty. Fetching new data.")
-                            self.file_manager.delete_file(cache_filename)
-                            return None
-                        self.logger.log_info(f"Cache hit for {cache_filename}. Data is valid.")
-                        return cache_data['data']
-                    else:
-                        self.logger.log_info(f"Cache expired for {cache_filename}. Fetching new data.")
-                        self.file_manager.delete_file(cache_filename)  # Remove expired cache
-            except (pickle.UnpicklingError, EOFError) as pickling_error:
-                self.logger.log_error(f"Error loading cache file {cache_filename}: {pickling_error}")
-            except Exception as e:
-                self.logger.log_error(f"Unexpected error loading cache: {e}")
-        self.logger.log_info(f"No valid cache found for {cache_filename}. Fetching new data.")
+        """Load cached data for the range if it is fully covered and fresh."""
+        try:
+            if not self.price_store.missing_ranges(self.ticker, self.start_date, self.end_date):
+                data = self.price_store.load_range(self.ticker, self.start_date, self.end_date)
+                if not data.empty:
+                    self.logger.log_info(f"Cache hit for {self.ticker} {self.start_date} to {self.end_date}.")
+                    self.cache_manager.record_hit()
+                    return data
+        except Exception as e:
+            self.logger.log_error(f"Unexpected error loading cache: {e}")
+        self.logger.log_info(f"No valid cache found for {self.ticker} {self.start_date} to {self.end_date}. Fetching new data.")
+        self.cache_manager.record_miss()
         return None
 
     def _save_cache(self, data: pd.DataFrame) -> None:
-        """Save data to cache with a timestamp."""
-        cache_filename = self._get_cache_filename()
-        cache_data = {
-            'data': data,
-            'timestamp': datetime.now()
-        }
+        """Merge fetched data for the range into the price store."""
         try:
-            with open(cache_filename, "wb") as f:
-                pickle.dump(cache_data, f)
-            self.logger.log_info(f"Data cached for {cache_filename}.")
+            self.price_store.merge(self.ticker, data, self.start_date, self.end_date)
+            self.logger.log_info(f"Data cached for {self.ticker} {self.start_date} to {self.end_date}.")
         except Exception as e:
-            self.logger.log_error(f"Error saving cache file {cache_filename}: {e}")
+            self.logger.log_error(f"Error saving cache for {self.ticker}: {e}")
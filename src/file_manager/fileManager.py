@@ -2,11 +2,11 @@ import json
 import os
 import sys
 from pathlib import Path
-import yfinance as yf  # Required for fetching stock data
 
 # Add the `src` directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 from logs.logger import Logger
+from portfolio_manager.quote_service import get_quote_service
 
 
 class FileManager:
@@ -106,6 +106,11 @@ class FileManager:
                 self.logger.log_error(f"Invalid portfolio data format in {portfolio_path}.")
                 return
 
+            # Fetch one quote snapshot per distinct ticker across all users
+            quotes = get_quote_service().get_many(
+                [stock.get("ticker") for stocks in portfolio_data.values() for stock in stocks if stock.get("ticker")]
+            )
+
             # Generate report content
             report_content = []
             for user_email, stocks in portfolio_data.items():
@@ -117,9 +122,9 @@ class FileManager:
                     shares = stock.get("shares", 0)
                     purchase_price = stock.get("purchase_price", 0.0)
 
-                    stock_data = yf.Ticker(ticker)
-                    current_price = stock_data.info.get("regularMarketPrice", 0)
-                    dividend_yield = (stock_data.info.get("dividendYield", 0) or 0) * 100
+                    info = quotes.get(ticker, {})
+                    current_price = info.get("regularMarketPrice", 0)
+                    dividend_yield = (info.get("dividendYield", 0) or 0) * 100
 
                     stock_return = (current_price - purchase_price) * shares
                     dividend_income = (dividend_yield / 100) * current_price * shares
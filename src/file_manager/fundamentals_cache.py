@@ -0,0 +1,116 @@
+import os
+import sys
+import json
+import time
+import threading
+from typing import Dict, Optional
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+from file_manager.cache_manager import get_cache_manager
+
+
+class FundamentalsCache:
+    """
+    Persistent cache of financial ratios, one JSON file per ticker.
+
+    Entries expire after ``ttl`` seconds. Loaded entries are also kept in memory, so a
+    hot lookup costs a dict access; files live below the managed cache directory and
+    count against its byte budget.
+    """
+
+    def __init__(self, cache_dir: str = "data/sys_file/cache_dir/", ttl: float = 24 * 3600):
+        """
+        Initialize the FundamentalsCache instance.
+
+        Args:
+            cache_dir (str): Managed cache directory; entries go to its ``fundamentals`` subdirectory.
+            ttl (float): Seconds an entry stays valid.
+        """
+        self.cache_manager = get_cache_manager(cache_dir)
+        self.store_dir = os.path.join(cache_dir, "fundamentals")
+        self.ttl = ttl
+        self.logger = Logger("FundamentalsCache")
+        self.lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    def _path(self, ticker: str) -> str:
+        return os.path.join(self.store_dir, f"{ticker}.json")
+
+    def _entry(self, ticker: str) -> Optional[dict]:
+        """Return the entry for a ticker from memory or disk, fresh or not."""
+        with self.lock:
+            entry = self._entries.get(ticker)
+        if entry is not None:
+            return entry
+        try:
+            with open(self._path(ticker), "r") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.log_warning(f"Ignoring unreadable fundamentals cache for {ticker}: {e}")
+            return None
+        with self.lock:
+            self._entries[ticker] = entry
+        return entry
+
+    def get(self, ticker: str) -> Optional[dict]:
+        """
+        Return the cached ratios for a ticker.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+
+        Returns:
+            Optional[dict]: The ratios, or None if missing or expired.
+        """
+        entry = self._entry(ticker)
+        if entry is None or time.time() - entry["fetched_at"] >= self.ttl:
+            self.cache_manager.record_miss()
+            return None
+        self.cache_manager.record_hit()
+        self.cache_manager.record_access(self._path(ticker))
+        return dict(entry["ratios"])
+
+    def is_cached(self, ticker: str) -> bool:
+        """Return True if fresh ratios are cached for a ticker (without touching the counters)."""
+        entry = self._entry(ticker)
+        return entry is not None and time.time() - entry["fetched_at"] < self.ttl
+
+    def put(self, ticker: str, ratios: dict) -> None:
+        """Cache the ratios for a ticker."""
+        entry = {"fetched_at": time.time(), "ratios": ratios}
+        tmp_file = f"{self._path(ticker)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_file, self._path(ticker))
+            self.cache_manager.record_write(self._path(ticker))
+        except OSError as e:
+            self.logger.log_error(f"Error saving fundamentals cache for {ticker}: {e}")
+        with self.lock:
+            self._entries[ticker] = entry
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def configure_fundamentals_cache(cache_dir: str = "data/sys_file/cache_dir/", ttl: float = 24 * 3600) -> FundamentalsCache:
+    """Replace the process-wide fundamentals cache."""
+    global _default_cache
+    with _default_lock:
+        _default_cache = FundamentalsCache(cache_dir=cache_dir, ttl=ttl)
+        return _default_cache
+
+
+def get_fundamentals_cache() -> FundamentalsCache:
+    """Return the process-wide fundamentals cache."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = FundamentalsCache()
+        return _default_cache
@@ -0,0 +1,77 @@
+import os
+import sys
+import json
+import threading
+from typing import Dict, Optional
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+from file_manager.cache_manager import get_cache_manager
+
+
+class IndicatorStateCache:
+    """
+    Persistent snapshots of streaming indicator state, one JSON file per key.
+
+    Snapshots are kept in memory as well, so restoring a hot series costs a dict access;
+    files live below the managed cache directory and count against its byte budget.
+    """
+
+    def __init__(self, cache_dir: str = "data/sys_file/cache_dir/"):
+        """
+        Initialize the IndicatorStateCache instance.
+
+        Args:
+            cache_dir (str): Managed cache directory; snapshots go to its ``indicator_state`` subdirectory.
+        """
+        self.cache_manager = get_cache_manager(cache_dir)
+        self.store_dir = os.path.join(cache_dir, "indicator_state")
+        self.logger = Logger("IndicatorStateCache")
+        self.lock = threading.Lock()
+        self._states: Dict[str, dict] = {}
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.store_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the snapshot stored under a key, or None."""
+        with self.lock:
+            state = self._states.get(key)
+        if state is not None:
+            return state
+        try:
+            with open(self._path(key), "r") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.log_warning(f"Ignoring unreadable indicator state for {key}: {e}")
+            return None
+        self.cache_manager.record_access(self._path(key))
+        with self.lock:
+            self._states[key] = state
+        return state
+
+    def put(self, key: str, state: dict) -> None:
+        """Store a snapshot under a key."""
+        with self.lock:
+            self._states[key] = state
+        tmp_file = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_file, self._path(key))
+            self.cache_manager.record_write(self._path(key))
+        except OSError as e:
+            self.logger.log_error(f"Error saving indicator state for {key}: {e}")
+
+    def invalidate(self, key: str) -> None:
+        """Drop the snapshot stored under a key."""
+        with self.lock:
+            self._states.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,207 @@
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+from file_manager.cache_manager import CacheManager
+from file_manager.cache_policy import FreshnessPolicy, get_freshness_policy
+
+
+class IntradayStore:
+    """
+    Append-only store of intraday bars, one segment per ticker, interval and trading day.
+
+    A segment (``{ticker}/{interval}/{YYYY-MM-DD}.bin``) is a flat file of fixed-width
+    records (bar start as int64 nanoseconds in exchange-local time, then OHLCV as
+    float64). Only completed bars are stored, so a segment is never rewritten: polling
+    fetches the bars after the last stored one and appends them. Once a day is final
+    under the freshness policy, an empty ``{YYYY-MM-DD}.done`` marker records that the
+    segment is complete and the day is never fetched again.
+    """
+
+    COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+    RECORD_DTYPE = np.dtype([("timestamp", "<i8")] + [(column, "<f8") for column in COLUMNS])
+
+    def __init__(self, store_dir: str = "data/sys_file/cache_dir/intraday/",
+                 cache_manager: Optional[CacheManager] = None, freshness_policy: Optional[FreshnessPolicy] = None):
+        """
+        Initialize the IntradayStore instance.
+
+        Args:
+            store_dir (str): Directory holding one directory per ticker.
+            cache_manager (Optional[CacheManager]): Manager enforcing the cache directory's
+                byte budget; reads and writes are reported to it and it shares its lock.
+            freshness_policy (Optional[FreshnessPolicy]): Decides when a day is final
+                (defaults to the process-wide policy).
+        """
+        self.store_dir = store_dir
+        self.cache_manager = cache_manager
+        self.freshness_policy = freshness_policy or get_freshness_policy()
+        self.logger = Logger("IntradayStore")
+        self._lock = cache_manager.lock if cache_manager else threading.RLock()
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    def _bar_delta(self, interval: str) -> pd.Timedelta:
+        seconds = self.freshness_policy.INTERVAL_SECONDS.get(interval)
+        if seconds is None:
+            raise ValueError(f"Unsupported intraday interval '{interval}'.")
+        return pd.Timedelta(seconds=seconds)
+
+    def _local_now(self, now: Optional[float] = None) -> pd.Timestamp:
+        """Return the current exchange-local wall-clock time as a naive timestamp."""
+        local = datetime.fromtimestamp(time.time() if now is None else now, self.freshness_policy.market_timezone)
+        return pd.Timestamp(local.replace(tzinfo=None))
+
+    def _segment_path(self, ticker: str, interval: str, day: str, suffix: str = ".bin") -> str:
+        return os.path.join(self.store_dir, ticker, interval, f"{day}{suffix}")
+
+    @staticmethod
+    def _trading_days(start_date: str, end_date: str) -> List[str]:
+        days = pd.date_range(start_date, end_date, inclusive="left")
+        return [day.strftime("%Y-%m-%d") for day in days if day.weekday() < 5]
+
+    def _read_segment(self, ticker: str, interval: str, day: str) -> np.ndarray:
+        """Read a segment's records, ignoring a trailing partial record from an interrupted append."""
+        path = self._segment_path(ticker, interval, day)
+        if not os.path.isfile(path):
+            return np.empty(0, dtype=self.RECORD_DTYPE)
+        count = os.path.getsize(path) // self.RECORD_DTYPE.itemsize
+        return np.fromfile(path, dtype=self.RECORD_DTYPE, count=count)
+
+    def last_timestamp(self, ticker: str, interval: str, day: str) -> Optional[pd.Timestamp]:
+        """Return the start of the last stored bar of a day, reading only that record."""
+        path = self._segment_path(ticker, interval, day)
+        if not os.path.isfile(path):
+            return None
+        count = os.path.getsize(path) // self.RECORD_DTYPE.itemsize
+        if not count:
+            return None
+        with open(path, "rb") as f:
+            f.seek((count - 1) * self.RECORD_DTYPE.itemsize)
+            record = np.frombuffer(f.read(self.RECORD_DTYPE.itemsize), dtype=self.RECORD_DTYPE)
+        return pd.Timestamp(int(record["timestamp"][0]))
+
+    def missing_ranges(self, ticker: str, interval: str, start_date: str, end_date: str,
+                       now: Optional[float] = None) -> List[Tuple[pd.Timestamp, str]]:
+        """
+        Compute where fetching has to resume for a ticker's bars in a date range.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            interval (str): Bar interval, e.g. "5m".
+            start_date (str): Start date in YYYY-MM-DD format (inclusive).
+            end_date (str): End date in YYYY-MM-DD format (exclusive).
+            now (Optional[float]): Unix timestamp to evaluate at (defaults to the current time).
+
+        Returns:
+            List[Tuple[pd.Timestamp, str]]: ``[(resume_at, end_date)]`` with the exchange-local
+            start of the first bar not yet stored, or an empty list if no new bar can have
+            completed since the last poll.
+        """
+        bar = self._bar_delta(interval)
+        local_now = self._local_now(now)
+        with self._lock:
+            for day in self._trading_days(start_date, end_date):
+                if pd.Timestamp(day) > local_now:
+                    break
+                if os.path.isfile(self._segment_path(ticker, interval, day, ".done")):
+                    continue
+                last = self.last_timestamp(ticker, interval, day)
+                resume_at = last + bar if last is not None else pd.Timestamp(day)
+                if resume_at + bar <= local_now:
+                    return [(resume_at, end_date)]
+        return []
+
+    def append(self, ticker: str, interval: str, data: Optional[pd.DataFrame], start, end_date: str,
+               fetched_at: Optional[float] = None) -> int:
+        """
+        Append the completed bars after each segment's last stored bar.
+
+        Days of the fetched range that are final under the freshness policy are marked
+        complete, including days without any bars.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            interval (str): Bar interval, e.g. "5m".
+            data (Optional[pd.DataFrame]): Bars returned by the provider.
+            start: Start of the fetched range (date string or exchange-local timestamp).
+            end_date (str): Exclusive end date of the fetched range.
+            fetched_at (Optional[float]): Unix timestamp of the fetch (defaults to now).
+
+        Returns:
+            int: Number of bars appended.
+        """
+        bar = self._bar_delta(interval)
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        local_now = self._local_now(fetched_at)
+        appended = 0
+        with self._lock:
+            if data is not None and not data.empty:
+                index = pd.DatetimeIndex(data.index)
+                if index.tz is not None:
+                    index = index.tz_localize(None)
+                bars = data.set_axis(index).sort_index()
+                bars = bars[~bars.index.duplicated(keep="last") & (bars.index + bar <= local_now)]
+                for day, rows in bars.groupby(bars.index.strftime("%Y-%m-%d")):
+                    last = self.last_timestamp(ticker, interval, day)
+                    if last is not None:
+                        rows = rows[rows.index > last]
+                    if rows.empty:
+                        continue
+                    records = np.empty(len(rows), dtype=self.RECORD_DTYPE)
+                    records["timestamp"] = np.asarray(rows.index, dtype="datetime64[ns]").astype(np.int64)
+                    for column in self.COLUMNS:
+                        records[column] = rows[column].to_numpy(dtype="f8") if column in rows else np.nan
+                    path = self._segment_path(ticker, interval, day)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with open(path, "ab") as f:
+                        f.write(records.tobytes())
+                    appended += len(records)
+
+            cutoff = self.freshness_policy.session_cutoff(fetched_at)
+            for day in self._trading_days(pd.Timestamp(start).strftime("%Y-%m-%d"), end_date):
+                if day >= cutoff:
+                    break
+                marker = self._segment_path(ticker, interval, day, ".done")
+                os.makedirs(os.path.dirname(marker), exist_ok=True)
+                open(marker, "a").close()
+
+            self.logger.log_info(f"Appended {appended} {interval} bars for {ticker}.")
+            if self.cache_manager:
+                self.cache_manager.record_write(os.path.join(self.store_dir, ticker))
+        return appended
+
+    def load_range(self, ticker: str, interval: str, start_date: str, end_date: str,
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load a ticker's stored bars for a date range.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            interval (str): Bar interval, e.g. "5m".
+            start_date (str): Start date in YYYY-MM-DD format (inclusive).
+            end_date (str): End date in YYYY-MM-DD format (exclusive).
+            columns (Optional[List[str]]): Columns to load, e.g. ``["Close"]`` (None for all).
+
+        Returns:
+            pd.DataFrame: Bars indexed by exchange-local ``Datetime`` (possibly empty).
+        """
+        with self._lock:
+            segments = [self._read_segment(ticker, interval, day) for day in self._trading_days(start_date, end_date)]
+            if self.cache_manager:
+                self.cache_manager.record_access(os.path.join(self.store_dir, ticker))
+        records = np.concatenate(segments) if segments else np.empty(0, dtype=self.RECORD_DTYPE)
+        if not len(records):
+            return pd.DataFrame()
+        wanted = [column for column in self.COLUMNS if columns is None or column in columns]
+        return pd.DataFrame(
+            {column: records[column] for column in wanted},
+            index=pd.DatetimeIndex(records["timestamp"].astype("datetime64[ns]"), name="Datetime"),
+        )
@@ -0,0 +1,99 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import pandas as pd
+
+
+class MemoryCache:
+    """
+    Byte-bounded in-process LRU cache.
+
+    DataFrames are sized with ``memory_usage(deep=True)``; other values may pass an explicit
+    size. Values larger than the whole budget are not cached. Values are shared between
+    callers, so they must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 ** 2):
+        """
+        Initialize the MemoryCache instance.
+
+        Args:
+            max_bytes (int): Byte budget for cached values (0 disables the cache).
+        """
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0}
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    @staticmethod
+    def sizeof(value: Any) -> int:
+        """Return the in-memory footprint of a DataFrame (or a dict/tuple of them)."""
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True, deep=True).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(index=True, deep=True))
+        if isinstance(value, dict):
+            return sum(MemoryCache.sizeof(item) for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return sum(MemoryCache.sizeof(item) for item in value)
+        return 64
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached value and mark it most recently used, or None on a miss."""
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> bool:
+        """
+        Cache a value, evicting least recently used entries to stay within the budget.
+
+        Returns:
+            bool: True if the value was cached.
+        """
+        size = self.sizeof(value) if size is None else size
+        with self.lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return False
+            while self._bytes + size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.counters["evictions"] += 1
+            self._entries[key] = (value, size)
+            self._bytes += size
+            return True
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a cached value."""
+        with self.lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self.lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> dict:
+        """Return hit/miss/eviction counters and the current footprint."""
+        with self.lock:
+            requests = self.counters["hits"] + self.counters["misses"]
+            return {
+                **self.counters,
+                "hit_ratio": round(self.counters["hits"] / requests, 4) if requests else None,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class NegativeCache:
+    """
+    Short-lived record of lookups known to return nothing.
+
+    Unknown tickers, date ranges without any rows and symbols without company information
+    are marked here so repeated requests are answered locally instead of spending an
+    upstream round-trip and a rate-limit token each time. Markers expire after ``ttl``
+    seconds, much sooner than positive cache entries, so newly listed symbols show up
+    quickly. Only definite empty answers are marked; errors are never cached. The number
+    of markers is bounded, dropping the oldest first.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 10000):
+        """
+        Initialize the NegativeCache instance.
+
+        Args:
+            ttl (float): Seconds a known-missing marker stays valid.
+            max_entries (int): Maximum number of markers kept.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.counters = {"hits": 0, "marked": 0}
+        self._markers = OrderedDict()
+
+    def mark_missing(self, key: Hashable) -> None:
+        """Record that a lookup returned nothing."""
+        with self.lock:
+            self._markers.pop(key, None)
+            self._markers[key] = time.time() + self.ttl
+            self.counters["marked"] += 1
+            while len(self._markers) > self.max_entries:
+                self._markers.popitem(last=False)
+
+    def is_known_missing(self, key: Hashable, now: Optional[float] = None) -> bool:
+        """Return True if the lookup is known to return nothing."""
+        now = time.time() if now is None else now
+        with self.lock:
+            expires_at = self._markers.get(key)
+            if expires_at is None:
+                return False
+            if now >= expires_at:
+                del self._markers[key]
+                return False
+            self.counters["hits"] += 1
+            return True
+
+    def forget(self, key: Hashable) -> None:
+        """Drop the marker for a lookup."""
+        with self.lock:
+            self._markers.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """Return hit/marker counters and the number of live markers."""
+        with self.lock:
+            return {**self.counters, "entries": len(self._markers), "ttl": self.ttl}
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def configure_negative_cache(ttl: float = 300, max_entries: int = 10000) -> NegativeCache:
+    """Replace the process-wide negative cache."""
+    global _default_cache
+    with _default_lock:
+        _default_cache = NegativeCache(ttl=ttl, max_entries=max_entries)
+        return _default_cache
+
+
+def get_negative_cache() -> NegativeCache:
+    """Return the process-wide negative cache."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = NegativeCache()
+        return _default_cache
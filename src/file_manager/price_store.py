@@ -0,0 +1,583 @@
+import os
+import re
+import sys
+import glob
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within one process
+    fcntl = None
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+from file_manager.cache_manager import CacheManager
+from file_manager.cache_policy import FreshnessPolicy, get_freshness_policy
+from file_manager.memory_cache import MemoryCache
+
+
+class PriceStore:
+    """
+    Per-ticker columnar store of daily OHLCV history.
+
+    Every ticker owns a directory holding its merged price frame together with the list
+    of date ranges that have already been fetched from the provider. Ranges are half-open
+    ``[start, end)`` in YYYY-MM-DD format, mirroring the ``start``/``end`` semantics of
+    ``yf.Ticker.history``. Requests for any sub-range of the covered spans are answered by
+    slicing; only the gaps have to be fetched upstream.
+
+    On disk each column (and the date index) is a raw ``.npy`` array described by a
+    versioned ``manifest.json``. Reads memory-map the arrays, binary-search the index and
+    copy only the requested rows of the requested columns. Writes go to a new generation
+    of uniquely named files, each written to a temporary file and renamed into place, and
+    are published last by atomically replacing the manifest, so readers never see a
+    partially written frame. Merges hold an exclusive per-ticker file lock, so processes
+    sharing the store directory neither lose each other's rows nor delete files of a
+    generation another process just published.
+
+    Coverage is split by the freshness policy: ``ranges`` before the current session are
+    final and never refetched, while ``live_ranges`` (the current session and later) carry
+    an expiry timestamp and count as covered only until it passes.
+
+    Manifests and full frames are also kept in a byte-bounded in-process LRU in front of
+    the files, so repeated reads of popular tickers are served without touching disk.
+    Writes go to disk first and drop the ticker from memory.
+
+    Frames are compacted before they are written: corporate-action columns (dividends,
+    splits), which are zero on almost every row, move to a sparse table of events in the
+    manifest and are expanded again on load; volumes are stored as unsigned integers and,
+    optionally, prices as float32.
+    """
+
+    SCHEMA_VERSION = 1
+    MANIFEST_FILE = "manifest.json"
+    LOCK_FILE = ".lock"
+    SPARSE_COLUMNS = ("Dividends", "Stock Splits", "Capital Gains")
+    PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close")
+    VOLUME_COLUMNS = ("Volume",)
+    LEGACY_FILE_PATTERN = re.compile(r"^(?P<ticker>.+)_(?P<start>\d{4}-\d{2}-\d{2})_(?P<end>\d{4}-\d{2}-\d{2})\.pkl$")
+
+    def __init__(self, store_dir: str = "data/sys_file/cache_dir/store/", legacy_dir: str = None,
+                 cache_manager: Optional[CacheManager] = None, freshness_policy: Optional[FreshnessPolicy] = None,
+                 memory_cache: Optional[MemoryCache] = None, float32_prices: bool = False):
+        """
+        Initialize the PriceStore instance.
+
+        Args:
+            store_dir (str): Directory holding one store directory per ticker.
+            legacy_dir (str): Directory with old ``{ticker}_{start}_{end}.pkl`` cache files
+                to fold into the store on first access (optional).
+            cache_manager (Optional[CacheManager]): Manager enforcing the cache directory's
+                byte budget; reads and writes are reported to it and it shares its lock, so
+                a ticker is never evicted while being read or written.
+            freshness_policy (Optional[FreshnessPolicy]): Decides which fetched ranges are
+                final and when live ones expire (defaults to the process-wide policy).
+            memory_cache (Optional[MemoryCache]): In-memory tier for loaded tickers
+                (defaults to a private 256 MiB cache; a zero budget reads straight from disk).
+            float32_prices (bool): Store OHLC prices as float32 (about 7 significant digits).
+        """
+        self.store_dir = store_dir
+        self.legacy_dir = legacy_dir
+        self.cache_manager = cache_manager
+        self.freshness_policy = freshness_policy or get_freshness_policy()
+        self.memory_cache = memory_cache if memory_cache is not None else MemoryCache()
+        self.float32_prices = float32_prices
+        self.logger = Logger("PriceStore")
+        self._lock = cache_manager.lock if cache_manager else threading.RLock()
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    def _get_ticker_dir(self, ticker: str) -> str:
+        """Return the store directory for a ticker."""
+        return os.path.join(self.store_dir, ticker)
+
+    @contextmanager
+    def _ticker_lock(self, ticker: str):
+        """Hold the exclusive cross-process lock on a ticker's store directory."""
+        ticker_dir = self._get_ticker_dir(ticker)
+        os.makedirs(ticker_dir, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(ticker_dir, self.LOCK_FILE), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _read_manifest(self, ticker: str) -> Optional[dict]:
+        """Read a ticker's manifest, importing older cache formats on first access."""
+        manifest_file = os.path.join(self._get_ticker_dir(ticker), self.MANIFEST_FILE)
+        if not os.path.isfile(manifest_file):
+            entry = self._empty_entry()
+            imported = self._import_pickled_store(ticker, entry)
+            if self.legacy_dir:
+                imported = self._import_legacy_files(ticker, entry) or imported
+            if imported:
+                self._save_entry(ticker, entry)
+                return self._read_manifest(ticker)
+            return None
+        try:
+            with open(manifest_file, "r") as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.log_error(f"Error reading store manifest {manifest_file}: {e}")
+            return None
+        if manifest.get("schema_version") != self.SCHEMA_VERSION:
+            self.logger.log_warning(
+                f"Ignoring {ticker} store with schema version {manifest.get('schema_version')}."
+            )
+            return None
+        return manifest
+
+    def _read_frame(self, ticker: str, manifest: dict, start_date: str = None, end_date: str = None,
+                    columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Materialize rows of a stored frame from its memory-mapped column files.
+
+        Only the dense columns are read; see ``_expand_sparse`` for corporate actions.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            manifest (dict): The ticker's manifest.
+            start_date (str): First date to include (None for the beginning).
+            end_date (str): Date to stop before (None for the end).
+            columns (Optional[List[str]]): Columns to load (None for all).
+
+        Returns:
+            pd.DataFrame: Date-indexed rows (possibly empty).
+        """
+        if not manifest["rows"]:
+            return pd.DataFrame()
+        ticker_dir = self._get_ticker_dir(ticker)
+        index = np.load(os.path.join(ticker_dir, manifest["index_file"]), mmap_mode="r")
+        first = 0 if start_date is None else int(np.searchsorted(index, np.datetime64(start_date, "ns"), "left"))
+        last = len(index) if end_date is None else int(np.searchsorted(index, np.datetime64(end_date, "ns"), "left"))
+
+        wanted = manifest["columns"] if columns is None else [
+            column for column in manifest["columns"] if column["name"] in columns
+        ]
+        values = {
+            column["name"]: np.load(os.path.join(ticker_dir, column["file"]), mmap_mode="r")[first:last]
+            for column in wanted
+        }
+        return pd.DataFrame(
+            values,
+            index=pd.DatetimeIndex(np.asarray(index[first:last]), name=manifest["index_name"]),
+            columns=[column["name"] for column in wanted],
+        )
+
+    @staticmethod
+    def _expand_sparse(data: pd.DataFrame, manifest: dict, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Add the manifest's sparse columns (zero except on event dates) to a frame in place."""
+        for name, sparse in manifest.get("sparse_columns", {}).items():
+            if columns is not None and name not in columns:
+                continue
+            values = np.zeros(len(data), dtype=sparse["dtype"])
+            if sparse["events"] and len(data):
+                positions = data.index.get_indexer(pd.DatetimeIndex([date for date, _ in sparse["events"]]))
+                found = positions >= 0
+                values[positions[found]] = np.asarray([value for _, value in sparse["events"]])[found]
+            data[name] = values
+        return data
+
+    def _compact(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Downcast price and volume columns to their compact on-disk dtypes."""
+        data = data.copy()
+        for name in data.columns:
+            values = data[name]
+            if name in self.PRICE_COLUMNS and self.float32_prices and values.dtype == np.float64:
+                data[name] = values.astype(np.float32)
+            elif name in self.VOLUME_COLUMNS and len(values) and pd.api.types.is_numeric_dtype(values):
+                if values.isna().any() or (values < 0).any() or (values % 1 != 0).any():
+                    continue
+                fits_uint32 = values.max() <= np.iinfo(np.uint32).max
+                data[name] = values.astype(np.uint32 if fits_uint32 else np.uint64)
+        return data
+
+    @staticmethod
+    def _empty_entry() -> dict:
+        return {"data": pd.DataFrame(), "ranges": [], "live_ranges": []}
+
+    def _load_entry(self, ticker: str) -> dict:
+        """Load the full stored frame and covered ranges for a ticker."""
+        manifest = self._read_manifest(ticker)
+        if manifest is None:
+            return self._empty_entry()
+        try:
+            return {
+                "data": self._expand_sparse(self._read_frame(ticker, manifest), manifest),
+                "ranges": manifest["ranges"],
+                "live_ranges": manifest.get("live_ranges", []),
+            }
+        except Exception as e:
+            self.logger.log_error(f"Error loading {ticker} store: {e}")
+            return self._empty_entry()
+
+    def _load_cached(self, ticker: str) -> Optional[dict]:
+        """Return a ticker's manifest and full frame, from the memory tier when possible."""
+        cached = self.memory_cache.get(ticker)
+        if cached is not None:
+            return cached
+        manifest = self._read_manifest(ticker)
+        if manifest is None:
+            return None
+        cached = {"manifest": manifest, "data": self._read_frame(ticker, manifest)}
+        self.memory_cache.put(ticker, cached)
+        return cached
+
+    def _write_manifest(self, ticker: str, manifest: dict) -> None:
+        """Publish a manifest atomically."""
+        manifest_file = os.path.join(self._get_ticker_dir(ticker), self.MANIFEST_FILE)
+        tmp_file = f"{manifest_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(manifest, f, indent=4)
+        os.replace(tmp_file, manifest_file)
+
+    @staticmethod
+    def _write_array(path: str, values: np.ndarray) -> None:
+        """Write an array to a temporary file and rename it into place."""
+        tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, "wb") as f:
+            np.save(f, values, allow_pickle=False)
+        os.replace(tmp_file, path)
+
+    def _save_entry(self, ticker: str, entry: dict, previous: Optional[dict] = None) -> None:
+        """
+        Write a store entry as a new generation of column files and publish its manifest.
+
+        File names carry a random tag next to the generation number, so writers never
+        share a file even if they start from the same manifest.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            entry (dict): Frame and covered ranges to store.
+            previous (Optional[dict]): Manifest being replaced; its files are removed afterwards.
+        """
+        ticker_dir = self._get_ticker_dir(ticker)
+        os.makedirs(ticker_dir, exist_ok=True)
+        generation = (previous or {}).get("generation", 0) + 1
+        tag = f"{generation}.{uuid.uuid4().hex[:12]}"
+        data = self._compact(self._normalize_index(entry["data"]))
+        sparse_columns = {}
+        for name in self.SPARSE_COLUMNS:
+            if name in data.columns:
+                values = data[name].fillna(0)
+                sparse_columns[name] = {
+                    "dtype": str(values.dtype),
+                    "events": [[date.isoformat(), float(value)] for date, value in values[values != 0].items()],
+                }
+        data = data.drop(columns=list(sparse_columns))
+
+        manifest = {
+            "schema_version": self.SCHEMA_VERSION,
+            "generation": generation,
+            "index_name": data.index.name or "Date",
+            "index_file": f"index.{tag}.npy",
+            "rows": len(data),
+            "columns": [],
+            "sparse_columns": sparse_columns,
+            "ranges": entry["ranges"],
+            "live_ranges": entry.get("live_ranges", []),
+        }
+        self._write_array(os.path.join(ticker_dir, manifest["index_file"]),
+                          np.asarray(pd.DatetimeIndex(data.index), dtype="datetime64[ns]"))
+        for position, name in enumerate(data.columns):
+            values = data[name].to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            column = {"name": str(name), "dtype": str(values.dtype), "file": f"col{position}.{tag}.npy"}
+            self._write_array(os.path.join(ticker_dir, column["file"]), values)
+            manifest["columns"].append(column)
+        self._write_manifest(ticker, manifest)
+        self._remove_generation(ticker, previous)
+
+    def _remove_generation(self, ticker: str, manifest: Optional[dict]) -> None:
+        """Delete the column files of a superseded manifest (open memory maps stay valid)."""
+        if not manifest:
+            return
+        ticker_dir = self._get_ticker_dir(ticker)
+        for file_name in [manifest["index_file"]] + [column["file"] for column in manifest["columns"]]:
+            try:
+                os.remove(os.path.join(ticker_dir, file_name))
+            except FileNotFoundError:
+                pass
+
+    def _import_pickled_store(self, ticker: str, entry: dict) -> bool:
+        """Fold a ``{ticker}.pkl`` store file from the previous pickle format into an entry."""
+        pickle_file = os.path.join(self.store_dir, f"{ticker}.pkl")
+        if not os.path.isfile(pickle_file):
+            return False
+        try:
+            pickled = pd.read_pickle(pickle_file)
+            entry["data"] = self._normalize_index(pickled["data"])
+            entry["ranges"] = self._merge_ranges([tuple(r) for r in pickled["ranges"]])
+            os.remove(pickle_file)
+            self.logger.log_info(f"Converted pickled {ticker} store to the columnar format.")
+            return True
+        except Exception as e:
+            self.logger.log_warning(f"Skipping unreadable pickled store {pickle_file}: {e}")
+            return False
+
+    def _import_legacy_files(self, ticker: str, entry: dict) -> bool:
+        """
+        Fold exact-key cache files written by earlier versions into a store entry.
+
+        The legacy files are removed once their rows have been merged.
+
+        Returns:
+            bool: True if at least one legacy file was imported.
+        """
+        imported = False
+        for legacy_file in glob.glob(os.path.join(self.legacy_dir, f"{glob.escape(ticker)}_*_*.pkl")):
+            match = self.LEGACY_FILE_PATTERN.match(os.path.basename(legacy_file))
+            if not match or match.group("ticker") != ticker:
+                continue
+            try:
+                data = pd.read_pickle(legacy_file)
+                if isinstance(data, dict):
+                    data = data.get("data")
+                if not isinstance(data, pd.DataFrame) or not isinstance(data.index, pd.DatetimeIndex):
+                    continue
+                self._merge_into(entry, data, match.group("start"), match.group("end"))
+                os.remove(legacy_file)
+                imported = True
+                self.logger.log_info(f"Imported legacy cache file {legacy_file} into the {ticker} store.")
+            except Exception as e:
+                self.logger.log_warning(f"Skipping unreadable legacy cache file {legacy_file}: {e}")
+        return imported
+
+    @staticmethod
+    def _naive_index(data: pd.DataFrame) -> pd.DatetimeIndex:
+        """Return the frame's index as naive timestamps for comparison with plain dates."""
+        index = pd.DatetimeIndex(data.index)
+        return index.tz_localize(None) if index.tz is not None else index
+
+    @staticmethod
+    def _merge_ranges(ranges: List[Tuple[str, str]]) -> List[List[str]]:
+        """Coalesce overlapping or adjacent half-open date ranges."""
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return merged
+
+    @staticmethod
+    def _subtract_ranges(start: str, end: str, covered: List[List[str]]) -> List[Tuple[str, str]]:
+        """Return the parts of ``[start, end)`` not contained in the covered ranges."""
+        gaps = []
+        cursor = start
+        for covered_start, covered_end in covered:
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+            if cursor >= end:
+                break
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    @classmethod
+    def _normalize_index(cls, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store rows on naive exchange-local timestamps.
+
+        ``Ticker.history`` returns tz-aware indexes while bulk downloads may not, and the
+        two cannot be concatenated; dropping the zone keeps the wall-clock bar times.
+        """
+        if isinstance(data.index, pd.DatetimeIndex) and data.index.tz is not None:
+            data = data.copy()
+            data.index = cls._naive_index(data).rename(data.index.name)
+        return data
+
+    def _record_range(self, coverage: dict, start_date: str, end_date: str, now: Optional[float] = None) -> None:
+        """
+        Record a fetched range in the ``ranges``/``live_ranges`` of an entry or manifest.
+
+        The part before the session cutoff becomes final coverage; the rest is recorded as
+        live coverage with an expiry, replacing older live coverage of the same dates.
+        Expired live ranges are dropped.
+        """
+        now = time.time() if now is None else now
+        cutoff = self.freshness_policy.session_cutoff(now)
+        final_end = min(end_date, cutoff)
+        if start_date < final_end:
+            coverage["ranges"] = self._merge_ranges(
+                [tuple(r) for r in coverage["ranges"]] + [(start_date, final_end)]
+            )
+        replaced = self._merge_ranges([tuple(r) for r in coverage["ranges"]] + [(start_date, end_date)])
+        live_ranges = []
+        for live_start, live_end, expires_at in coverage.get("live_ranges", []):
+            if not self.freshness_policy.is_fresh(expires_at, now):
+                continue
+            live_ranges.extend(
+                [piece_start, piece_end, expires_at]
+                for piece_start, piece_end in self._subtract_ranges(live_start, live_end, replaced)
+            )
+        live_start = max(start_date, cutoff)
+        if live_start < end_date:
+            live_ranges.append([live_start, end_date, self.freshness_policy.expires_at(end_date, now)])
+        coverage["live_ranges"] = sorted(live_ranges)
+
+    def _merge_into(self, entry: dict, data: pd.DataFrame, start_date: str, end_date: str) -> None:
+        """Merge rows and their covered range into an in-memory store entry."""
+        if data is not None and not data.empty:
+            data = self._normalize_index(data)
+            frames = [self._normalize_index(frame) for frame in (entry["data"], data) if not frame.empty]
+            combined = pd.concat(frames) if len(frames) > 1 else data
+            combined = combined[~combined.index.duplicated(keep="last")].sort_index()
+            entry["data"] = combined
+        self._record_range(entry, start_date, end_date)
+
+    def covered_ranges(self, ticker: str) -> List[List[str]]:
+        """
+        Return the date ranges already held for a ticker that are still fresh.
+
+        The manifest comes from the memory tier when the ticker is resident there, otherwise
+        only ``manifest.json`` is read; no price data is loaded. Live ranges whose expiry has
+        passed are left out, so they are reported as missing and fetched again.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+
+        Returns:
+            List[List[str]]: Sorted, non-overlapping ``[start, end)`` ranges.
+        """
+        with self._lock:
+            cached = self.memory_cache.get(ticker)
+            manifest = cached["manifest"] if cached is not None else self._read_manifest(ticker)
+        if not manifest:
+            return []
+        now = time.time()
+        fresh = [
+            (start, end) for start, end, expires_at in manifest.get("live_ranges", [])
+            if self.freshness_policy.is_fresh(expires_at, now)
+        ]
+        return self._merge_ranges([tuple(r) for r in manifest["ranges"]] + fresh)
+
+    def missing_ranges(self, ticker: str, start_date: str, end_date: str) -> List[Tuple[str, str]]:
+        """
+        Compute which parts of a requested range still have to be fetched.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            start_date (str): Start date in YYYY-MM-DD format (inclusive).
+            end_date (str): End date in YYYY-MM-DD format (exclusive).
+
+        Returns:
+            List[Tuple[str, str]]: Gaps as ``(start, end)`` pairs, empty when fully covered.
+        """
+        if end_date <= start_date:
+            return []
+        return self._subtract_ranges(start_date, end_date, self.covered_ranges(ticker))
+
+    def merge(self, ticker: str, data: Optional[pd.DataFrame], start_date: str, end_date: str) -> None:
+        """
+        Merge freshly fetched rows into the ticker's store and record the range as covered.
+
+        An empty frame still marks the range as covered, so spans without trading days
+        (weekends, holidays) are not fetched again; only the manifest is rewritten then.
+        Rows of the current session replace previously stored ones for the same dates.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            data (Optional[pd.DataFrame]): Date-indexed rows fetched for the range.
+            start_date (str): Start date of the fetched range (inclusive).
+            end_date (str): End date of the fetched range (exclusive).
+        """
+        with self._lock, self._ticker_lock(ticker):
+            manifest = self._read_manifest(ticker)
+            if manifest is not None and (data is None or data.empty):
+                self._record_range(manifest, start_date, end_date)
+                self._write_manifest(ticker, manifest)
+            else:
+                entry = self._load_entry(ticker) if manifest is not None else self._empty_entry()
+                self._merge_into(entry, data, start_date, end_date)
+                self._save_entry(ticker, entry, previous=manifest)
+            self.memory_cache.invalidate(ticker)
+            self.logger.log_info(f"Stored {ticker} rows for {start_date} to {end_date}.")
+            if self.cache_manager:
+                self.cache_manager.record_write(self._get_ticker_dir(ticker))
+
+    def load_range(self, ticker: str, start_date: str, end_date: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Slice the stored rows for a ticker to a date range.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            start_date (str): Start date in YYYY-MM-DD format (inclusive).
+            end_date (str): End date in YYYY-MM-DD format (exclusive).
+            columns (Optional[List[str]]): Columns to load, e.g. ``["Close"]`` (None for all).
+
+        Returns:
+            pd.DataFrame: Date-indexed rows within the range (possibly empty).
+        """
+        with self._lock:
+            if self.memory_cache.max_bytes:
+                cached = self._load_cached(ticker)
+                manifest = cached["manifest"] if cached else None
+            else:
+                cached, manifest = None, self._read_manifest(ticker)
+            if manifest is None:
+                return pd.DataFrame()
+            if self.cache_manager:
+                self.cache_manager.record_access(self._get_ticker_dir(ticker))
+            if cached is None:
+                data = self._read_frame(ticker, manifest, start_date, end_date, columns)
+                return self._expand_sparse(data, manifest, columns) if not data.empty else data
+        data = cached["data"]
+        if data.empty:
+            return pd.DataFrame()
+        first = data.index.searchsorted(pd.Timestamp(start_date), "left")
+        last = data.index.searchsorted(pd.Timestamp(end_date), "left")
+        rows = data.iloc[first:last]
+        if columns is not None:
+            rows = rows[[column for column in rows.columns if column in columns]]
+        return self._expand_sparse(rows.copy(), cached["manifest"], columns)
+
+
+_stores: Dict[str, PriceStore] = {}
+_stores_lock = threading.Lock()
+_store_settings = {"memory_bytes": 256 * 1024 ** 2, "float32_prices": False}
+
+
+def configure_price_stores(memory_bytes: int = 256 * 1024 ** 2, float32_prices: bool = False) -> None:
+    """Set the memory tier budget and price precision of every store returned by ``get_price_store``."""
+    with _stores_lock:
+        _store_settings.update(memory_bytes=memory_bytes, float32_prices=float32_prices)
+        for store in _stores.values():
+            store.memory_cache.max_bytes = memory_bytes
+            store.float32_prices = float32_prices
+
+
+def get_price_store(store_dir: str, legacy_dir: str = None, cache_manager: Optional[CacheManager] = None) -> PriceStore:
+    """
+    Return the process-wide store for a directory, creating it on first use.
+
+    Fetchers and caches sharing a directory share one store, and with it one memory tier.
+    """
+    key = os.path.abspath(store_dir)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = PriceStore(
+                store_dir=store_dir,
+                legacy_dir=legacy_dir,
+                cache_manager=cache_manager,
+                memory_cache=MemoryCache(_store_settings["memory_bytes"]),
+                float32_prices=_store_settings["float32_prices"],
+            )
+        return _stores[key]
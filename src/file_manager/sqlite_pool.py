@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import threading
+import weakref
+from typing import Dict, Set
+
+
+class SQLiteConnectionPool:
+    """
+    Per-thread SQLite connections to one database file.
+
+    sqlite3 connections must not be shared between threads, so every thread gets its own
+    connection on first use and keeps it for its lifetime; the connection is closed when
+    the thread exits, so servers that start a thread per request do not accumulate them.
+    The database runs in WAL mode, letting readers proceed while a writer commits.
+    """
+
+    PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+        "cache_size": -8000,  # KiB
+    }
+
+    def __init__(self, db_path: str, pragmas: Dict[str, object] = None):
+        """
+        Initialize the SQLiteConnectionPool instance.
+
+        Args:
+            db_path (str): Path to the database file.
+            pragmas (Dict[str, object]): Overrides for the default pragmas.
+        """
+        self.db_path = db_path
+        self.pragmas = {**self.PRAGMAS, **(pragmas or {})}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: Set[sqlite3.Connection] = set()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            for name, value in self.pragmas.items():
+                connection.execute(f"PRAGMA {name}={value}")
+            holder = _ConnectionHolder(connection)
+            # The thread-local holder is dropped when its thread exits, closing the connection.
+            weakref.finalize(holder, self._release, self._connections, self._lock, connection)
+            self._local.holder = holder
+            with self._lock:
+                self._connections.add(connection)
+        return holder.connection
+
+    @staticmethod
+    def _release(connections: Set[sqlite3.Connection], lock: threading.Lock, connection: sqlite3.Connection) -> None:
+        with lock:
+            connections.discard(connection)
+        connection.close()
+
+    @property
+    def open_connections(self) -> int:
+        """Number of connections currently open."""
+        with self._lock:
+            return len(self._connections)
+
+    def close_all(self) -> None:
+        """Close every connection opened by the pool."""
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+
+class _ConnectionHolder:
+    """Thread-local owner of a connection; its finalizer closes the connection."""
+
+    __slots__ = ("connection", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
@@ -0,0 +1,248 @@
+import os
+import sys
+import csv
+import json
+import difflib
+import re
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+
+
+class SymbolDirectory:
+    """
+    Local directory of listed symbols and company names.
+
+    The directory is persisted as one JSON file and refreshed offline by importing a
+    listing file (CSV with ``Symbol``/``Name``/``Exchange`` columns, or JSON). Lookups run
+    against an in-memory index: a dict for exact symbols, a sorted symbol list for
+    prefix search, and a sorted list of name words for company-name search, with
+    ``difflib`` as the fuzzy fallback for misspelled names.
+    """
+
+    SHARE_CLASS_PATTERN = re.compile(r"^([A-Z]{1,5})[./]([A-Z]{1,2})$")
+    # Yahoo exchange suffixes that would otherwise read as a share class (VOD.L, SHOP.TO)
+    EXCHANGE_SUFFIXES = frozenset({
+        "L", "V", "F", "T", "TO", "CN", "NE", "HK", "AX", "NZ", "DE", "DU", "HM", "MU", "BE", "SG", "PA",
+        "AS", "BR", "MI", "MC", "LS", "SW", "ST", "OL", "CO", "HE", "IC", "IR", "VI", "WA", "PR", "AT",
+        "IS", "TA", "JO", "KS", "KQ", "SS", "SZ", "NS", "BO", "TW", "SI", "JK", "BK", "KL", "SA", "MX",
+        "BA", "SN", "CR", "QA", "SR", "RG", "TL", "VS",
+    })
+
+    def __init__(self, path: str = "data/sys_file/symbols/symbols.json"):
+        """
+        Initialize the SymbolDirectory instance.
+
+        Args:
+            path (str): JSON file the directory is persisted to.
+        """
+        self.path = path
+        self.logger = Logger("SymbolDirectory")
+        self.lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+        self._symbols: List[str] = []
+        self._words: List[tuple] = []
+        self._names: Dict[str, str] = {}
+        self._load()
+
+    @classmethod
+    def normalize_symbol(cls, symbol: str) -> str:
+        """
+        Normalize a symbol to the directory's (and Yahoo's) form.
+
+        Symbols are upper-cased and share classes written as ``BRK.B`` or ``BRK/B`` become
+        ``BRK-B``. Exchange suffixes (``VOD.L``, ``SHOP.TO``, ``0700.HK``), index carets
+        (``^GSPC``) and currency pairs (``BTC-USD``) are kept as they are.
+        """
+        symbol = symbol.strip().upper()
+        match = cls.SHARE_CLASS_PATTERN.match(symbol)
+        if match and match.group(2) not in cls.EXCHANGE_SUFFIXES:
+            return f"{match.group(1)}-{match.group(2)}"
+        return symbol
+
+    @staticmethod
+    def _words_of(name: str) -> List[str]:
+        return re.findall(r"[a-z0-9]+", name.lower())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.log_warning(f"Ignoring unreadable symbol directory {self.path}: {e}")
+            return
+        self._index(entries)
+
+    def _index(self, entries: List[dict]) -> None:
+        """Rebuild the in-memory index from a list of ``{symbol, name, exchange}`` entries."""
+        by_symbol = {entry["symbol"]: entry for entry in entries}
+        words = sorted({(word, symbol) for symbol, entry in by_symbol.items() for word in self._words_of(entry["name"])})
+        names = {" ".join(self._words_of(entry["name"])): symbol for symbol, entry in by_symbol.items()}
+        with self.lock:
+            self._entries = by_symbol
+            self._symbols = sorted(by_symbol)
+            self._words = words
+            self._names = names
+
+    @staticmethod
+    def _read_listing(listing_path: str) -> List[dict]:
+        """Read a CSV or JSON listing file into ``{symbol, name, exchange}`` entries."""
+        if listing_path.lower().endswith(".json"):
+            with open(listing_path, "r") as f:
+                rows = json.load(f)
+            if isinstance(rows, dict):
+                rows = [{"symbol": symbol, "name": name} for symbol, name in rows.items()]
+        else:
+            with open(listing_path, "r", newline="") as f:
+                rows = list(csv.DictReader(f))
+        entries = []
+        for row in rows:
+            row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+            symbol = row.get("symbol") or row.get("ticker") or ""
+            if symbol:
+                entries.append({
+                    "symbol": SymbolDirectory.normalize_symbol(symbol),
+                    "name": row.get("name") or row.get("security name") or row.get("company name") or "",
+                    "exchange": row.get("exchange", ""),
+                })
+        return entries
+
+    def refresh(self, listing_path: str) -> int:
+        """
+        Replace the directory with the symbols of a listing file and persist it.
+
+        Args:
+            listing_path (str): CSV or JSON listing file.
+
+        Returns:
+            int: Number of symbols in the directory.
+        """
+        entries = self._read_listing(listing_path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_file = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_file, self.path)
+        self._index(entries)
+        self.logger.log_info(f"Loaded {len(entries)} symbols from {listing_path}.")
+        return len(entries)
+
+    def refresh_if_stale(self, listing_path: str) -> bool:
+        """Import a listing file if it is newer than the persisted directory."""
+        if not listing_path or not os.path.isfile(listing_path):
+            return False
+        if os.path.isfile(self.path) and os.path.getmtime(self.path) >= os.path.getmtime(listing_path):
+            return False
+        self.refresh(listing_path)
+        return True
+
+    def lookup(self, symbol: str) -> Optional[dict]:
+        """Return the entry for an exact symbol, or None."""
+        return self._entries.get(self.normalize_symbol(symbol))
+
+    def prefix_search(self, prefix: str, limit: int = 10) -> List[dict]:
+        """Return the entries whose symbol starts with ``prefix``."""
+        prefix = self.normalize_symbol(prefix)
+        if not prefix:
+            return []
+        symbols = self._symbols
+        matches = []
+        for i in range(bisect_left(symbols, prefix), len(symbols)):
+            if not symbols[i].startswith(prefix) or len(matches) >= limit:
+                break
+            matches.append(self._entries[symbols[i]])
+        return matches
+
+    def name_search(self, query: str, limit: int = 10) -> List[dict]:
+        """
+        Return the entries whose company name matches ``query``.
+
+        Every word of the query has to start a word of the name ("micro corp" finds
+        Microsoft Corporation); if nothing matches, the closest names are returned instead.
+        """
+        query_words = self._words_of(query)
+        if not query_words:
+            return []
+        candidates = None
+        for word in query_words:
+            words = self._words
+            found = set()
+            for i in range(bisect_left(words, (word, "")), len(words)):
+                if not words[i][0].startswith(word):
+                    break
+                found.add(words[i][1])
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                break
+        if candidates:
+            ranked = sorted(candidates, key=lambda symbol: (len(self._entries[symbol]["name"]), symbol))
+            return [self._entries[symbol] for symbol in ranked[:limit]]
+        close = difflib.get_close_matches(" ".join(query_words), list(self._names), n=limit, cutoff=0.6)
+        return [self._entries[self._names[name]] for name in close]
+
+    def suggest(self, query: str, limit: int = 10) -> List[dict]:
+        """Return typeahead suggestions: the exact symbol, then symbol prefixes, then company names."""
+        suggestions = {}
+        for entry in self.prefix_search(query, limit) + self.name_search(query, limit):
+            suggestions.setdefault(entry["symbol"], entry)
+        return list(suggestions.values())[:limit]
+
+    def resolve(self, query: str, lookup: Optional[Callable[[str], Optional[str]]] = None) -> Optional[str]:
+        """
+        Resolve a symbol or company name to a listed symbol.
+
+        The directory answers listed symbols and company names without any network call.
+        Anything it does not list (including everything while it is empty) is passed,
+        normalized, to ``lookup``, e.g. a quote-service lookup for symbols of exchanges
+        the listing does not cover.
+
+        Args:
+            query (str): Symbol or company name.
+            lookup (Optional[Callable[[str], Optional[str]]]): Fallback for queries the
+                directory does not match (None to resolve offline only).
+
+        Returns:
+            Optional[str]: The normalized symbol, or None if the query matches nothing.
+        """
+        if not query or not query.strip():
+            return None
+        entry = self.lookup(query)
+        if entry is not None:
+            return entry["symbol"]
+        if query.strip() != query.strip().upper():
+            matches = self.name_search(query, limit=1)
+            if matches:
+                return matches[0]["symbol"]
+        return lookup(self.normalize_symbol(query)) if lookup is not None else None
+
+
+_default_directory = None
+_default_lock = threading.Lock()
+
+
+def configure_symbol_directory(path: str = "data/sys_file/symbols/symbols.json",
+                               listing_file: Optional[str] = None) -> SymbolDirectory:
+    """Replace the process-wide symbol directory, importing ``listing_file`` if it is newer."""
+    global _default_directory
+    with _default_lock:
+        _default_directory = SymbolDirectory(path=path)
+        _default_directory.refresh_if_stale(listing_file)
+        return _default_directory
+
+
+def get_symbol_directory() -> SymbolDirectory:
+    """Return the process-wide symbol directory."""
+    global _default_directory
+    with _default_lock:
+        if _default_directory is None:
+            _default_directory = SymbolDirectory()
+        return _default_directory
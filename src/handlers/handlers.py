@@ -1,5 +1,4 @@
 from datetime import datetime
-import yfinance as yf
 import os
 import json
 import os
@@ -9,6 +8,9 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 from logs.logger import Logger
 from file_manager.fileManager import FileManager
+from portfolio_manager.quote_service import get_quote_service
+from portfolio_manager.indicator_panel import IndicatorPanel
+from portfolio_manager.risk_analytics import RiskAnalytics
 
 
 def lookup_ticker(company_name):
@@ -18,8 +20,7 @@ def lookup_ticker(company_name):
     :return: Ticker symbol if found, otherwise None.
     """
     try:
-        ticker = yf.Ticker(company_name)
-        ticker_info = ticker.info
+        ticker_info = get_quote_service().get(company_name)
 
         return ticker_info.get('symbol', None)
     except Exception as e:
@@ -165,21 +166,16 @@ class PortfolioManager:
             total_return = 0
             total_dividends = 0
             details = []
+            quotes = get_quote_service().get_many([stock["ticker"] for stock in portfolio])
 
             for stock in portfolio:
                 ticker = stock["ticker"]
                 shares = stock["shares"]
                 purchase_price = stock["purchase_price"]
 
-                try:
-                    stock_data = yf.Ticker(ticker)
-                    current_price = stock_data.info.get("regularMarketPrice", 0) or 0
-                    dividend_yield = stock_data.info.get("dividendYield", 0) * 100 if stock_data.info.get(
-                        "dividendYield") else 0
-                except Exception as e:
-                    self.logger.log_error(f"Error fetching data for ticker '{ticker}': {e}")
-                    current_price = 0
-                    dividend_yield = 0
+                info = quotes.get(ticker, {})
+                current_price = info.get("regularMarketPrice", 0) or 0
+                dividend_yield = info.get("dividendYield", 0) * 100 if info.get("dividendYield") else 0
 
                 stock_return = (current_price - purchase_price) * shares
                 stock_dividends = (dividend_yield / 100) * current_price * shares
@@ -205,6 +201,52 @@ class PortfolioManager:
             self.logger.log_critical(f"Operation Failed: {e}")
             raise
 
+    def calculate_risk(self, user_email, fetcher, start_date, end_date, benchmark=None, **options):
+        """
+        Calculate the risk metrics of a user's portfolio and of each holding.
+
+        Price history is loaded in one ``fetch_many`` call, so holdings already in the price
+        store are served from cache. Lots of the same ticker are combined.
+
+        Args:
+            user_email (str): Owner of the portfolio.
+            fetcher (DataFetcher): Fetcher whose price store holds the history.
+            start_date (str): Start date in YYYY-MM-DD format.
+            end_date (str): End date in YYYY-MM-DD format.
+            benchmark (Optional[str]): Benchmark ticker for beta, e.g. "SPY".
+            **options: Forwarded to ``RiskAnalytics.analyze`` (risk_free_rate, confidence, beta_window).
+
+        Returns:
+            dict: Portfolio and per-holding risk metrics.
+        """
+        try:
+            if user_email not in self.portfolio:
+                raise ValueError(f"No portfolio found for user: {user_email}")
+
+            shares = {}
+            for stock in self.portfolio[user_email]:
+                ticker = stock["ticker"].strip().upper()
+                shares[ticker] = shares.get(ticker, 0) + stock["shares"]
+            if not shares:
+                raise ValueError(f"Portfolio for {user_email} is empty.")
+
+            benchmark = benchmark.strip().upper() if benchmark else None
+            frames = fetcher.fetch_many(list(shares) + ([benchmark] if benchmark else []), start_date, end_date)
+            # Fetched frames carry their dates in a "Date" column; from_frames aligns on it.
+            prices = IndicatorPanel.from_frames({ticker: frames.get(ticker) for ticker in shares})
+            benchmark_prices = None
+            if benchmark:
+                benchmark_frame = frames.get(benchmark)
+                if benchmark_frame is None or benchmark_frame.empty:
+                    self.logger.log_warning(f"No price history for benchmark '{benchmark}'; skipping beta.")
+                else:
+                    benchmark_prices = IndicatorPanel.with_date_index(benchmark_frame)["Close"]
+
+            return RiskAnalytics.analyze(prices, shares, benchmark=benchmark_prices, **options)
+        except Exception as e:
+            self.logger.log_error(f"Error calculating portfolio risk: {e}")
+            raise
+
     def save_to_file(self, file_path):
         try:
             full_path = file_path
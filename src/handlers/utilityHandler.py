@@ -8,7 +8,8 @@ from portfolio_manager.searchStocks import StockSearcher
 from portfolio_manager.tracker import Tracker
 from login_system_manager.login_system import LoginSystem
 from sessionManager.session_manager import SessionManager
-from handlers.handlers import is_valid_date, is_valid_ticker, lookup_ticker
+from handlers.handlers import is_valid_date, lookup_ticker
+from file_manager.symbol_directory import get_symbol_directory
 
 
 class UtilityHandler:
@@ -16,9 +17,8 @@ class UtilityHandler:
 
     @staticmethod
     def validate_ticker(ticker):
-        if is_valid_ticker(ticker):
-            return ticker
-        return lookup_ticker(ticker)
+        """Resolve a ticker or company name via the local symbol directory, then the quote service (None if unknown)."""
+        return get_symbol_directory().resolve(ticker, lookup=lookup_ticker)
 
     @staticmethod
     def validate_dates(start_date, end_date):
@@ -2,6 +2,7 @@ import os
 import json
 import sys
 from pathlib import Path
+import pandas as pd
 
 # Add the `src` directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
@@ -9,13 +10,24 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 
 from portfolio_manager.visualizer import Visualizer
 from portfolio_manager.metrics_calculator import MetricsCalculator
-from portfolio_manager.data_fetcher import DataFetcher
+from portfolio_manager.async_data_fetcher import ConcurrentDataFetcher
+from portfolio_manager.rate_limiter import RateLimitExceeded, configure_shared_rate_limiter
+from portfolio_manager.market_data_provider import create_provider, set_default_provider
+from file_manager.cache_manager import configure_cache_managers
+from file_manager.cache_policy import configure_freshness_policy
+from file_manager.price_store import configure_price_stores
+from file_manager.negative_cache import configure_negative_cache
+from file_manager.fundamentals_cache import configure_fundamentals_cache
+from file_manager.symbol_directory import configure_symbol_directory, get_symbol_directory
+from portfolio_manager.quote_service import configure_quote_service, get_quote_service
 from portfolio_manager.technical_analysis import TechnicalAnalysis
+from portfolio_manager.indicator_registry import get_indicator_registry
 from portfolio_manager.fundamental_analysis import FundamentalAnalysis
 from portfolio_manager.advisor import Advisor
 from portfolio_manager.portfolio_operations import PortfolioOperations
 from portfolio_manager.searchStocks import StockSearcher
 from portfolio_manager.tracker import Tracker
+from portfolio_manager.cache_warmer import CacheWarmer, RequestHistory
 from handlers.handlers import WatchlistManager
 from handlers.utilityHandler import UtilityHandler
 from sessionManager.session_manager import SessionManager
@@ -42,17 +54,68 @@ class PortfolioManagerApp:
 
     def _initialize_modules(self):
         """Initialize core modules."""
-        self.searcher = StockSearcher(tickers=self.default_tickers,  base_dir=self.base_dir)
+        set_default_provider(create_provider(self.market_data_config))
+        configure_cache_managers(
+            max_bytes=int(self.cache_config.get("max_megabytes", 1024) * 1024 * 1024),
+            policy=self.cache_config.get("eviction_policy", "lru"),
+            sweep_interval=self.cache_config.get("sweep_interval_seconds", 300),
+        )
+        configure_price_stores(
+            memory_bytes=int(self.cache_config.get("memory_megabytes", 256) * 1024 * 1024),
+            float32_prices=self.cache_config.get("float32_prices", False),
+        )
+        configure_negative_cache(ttl=self.cache_config.get("negative_ttl_seconds", 300))
+        configure_fundamentals_cache(ttl=self.cache_config.get("fundamentals_ttl_hours", 24) * 3600)
+        configure_freshness_policy(
+            live_ttl=self.cache_config.get("live_ttl_seconds", 60),
+            settle_minutes=self.cache_config.get("settle_minutes", 30),
+        )
+        configure_quote_service(ttl=self.cache_config.get("quote_ttl_seconds", 60))
+        configure_symbol_directory(
+            path=self.symbols_config.get("directory_path", "data/sys_file/symbols/symbols.json"),
+            listing_file=self.symbols_config.get("listing_file", "data/sys_file/symbols/listing.csv"),
+        )
+        configure_shared_rate_limiter(
+            max_requests=self.rate_limit_config.get("max_requests", 10),
+            period=self.rate_limit_config.get("period_seconds", 60),
+            capacity=self.rate_limit_config.get("burst"),
+            state_path=self.rate_limit_config.get("state_path", "data/sys_file/rate_limit_dir/rate_limit.db"),
+        )
+        self.searcher = StockSearcher(tickers=self.default_tickers,  base_dir=self.base_dir,
+                                      max_workers=self.search_config.get("max_workers", 8))
         self.tracker = Tracker(base_dir=self.base_dir)
         self.session_manager = SessionManager(base_dir=self.base_dir)
         self.visualizer = Visualizer(base_dir=self.base_dir)
         self.calculator = MetricsCalculator()
-        self.fetcher = DataFetcher(base_dir=self.base_dir)
+        self.fetcher = ConcurrentDataFetcher(base_dir=self.base_dir, blocking=self.rate_limit_config.get("blocking", False))
         self.technical_analysis = TechnicalAnalysis()
         self.fundamental_analysis = FundamentalAnalysis()
         self.advisor = Advisor()
         self.watchlist_manager = WatchlistManager(base_dir=self.base_dir)
         self.portfolio_operations = PortfolioOperations(base_dir=self.base_dir, portfolio_file=self.portfolio_file)
+        self.request_history = RequestHistory()
+        self.warmer = CacheWarmer(
+            fetcher=self.fetcher,
+            ticker_source=self._warm_tickers,
+            request_history=self.request_history,
+            searcher_factory=lambda: StockSearcher(tickers=self.default_tickers, base_dir=self.base_dir),
+            fundamentals=self.fundamental_analysis,
+            interval=self.warmer_config.get("interval_seconds", 900),
+            top_n=self.warmer_config.get("top_n", 20),
+            lookback_days=self.warmer_config.get("lookback_days", 365),
+            reserve_fraction=self.warmer_config.get("reserve_fraction", 0.5),
+        )
+        if self.warmer_config.get("enabled", True):
+            self.warmer.start()
+
+    def _warm_tickers(self):
+        """Return the configured default tickers and the tickers on the saved watchlist."""
+        tickers = list(self.default_tickers)
+        if os.path.exists(self.watchlist_file):
+            watchlist_manager = WatchlistManager(base_dir=self.base_dir)  # Leave the app's watchlist untouched
+            watchlist_manager.load_from_file(self.watchlist_file)
+            tickers += [item["ticker"] for item in watchlist_manager.watchlist]
+        return tickers
 
     def _load_configuration(self):
         try:
@@ -66,6 +129,18 @@ class PortfolioManagerApp:
                     "data_directory": "./data",
                     "watchlist_subdir": "watchlist",
                     "portfolio_subdir": "portfolio",
+                    "rate_limit": {"max_requests": 10, "period_seconds": 60, "burst": 10, "blocking": False},
+                    "market_data": {"provider": "yahoo"},
+                    "cache": {"max_megabytes": 1024, "eviction_policy": "lru", "sweep_interval_seconds": 300,
+                              "memory_megabytes": 256, "live_ttl_seconds": 60, "settle_minutes": 30,
+                              "negative_ttl_seconds": 300, "float32_prices": False,
+                              "fundamentals_ttl_hours": 24, "quote_ttl_seconds": 60},
+                    "warmer": {"enabled": True, "interval_seconds": 900, "top_n": 20, "lookback_days": 365,
+                               "reserve_fraction": 0.5},
+                    "search": {"timeout_seconds": 10, "max_workers": 8},
+                    "symbols": {"directory_path": "data/sys_file/symbols/symbols.json",
+                                "listing_file": "data/sys_file/symbols/listing.csv"},
+                    "risk": {"benchmark": "SPY", "risk_free_rate": 0.0, "confidence": 0.95, "beta_window": 63},
                 }
                 self.file_manager.save_json_file(config_path, default_config)
 
@@ -75,6 +150,13 @@ class PortfolioManagerApp:
             self.data_directory = os.path.abspath(config.get("data_directory", "./data"))
             self.watchlist_dir = os.path.join(self.data_directory, config.get("watchlist_subdir", "watchlist"))
             self.portfolio_dir = os.path.join(self.data_directory, config.get("portfolio_subdir", "portfolio"))
+            self.rate_limit_config = config.get("rate_limit", {})
+            self.market_data_config = config.get("market_data", {})
+            self.cache_config = config.get("cache", {})
+            self.warmer_config = config.get("warmer", {})
+            self.search_config = config.get("search", {})
+            self.symbols_config = config.get("symbols", {})
+            self.risk_config = config.get("risk", {})
 
             os.makedirs(self.data_directory, exist_ok=True)
             os.makedirs(self.watchlist_dir, exist_ok=True)
@@ -88,58 +170,177 @@ class PortfolioManagerApp:
             self.logger.log_error(f"Error loading configuration: {e}")
             raise
     
-    def perform_analysis(self, ticker, start_date, end_date):
-        """Perform stock analysis."""
+    def perform_analysis(self, ticker, start_date, end_date, indicators=None):
+        """
+        Perform stock analysis.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            start_date (str): First date of the analysis.
+            end_date (str): Last date of the analysis.
+            indicators (Optional[List[str]]): Indicator series to return along with the advice
+                (see ``IndicatorRegistry.available``); only these and the advice inputs are computed.
+
+        Returns:
+            dict: Status, message and the analysis data.
+        """
         self.logger.log_info(f"Starting stock analysis for {ticker}...")
         try:
-            if not UtilityHandler.validate_ticker(ticker):
+            symbol = UtilityHandler.validate_ticker(ticker)
+            if not symbol:
                 raise ValueError(f"Invalid ticker: {ticker}")
+            ticker = symbol
+            self._record_request(ticker)
             if not UtilityHandler.validate_dates(start_date, end_date):
                 raise ValueError(f"Invalid date range: {start_date} - {end_date}")
+            if indicators is not None:
+                get_indicator_registry().plan(indicators)
 
-            return self._analyze_stock(ticker, start_date, end_date)
+            return self._analyze_stock(ticker, start_date, end_date, indicators)
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             self.logger.log_error(f"Error during stock analysis for ticker {ticker}: {e}")
             return {"status": "error", "message": str(e)}
 
-    def _analyze_stock(self, ticker, start_date, end_date):
+    def _analyze_stock(self, ticker, start_date, end_date, indicators=None):
         """Helper method to analyze a stock."""
         try:
-            data = self.fetcher.fetch_stock_data(ticker, start_date, end_date)
-            if data.empty:
+            registry = get_indicator_registry()
+            requested = list(dict.fromkeys(indicators or []))
+            outputs = requested + ["macd", "signal", "rsi"]
+            columns = registry.required_columns(outputs)
+            data = self.fetcher.fetch_stock_data(ticker, start_date, end_date, columns=columns)
+            if data is None or data.empty:
                 self.logger.log_warning(f"No data found for ticker '{ticker}'.")
                 return {"status": "error", "message": "No data found."}
 
-            moving_avg = self.calculator.calculate_moving_average(data, 20)
-            volatility = self.calculator.calculate_volatility(data, 20)
-            macd, signal = self.technical_analysis.calculate_macd(data)
-            rsi = self.technical_analysis.calculate_rsi(data)
+            series = registry.evaluate_frame(data, outputs)
             ratios = self.fundamental_analysis.get_financial_ratios(ticker)
-            advice = self.advisor.generate_advice(data, macd, signal, rsi)
+            advice = self.advisor.generate_advice(data, series["macd"], series["signal"], series["rsi"])
+
+            analysis = {
+                "ticker": ticker,
+                "fundamental_ratios": ratios,
+                "advice": advice
+            }
+            if indicators is not None:
+                analysis["indicators"] = {
+                    "dates": [timestamp.isoformat() for timestamp in series.index],
+                    **{name: [None if pd.isna(value) else float(value) for value in series[name]] for name in requested}
+                }
 
             return {
                 "status": "success",
                 "message": "Stock analysis completed successfully.",
-                "data": {
-                    "ticker": ticker,
-                    "fundamental_ratios": ratios,
-                    "advice": advice
-                }
+                "data": analysis
             }
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             self.logger.log_error(f"Error during stock analysis for ticker {ticker}: {str(e)}")
             return {"status": "error", "message": str(e)}
-    
+
+    def _record_request(self, symbol):
+        """
+        Count a resolved symbol toward the cache warmer's top-N.
+
+        Only symbols listed in the symbol directory are counted (any well-formed symbol
+        while the directory is empty), so typos and probing requests are not warmed.
+        """
+        directory = get_symbol_directory()
+        if not len(directory) or directory.lookup(symbol) is not None:
+            self.request_history.record(symbol)
+
+    def cache_stats(self):
+        """Report hit/miss/eviction counters for the price cache, its memory tier, negative cache and quotes."""
+        stats = self.fetcher.cache_manager.get_stats()
+        stats["memory"] = self.fetcher.price_store.memory_cache.get_stats()
+        stats["negative"] = self.fetcher.negative_cache.get_stats()
+        stats["quotes"] = get_quote_service().get_stats()
+        return {"status": "success", "data": stats}
+
+    def warmer_progress(self):
+        """Report the progress of the background cache warmer."""
+        return {"status": "success", "data": self.warmer.get_progress()}
+
+    def suggest_symbols(self, query, limit=10):
+        """Suggest listed symbols for a partial symbol or company name."""
+        return {"status": "success", "data": get_symbol_directory().suggest(query, limit)}
+
     def search_stocks(self, tickers):
-        """Search for stock metadata."""
+        """Search for stock metadata, returning what was found within the configured deadline."""
+        for ticker in tickers:
+            symbol = UtilityHandler.validate_ticker(ticker)
+            if symbol:
+                self._record_request(symbol)
         try:
-            stock_metadata = {ticker: self.searcher.fetch_metadata(ticker) for ticker in tickers}
+            stock_metadata = self.searcher.search(tickers, timeout=self.search_config.get("timeout_seconds", 10))
             return {"status": "success", "data": stock_metadata}
         except Exception as e:
             #self.logger.log_error(f"Error during stock search: {str{e}}")
             return {"status": "error", "message": str(e)}
-        finally:
-            self.searcher.close_connection()
+
+    def portfolio_risk(self, user_email, start_date, end_date, benchmark=None):
+        """
+        Report the risk metrics of a user's portfolio and its holdings.
+
+        Args:
+            user_email (str): Owner of the portfolio.
+            start_date (str): Start date in YYYY-MM-DD format.
+            end_date (str): End date in YYYY-MM-DD format.
+            benchmark (Optional[str]): Benchmark ticker for beta (defaults to the configured one).
+
+        Returns:
+            dict: Status and the risk metrics, with matrices and series as lists.
+        """
+        try:
+            if not UtilityHandler.validate_dates(start_date, end_date):
+                raise ValueError(f"Invalid date range: {start_date} - {end_date}")
+
+            portfolio_manager = self.portfolio_operations.portfolio_manager
+            portfolio_manager.load_from_file(self.portfolio_file)
+            risk = portfolio_manager.calculate_risk(
+                user_email, self.fetcher, start_date, end_date,
+                benchmark=benchmark or self.risk_config.get("benchmark", "SPY"),
+                risk_free_rate=self.risk_config.get("risk_free_rate", 0.0),
+                confidence=self.risk_config.get("confidence", 0.95),
+                beta_window=self.risk_config.get("beta_window", 63),
+            )
+            return {"status": "success", "data": self._risk_to_json(risk)}
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            self.logger.log_error(f"Error calculating portfolio risk for {user_email}: {e}")
+            return {"status": "error", "message": str(e)}
+
+    @staticmethod
+    def _risk_to_json(risk):
+        """Convert ``RiskAnalytics.analyze`` output to JSON-friendly values (NaN as None)."""
+        def clean(value):
+            return None if pd.isna(value) else float(value)
+
+        data = {
+            "start": risk["start"].isoformat(),
+            "end": risk["end"].isoformat(),
+            "observations": risk["observations"],
+            "missing": risk["missing"],
+            "portfolio": {name: clean(value) for name, value in risk["portfolio"].items()},
+            "holdings": {ticker: {name: clean(value) for name, value in metrics.items()}
+                         for ticker, metrics in risk["holdings"].items()},
+        }
+        for name in ("covariance", "correlation"):
+            matrix = risk[name]
+            data[name] = {"tickers": list(matrix.columns),
+                          "values": [[clean(value) for value in row] for row in matrix.to_numpy()]}
+        if "rolling_beta" in risk:
+            rolling = risk["rolling_beta"]
+            data["rolling_beta"] = {
+                "dates": [timestamp.isoformat() for timestamp in rolling.index],
+                "portfolio": [clean(value) for value in risk["portfolio_rolling_beta"]],
+                **{ticker: [clean(value) for value in rolling[ticker]] for ticker in rolling.columns},
+            }
+        return data
 
     def track_stocks(self, ticker, threshold):
         """Track a stock with a threshold alert."""
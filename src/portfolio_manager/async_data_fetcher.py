@@ -0,0 +1,207 @@
+import asyncio
+import os
+import sys
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+import pandas as pd
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+from portfolio_manager.data_fetcher import DataFetcher
+from portfolio_manager.rate_limiter import RateLimitExceeded
+
+
+def run_sync(coroutine):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    When the calling thread already runs an event loop (e.g. inside an async handler),
+    the coroutine is executed on a helper thread with its own loop instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    outcome = {}
+
+    def runner():
+        try:
+            outcome["result"] = asyncio.run(coroutine)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=runner, name="AsyncDataFetcherRunner")
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+class AsyncDataFetcher:
+    """
+    asyncio front end for DataFetcher that overlaps provider round-trips.
+
+    Provider calls run on worker threads, at most ``max_concurrency`` at a time across every
+    thread and event loop using this fetcher (``run_sync`` starts a new loop per call), and
+    every call first takes a token from the fetcher's shared rate limiter without blocking
+    the event loop. Rows are read from and merged into the same price store as DataFetcher.
+    """
+
+    SLOT_POLL_SECONDS = 0.01
+
+    def __init__(self, fetcher: DataFetcher, max_concurrency: int = 8):
+        """
+        Initialize the AsyncDataFetcher instance.
+
+        Args:
+            fetcher (DataFetcher): Fetcher providing the price store, provider calls and rate limiter.
+            max_concurrency (int): Maximum number of provider calls in flight.
+        """
+        self.fetcher = fetcher
+        self.max_concurrency = max_concurrency
+        self.logger = Logger("AsyncDataFetcher")
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    @asynccontextmanager
+    async def _slot(self):
+        """
+        Hold one of the fetcher's ``max_concurrency`` provider slots.
+
+        The semaphore is shared by every event loop, so waiting polls it from the loop
+        instead of parking a worker thread the provider calls themselves need.
+        """
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(self.SLOT_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    async def _acquire_token(self):
+        """
+        Take a rate-limit token, sleeping on the event loop rather than in a thread.
+
+        Raises:
+            RateLimitExceeded: If the fetcher is non-blocking and no token is available.
+        """
+        while True:
+            wait_time = self.fetcher.rate_limiter.try_acquire()
+            if wait_time == 0:
+                return
+            if not self.fetcher.blocking:
+                raise RateLimitExceeded(wait_time)
+            self.logger.log_info(f"Rate limit exceeded. Waiting {wait_time:.2f} seconds.")
+            await asyncio.sleep(wait_time)
+
+    async def _fetch_gap(self, ticker: str, gap_start, gap_end: str, interval: str = DataFetcher.DAILY):
+        """Download one missing range for a ticker and store it."""
+        async with self._slot():
+            await self._acquire_token()
+            self.logger.log_info(f"Cache miss: Fetching data for {ticker} {gap_start} to {gap_end} from the provider...")
+            data = await asyncio.to_thread(self.fetcher._request_history, ticker, gap_start, gap_end, interval)
+        await asyncio.to_thread(self.fetcher._store_fetched, ticker, data, gap_start, gap_end, interval)
+
+    async def _fetch_batch(self, gap_start, gap_end: str, tickers: List[str], interval: str = DataFetcher.DAILY):
+        """Bulk download one missing range for a batch of tickers and store each ticker's rows."""
+        async with self._slot():
+            await self._acquire_token()
+            self.logger.log_info(
+                f"Cache miss: Bulk fetching {len(tickers)} tickers {gap_start} to {gap_end} from the provider..."
+            )
+            try:
+                frames = await asyncio.to_thread(
+                    self.fetcher._request_history_many, tickers, gap_start, gap_end, interval
+                )
+            except Exception as e:
+                self.logger.log_error(f"Error bulk fetching {tickers}: {e}")
+                return
+        for ticker in tickers:
+            await asyncio.to_thread(self.fetcher._store_fetched, ticker, frames.get(ticker), gap_start, gap_end, interval)
+
+    async def fetch_stock_data(self, ticker: str, start_date: str, end_date: str,
+                               columns: Optional[List[str]] = None,
+                               interval: str = DataFetcher.DAILY) -> Optional[pd.DataFrame]:
+        """
+        Fetch historical stock data, downloading all missing ranges concurrently.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            start_date (str): Start date in YYYY-MM-DD format.
+            end_date (str): End date in YYYY-MM-DD format.
+            columns (Optional[List[str]]): Price columns to load, e.g. ``["Close"]`` (None for all).
+            interval (str): Bar interval, "1d" or an intraday interval such as "5m".
+
+        Returns:
+            Optional[pd.DataFrame]: DataFrame containing stock price data, or None if an error occurs.
+        """
+        ticker = ticker.strip().upper()
+        try:
+            gaps = await asyncio.to_thread(self.fetcher._missing_ranges, ticker, start_date, end_date, interval)
+            if gaps:
+                self.fetcher.cache_manager.record_miss()
+            else:
+                self.fetcher.cache_manager.record_hit()
+            await asyncio.gather(*(self._fetch_gap(ticker, gap_start, gap_end, interval) for gap_start, gap_end in gaps))
+            results = await asyncio.to_thread(
+                self.fetcher._load_results, [ticker], start_date, end_date, columns, interval
+            )
+            return results[ticker]
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            self.logger.log_error(f"Error fetching data for {ticker}: {e}")
+            return None
+
+    async def fetch_many(self, tickers: List[str], start_date: str, end_date: str,
+                         interval: str = DataFetcher.DAILY) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch historical stock data for several tickers, running bulk batches concurrently.
+
+        Args:
+            tickers (List[str]): Stock ticker symbols.
+            start_date (str): Start date in YYYY-MM-DD format.
+            end_date (str): End date in YYYY-MM-DD format.
+            interval (str): Bar interval, "1d" or an intraday interval such as "5m".
+
+        Returns:
+            Dict[str, Optional[pd.DataFrame]]: Price data per normalized (upper-case) ticker, or
+                None where no data is available.
+        """
+        tickers = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers))
+        batches = await asyncio.to_thread(self.fetcher._plan_batches, tickers, start_date, end_date, interval)
+        await asyncio.gather(*(self._fetch_batch(*batch, interval) for batch in batches))
+        return await asyncio.to_thread(self.fetcher._load_results, tickers, start_date, end_date, None, interval)
+
+
+class ConcurrentDataFetcher(DataFetcher):
+    """
+    Drop-in synchronous DataFetcher whose downloads run through AsyncDataFetcher.
+
+    Callers keep the blocking ``fetch_stock_data``/``fetch_many`` interface while missing
+    ranges and bulk batches are fetched concurrently.
+    """
+
+    def __init__(self, *args, max_concurrency: int = 8, **kwargs):
+        """
+        Initialize the ConcurrentDataFetcher instance.
+
+        Args:
+            max_concurrency (int): Maximum number of provider calls in flight.
+            *args, **kwargs: Forwarded to DataFetcher.
+        """
+        super().__init__(*args, **kwargs)
+        self.async_fetcher = AsyncDataFetcher(self, max_concurrency=max_concurrency)
+
+    def _fetch_stock_data(self, ticker: str, start_date: str, end_date: str,
+                          columns: Optional[List[str]] = None, interval: str = DataFetcher.DAILY) -> Optional[pd.DataFrame]:
+        """Blocking wrapper around ``AsyncDataFetcher.fetch_stock_data``."""
+        return run_sync(self.async_fetcher.fetch_stock_data(ticker, start_date, end_date, columns, interval))
+
+    def fetch_many(self, tickers: List[str], start_date: str, end_date: str,
+                   interval: str = DataFetcher.DAILY) -> Dict[str, Optional[pd.DataFrame]]:
+        """Blocking wrapper around ``AsyncDataFetcher.fetch_many``."""
+        return run_sync(self.async_fetcher.fetch_many(tickers, start_date, end_date, interval))
@@ -0,0 +1,212 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+from portfolio_manager.data_fetcher import DataFetcher
+from portfolio_manager.rate_limiter import RateLimitExceeded
+
+
+class RequestHistory:
+    """Sliding window of requested tickers, used to find the most popular ones."""
+
+    def __init__(self, window: float = 24 * 3600, max_events: int = 100000):
+        """
+        Initialize the RequestHistory instance.
+
+        Args:
+            window (float): Seconds of history to keep.
+            max_events (int): Maximum number of requests remembered.
+        """
+        self.window = window
+        self.lock = threading.Lock()
+        self._events = deque(maxlen=max_events)
+
+    def record(self, ticker: str) -> None:
+        """Remember that a ticker was requested."""
+        with self.lock:
+            self._events.append((time.time(), ticker.strip().upper()))
+
+    def top(self, n: int) -> List[str]:
+        """Return the ``n`` most requested tickers within the window."""
+        cutoff = time.time() - self.window
+        with self.lock:
+            while self._events and self._events[0][0] < cutoff:
+                self._events.popleft()
+            counts = Counter(ticker for _, ticker in self._events)
+        return [ticker for ticker, _ in counts.most_common(n)]
+
+
+class CacheWarmer:
+    """
+    Background thread that pre-fetches data for likely requests.
+
+    Every cycle collects the configured tickers, the watchlist and the ``top_n`` most
+    requested tickers, then warms their price history (bulk requests per missing range)
+    and any metadata or financial ratios missing from their caches. Metadata and ratios
+    come from the same quote snapshot, so they cost one upstream call per ticker.
+
+    Every upstream call takes a token from the shared rate limiter, but only while at
+    least ``reserve_fraction`` of the bucket's capacity stays available; otherwise the
+    warmer waits, so a warm cycle (e.g. right after a deploy) never spends the burst
+    that user requests rely on.
+    """
+
+    def __init__(
+        self,
+        fetcher: DataFetcher,
+        ticker_source: Callable[[], List[str]],
+        request_history: Optional[RequestHistory] = None,
+        searcher_factory: Optional[Callable] = None,
+        fundamentals=None,
+        interval: float = 900,
+        top_n: int = 20,
+        lookback_days: int = 365,
+        reserve_fraction: float = 0.5,
+    ):
+        """
+        Initialize the CacheWarmer instance.
+
+        Args:
+            fetcher (DataFetcher): Fetcher whose caches are warmed.
+            ticker_source (Callable[[], List[str]]): Returns the configured and watchlist tickers.
+            request_history (Optional[RequestHistory]): Recent requests to pick popular tickers from.
+            searcher_factory (Optional[Callable]): Builds the StockSearcher used to warm
+                metadata; it is called on the warmer thread (None skips metadata).
+            fundamentals: FundamentalAnalysis used to warm financial ratios (None skips them).
+            interval (float): Seconds between warm cycles.
+            top_n (int): Number of most requested tickers to include.
+            lookback_days (int): Days of price history to warm.
+            reserve_fraction (float): Share of the rate limiter's capacity left to user requests.
+        """
+        self.fetcher = fetcher
+        self.ticker_source = ticker_source
+        self.request_history = request_history or RequestHistory()
+        self.searcher_factory = searcher_factory
+        self.fundamentals = fundamentals
+        self.interval = interval
+        self.top_n = top_n
+        self.lookback_days = lookback_days
+        self.reserve_fraction = reserve_fraction
+        self.logger = Logger("CacheWarmer")
+        self.lock = threading.Lock()
+        self.progress = {"running": False, "cycles": 0, "phase": "idle", "completed": 0, "total": 0,
+                         "tickers": [], "last_started": None, "last_finished": None, "last_error": None}
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._searcher = None
+
+    def _update(self, **fields) -> None:
+        with self.lock:
+            self.progress.update(fields)
+
+    def _advance(self, count: int = 1) -> None:
+        with self.lock:
+            self.progress["completed"] += count
+
+    def _with_backoff(self, func, *args):
+        """Call ``func``, waiting out rate-limit rejections until it succeeds or the warmer stops."""
+        while not self._stop_event.is_set():
+            try:
+                return func(*args)
+            except RateLimitExceeded as e:
+                self.logger.log_info(f"Warmer rate limited. Waiting {e.retry_after:.2f} seconds.")
+                self._stop_event.wait(e.retry_after)
+        return None
+
+    def _acquire_token(self) -> bool:
+        """Take a token while the reserved share of the bucket stays available."""
+        limiter = self.fetcher.rate_limiter
+        wait_time = limiter.try_acquire(reserve=limiter.capacity * self.reserve_fraction)
+        if wait_time > 0:
+            raise RateLimitExceeded(wait_time)
+        return True
+
+    def _warm_prices(self, tickers: List[str], start_date: str, end_date: str) -> None:
+        """Bulk fetch the tickers' missing price ranges, one reserved token per batch."""
+        for gap_start, gap_end, batch in self.fetcher._plan_batches(tickers, start_date, end_date):
+            if not self._with_backoff(self._acquire_token):
+                return
+            try:
+                frames = self.fetcher._request_history_many(batch, gap_start, gap_end)
+            except Exception as e:
+                self.logger.log_error(f"Error warming prices for {batch}: {e}")
+                continue
+            for ticker in batch:
+                self.fetcher._store_fetched(ticker, frames.get(ticker), gap_start, gap_end)
+
+    def collect_tickers(self) -> List[str]:
+        """Return the de-duplicated tickers to warm."""
+        tickers = [ticker.strip().upper() for ticker in self.ticker_source() if ticker and ticker.strip()]
+        return list(dict.fromkeys(tickers + self.request_history.top(self.top_n)))
+
+    def warm_once(self) -> None:
+        """Run one warm cycle."""
+        tickers = self.collect_tickers()
+        today = datetime.now()
+        start_date = (today - timedelta(days=self.lookback_days)).strftime("%Y-%m-%d")
+        end_date = (today + timedelta(days=1)).strftime("%Y-%m-%d")
+        phases = 1 + (self.searcher_factory is not None) + (self.fundamentals is not None)
+        self._update(running=True, phase="prices", completed=0, total=phases * len(tickers), tickers=tickers,
+                     last_started=time.time(), last_error=None)
+        try:
+            for i in range(0, len(tickers), self.fetcher.BATCH_SIZE):
+                chunk = tickers[i:i + self.fetcher.BATCH_SIZE]
+                self._warm_prices(chunk, start_date, end_date)
+                self._advance(len(chunk))
+
+            self._update(phase="quotes")
+            warmers = []
+            if self.searcher_factory is not None:
+                if self._searcher is None:
+                    self._searcher = self.searcher_factory()
+                warmers.append((self._searcher.is_cached, self._searcher.fetch_metadata))
+            if self.fundamentals is not None:
+                warmers.append((self.fundamentals.is_cached, self.fundamentals.get_financial_ratios))
+            for ticker in tickers if warmers else []:
+                if self._stop_event.is_set():
+                    break
+                missing = [fetch for is_cached, fetch in warmers if not is_cached(ticker)]
+                # Metadata and ratios share one quote snapshot, hence one token
+                if missing and self._with_backoff(self._acquire_token):
+                    for fetch in missing:
+                        fetch(ticker)
+                self._advance(len(warmers))
+            self.logger.log_info(f"Warmed {len(tickers)} tickers.")
+        except Exception as e:
+            self.logger.log_error(f"Cache warm cycle failed: {e}")
+            self._update(last_error=str(e))
+        finally:
+            with self.lock:
+                self.progress.update(running=False, phase="idle", last_finished=time.time())
+                self.progress["cycles"] += 1
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.warm_once()
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        """Start warming now and then every ``interval`` seconds."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="CacheWarmer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the warmer thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get_progress(self) -> dict:
+        """Return the state of the current or last warm cycle."""
+        with self.lock:
+            return dict(self.progress)
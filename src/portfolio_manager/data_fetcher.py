@@ -1,97 +1,298 @@
-import time
-import yfinance as yf
 import pandas as pd
 import os
 import sys
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add the `src` directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 from file_manager.fileManager import FileManager
+from file_manager.price_store import get_price_store
+from file_manager.intraday_store import IntradayStore
+from file_manager.cache_manager import CacheManager, get_cache_manager
+from file_manager.negative_cache import NegativeCache, get_negative_cache
 from logs.logger import Logger
+from portfolio_manager.rate_limiter import RateLimiter, RateLimitExceeded, get_shared_rate_limiter
+from portfolio_manager.single_flight import SingleFlight
+from portfolio_manager.market_data_provider import MarketDataProvider, get_default_provider
+
+# Shared by every fetcher so identical concurrent requests reach the provider once
+_history_flight = SingleFlight("history")
 
 
 class DataFetcher:
-    """Class for fetching stock price data with rate limiting and caching."""
+    """
+    Class for fetching stock price data with rate limiting and caching.
+
+    Daily bars (``interval="1d"``) are cached in the range-aware PriceStore; intraday
+    bars (e.g. ``"5m"``) in the append-only IntradayStore, where polling only fetches the
+    bars completed since the last stored one.
+    """
 
-    # Rate limit parameters (e.g., max requests per minute)
-    RATE_LIMIT_TIME = 60  # Time window in seconds
-    MAX_REQUESTS = 10  # Max number of requests in the given time window
+    BATCH_SIZE = 50  # Max number of tickers per bulk download request
+    DAILY = "1d"
 
-    def __init__(self, base_dir: str, cache_dir: str = "data/sys_file/cache_dir/"):
+    def __init__(
+        self,
+        base_dir: str,
+        cache_dir: str = "data/sys_file/cache_dir/",
+        rate_limiter: Optional[RateLimiter] = None,
+        blocking: bool = True,
+        provider: Optional[MarketDataProvider] = None,
+        cache_manager: Optional[CacheManager] = None,
+        negative_cache: Optional[NegativeCache] = None,
+    ):
         """
         Initialize the DataFetcher instance.
 
         Args:
             cache_dir (str): Directory to store cache files.
+            rate_limiter (Optional[RateLimiter]): Limiter for upstream requests (defaults to the shared one).
+            blocking (bool): Wait for a rate-limit token instead of raising ``RateLimitExceeded``.
+            provider (Optional[MarketDataProvider]): Upstream data source (defaults to the shared one).
+            cache_manager (Optional[CacheManager]): Byte-budget manager for ``cache_dir``
+                (defaults to the shared manager for that directory).
+            negative_cache (Optional[NegativeCache]): Known-missing markers for ranges that
+                returned no rows (defaults to the shared one).
         """
         self.cache_dir = cache_dir
         self.file_manager = FileManager(base_dir=base_dir)
         self.file_manager.ensure_directory_exists(self.cache_dir)
+        self.cache_manager = cache_manager or get_cache_manager(self.cache_dir)
+        self.price_store = get_price_store(
+            os.path.join(self.cache_dir, "store", ""),
+            legacy_dir=self.cache_dir,
+            cache_manager=self.cache_manager,
+        )
+        self.intraday_store = IntradayStore(
+            store_dir=os.path.join(self.cache_dir, "intraday", ""),
+            cache_manager=self.cache_manager,
+            freshness_policy=self.price_store.freshness_policy,
+        )
         self.logger = Logger("DataFetcher")
-        self.request_count = 0
-        self.start_time = time.time()
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.blocking = blocking
+        self.provider = provider or get_default_provider()
+        self.negative_cache = negative_cache or get_negative_cache()
 
     def _check_rate_limit(self):
         """
-        Check and enforce the rate limit.
-        Delays execution if the rate limit is exceeded.
+        Take a token from the shared rate limiter.
+
+        Blocking fetchers wait for the token; non-blocking fetchers raise instead so the
+        caller can report a retry time without tying up its thread.
+
+        Raises:
+            RateLimitExceeded: If the fetcher is non-blocking and no token is available.
+        """
+        if self.blocking:
+            self.rate_limiter.acquire()
+            return
+        wait_time = self.rate_limiter.try_acquire()
+        if wait_time > 0:
+            self.logger.log_warning(f"Rate limit exceeded. Retry after {wait_time:.2f} seconds.")
+            raise RateLimitExceeded(wait_time)
+
+    def _request_history(self, ticker: str, start_date, end_date: str, interval: str = DAILY) -> pd.DataFrame:
+        """Request one range of bars for a ticker from the market data provider."""
+        return self.provider.history(ticker, start_date, end_date, interval)
+
+    def _request_history_many(self, tickers: List[str], start_date, end_date: str,
+                              interval: str = DAILY) -> Dict[str, pd.DataFrame]:
+        """Request one range of bars for several tickers (at most ``BATCH_SIZE``) in one provider call."""
+        return self.provider.history_many(tickers, start_date, end_date, interval)
+
+    def _download(self, ticker: str, start_date, end_date: str, interval: str = DAILY) -> pd.DataFrame:
+        """Rate-limited ``_request_history``."""
+        self._check_rate_limit()
+        return self._request_history(ticker, start_date, end_date, interval)
+
+    def _download_many(self, tickers: List[str], start_date, end_date: str,
+                       interval: str = DAILY) -> Dict[str, pd.DataFrame]:
+        """Rate-limited ``_request_history_many``."""
+        self._check_rate_limit()
+        return self._request_history_many(tickers, start_date, end_date, interval)
+
+    def _missing_ranges(self, ticker: str, start_date: str, end_date: str, interval: str = DAILY) -> List[tuple]:
+        """
+        Return the ranges still to fetch for a ticker, skipping ranges known to be empty.
+
+        For intraday intervals this is at most one range, starting at the first bar not
+        yet stored.
+        """
+        if interval != self.DAILY:
+            return self.intraday_store.missing_ranges(ticker, interval, start_date, end_date)
+        return [
+            gap for gap in self.price_store.missing_ranges(ticker, start_date, end_date)
+            if not self.negative_cache.is_known_missing(("history", ticker, *gap))
+        ]
+
+    def _store_fetched(self, ticker: str, data: Optional[pd.DataFrame], start_date, end_date: str,
+                       interval: str = DAILY) -> None:
+        """
+        Merge fetched rows into the price store, or append intraday bars to their segments.
+
+        ``None`` means the provider did not answer for the ticker (e.g. it failed within a
+        bulk download); nothing is stored, so the range is fetched again next time. Only an
+        empty daily answer for a span without exchange sessions (weekends, holidays) of a
+        ticker that already has stored coverage is stored as covered. Any other empty answer
+        (unknown symbol, range before its listing, or an error the provider returned as an
+        empty frame) gets a short-lived known-missing marker, so the range is retried once
+        the marker expires.
+        """
+        if data is None:
+            self.logger.log_warning(f"No answer for {ticker} {start_date} to {end_date}; leaving the range uncovered.")
+            return
+        if interval != self.DAILY:
+            self.intraday_store.append(ticker, interval, data, start_date, end_date)
+            return
+        if data.empty and (self.price_store.freshness_policy.has_sessions(start_date, end_date)
+                           or not self.price_store.covered_ranges(ticker)):
+            self.logger.log_warning(f"No rows for {ticker} {start_date} to {end_date}; marking as known missing.")
+            self.negative_cache.mark_missing(("history", ticker, start_date, end_date))
+            return
+        self.price_store.merge(ticker, data, start_date, end_date)
+
+    def _plan_batches(self, tickers: List[str], start_date: str, end_date: str,
+                      interval: str = DAILY) -> List[Tuple[str, str, List[str]]]:
+        """
+        Group the tickers' missing date ranges into bulk download batches.
+
+        Tickers missing the same gap share a batch; batches hold at most ``BATCH_SIZE`` tickers.
+
+        Returns:
+            List[Tuple[str, str, List[str]]]: ``(gap_start, gap_end, tickers)`` per batch.
         """
-        self.request_count += 1
-        elapsed_time = time.time() - self.start_time
-
-        if elapsed_time > self.RATE_LIMIT_TIME:
-            # Reset the timer and request count if the time window has passed
-            self.start_time = time.time()
-            self.request_count = 1
-
-        elif self.request_count > self.MAX_REQUESTS:
-            # Calculate the time to wait before making the next request
-            wait_time = self.RATE_LIMIT_TIME - elapsed_time
-            self.logger.log_info(f"Rate limit exceeded. Waiting {wait_time:.2f} seconds.")
-            time.sleep(wait_time)
-            self.start_time = time.time()
-            self.request_count = 1
-
-    def fetch_stock_data(self, ticker: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        pending = {}
+        for ticker in tickers:
+            for gap in self._missing_ranges(ticker, start_date, end_date, interval):
+                pending.setdefault(gap, []).append(ticker)
+
+        missed = {ticker for gap_tickers in pending.values() for ticker in gap_tickers}
+        for ticker in tickers:
+            if ticker in missed:
+                self.cache_manager.record_miss()
+            else:
+                self.cache_manager.record_hit()
+
+        batches = []
+        for (gap_start, gap_end), gap_tickers in pending.items():
+            for i in range(0, len(gap_tickers), self.BATCH_SIZE):
+                batches.append((gap_start, gap_end, gap_tickers[i:i + self.BATCH_SIZE]))
+        return batches
+
+    def _load_range(self, ticker: str, start_date: str, end_date: str, columns: Optional[List[str]] = None,
+                    interval: str = DAILY) -> pd.DataFrame:
+        """Load a ticker's stored bars for a range from the store matching the interval."""
+        if interval != self.DAILY:
+            return self.intraday_store.load_range(ticker, interval, start_date, end_date, columns)
+        return self.price_store.load_range(ticker, start_date, end_date, columns)
+
+    def _load_results(self, tickers: List[str], start_date: str, end_date: str,
+                      columns: Optional[List[str]] = None, interval: str = DAILY) -> Dict[str, Optional[pd.DataFrame]]:
+        """Slice every ticker's stored rows (optionally only some columns) to the requested range."""
+        results = {}
+        for ticker in tickers:
+            try:
+                data = self._load_range(ticker, start_date, end_date, columns, interval)
+            except Exception as e:
+                self.logger.log_error(f"Error loading stored data for {ticker}: {e}")
+                data = pd.DataFrame()
+            if data.empty:
+                self.logger.log_warning(f"No data found for ticker '{ticker}' from {start_date} to {end_date}.")
+                results[ticker] = None
+            else:
+                results[ticker] = data.reset_index()
+        return results
+
+    def fetch_stock_data(self, ticker: str, start_date: str, end_date: str,
+                         columns: Optional[List[str]] = None, interval: str = DAILY) -> Optional[pd.DataFrame]:
         """
-        Fetch historical stock data from Yahoo Finance with caching and rate limiting.
+        Fetch historical stock data from the provider with caching and rate limiting.
+
+        Only the parts of the range that are not already held in the ticker's price store
+        are downloaded; the result is sliced from the merged history. Concurrent requests
+        for the same ticker and range share a single fetch.
 
         Args:
             ticker (str): Stock ticker symbol.
             start_date (str): Start date in YYYY-MM-DD format.
             end_date (str): End date in YYYY-MM-DD format.
+            columns (Optional[List[str]]): Price columns to load, e.g. ``["Close"]`` (None for all).
+            interval (str): Bar interval, "1d" or an intraday interval such as "1m", "5m", "15m" or "1h".
 
         Returns:
             Optional[pd.DataFrame]: DataFrame containing stock price data, or None if an error occurs.
         """
-        try:
-            # Generate cache file path
-            cache_file = os.path.join(self.cache_dir, f"{ticker}_{start_date}_{end_date}.pkl")
+        ticker = ticker.strip().upper()
+        key = (ticker, start_date, end_date, tuple(columns or ()), interval)
+        data, shared = _history_flight.do(key, self._fetch_stock_data, ticker, start_date, end_date, columns, interval)
+        return data.copy() if shared and data is not None else data
 
-            # Check if data is already cached
-            if os.path.isfile(cache_file):
-                self.logger.log_info(f"Cache hit: Loaded data for {ticker} from {cache_file}")
-                return pd.read_pickle(cache_file)
+    def _fetch_stock_data(self, ticker: str, start_date: str, end_date: str,
+                          columns: Optional[List[str]] = None, interval: str = DAILY) -> Optional[pd.DataFrame]:
+        """Resolve one ``fetch_stock_data`` request against the price store and provider."""
+        try:
+            gaps = self._missing_ranges(ticker, start_date, end_date, interval)
 
-            # If data is not cached, fetch from Yahoo Finance
-            self.logger.log_info(f"Cache miss: Fetching data for {ticker} from Yahoo Finance...")
-            self._check_rate_limit()
+            if not gaps:
+                self.cache_manager.record_hit()
+                self.logger.log_info(f"Cache hit: Serving {ticker} {start_date} to {end_date} from the price store")
+            else:
+                self.cache_manager.record_miss()
+            for gap_start, gap_end in gaps:
+                self.logger.log_info(
+                    f"Cache miss: Fetching data for {ticker} {gap_start} to {gap_end} from the provider..."
+                )
+                data = self._download(ticker, gap_start, gap_end, interval)
+                self._store_fetched(ticker, data, gap_start, gap_end, interval)
 
-            stock = yf.Ticker(ticker)
-            data = stock.history(start=start_date, end=end_date)
+            data = self._load_range(ticker, start_date, end_date, columns, interval)
 
             if data.empty:
                 self.logger.log_warning(f"No data found for ticker '{ticker}' from {start_date} to {end_date}.")
                 return None
 
-            # Save data to cache
-            pd.to_pickle(data, cache_file)
-            self.logger.log_info(f"Data for {ticker} cached at {cache_file}")
-
             return data.reset_index()
 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             self.logger.log_error(f"Error fetching data for {ticker}: {e}")
             return None
+
+    def fetch_many(self, tickers: List[str], start_date: str, end_date: str,
+                   interval: str = DAILY) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch historical stock data for several tickers using bulk downloads.
+
+        Tickers missing the same date range are downloaded together in chunks of
+        ``BATCH_SIZE``, each chunk costing a single rate-limited request. Every ticker's
+        rows are merged into its own price store entry.
+
+        Args:
+            tickers (List[str]): Stock ticker symbols.
+            start_date (str): Start date in YYYY-MM-DD format.
+            end_date (str): End date in YYYY-MM-DD format.
+            interval (str): Bar interval, "1d" or an intraday interval such as "5m".
+
+        Returns:
+            Dict[str, Optional[pd.DataFrame]]: Price data per normalized (upper-case) ticker, or
+                None where no data is available.
+        """
+        tickers = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers))
+        for gap_start, gap_end, chunk in self._plan_batches(tickers, start_date, end_date, interval):
+            self.logger.log_info(
+                f"Cache miss: Bulk fetching {len(chunk)} tickers {gap_start} to {gap_end} from the provider..."
+            )
+            try:
+                frames = self._download_many(chunk, gap_start, gap_end, interval)
+            except RateLimitExceeded:
+                raise
+            except Exception as e:
+                self.logger.log_error(f"Error bulk fetching {chunk}: {e}")
+                continue
+            for ticker in chunk:
+                self._store_fetched(ticker, frames.get(ticker), gap_start, gap_end, interval)
+
+        return self._load_results(tickers, start_date, end_date, interval=interval)
@@ -1,5 +1,18 @@
-import yfinance as yf
 import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from portfolio_manager.single_flight import SingleFlight
+from portfolio_manager.quote_service import get_quote_service
+from file_manager.negative_cache import get_negative_cache
+from file_manager.fundamentals_cache import get_fundamentals_cache
+
+# Concurrent lookups of the same ticker share one `.info` request
+_ratios_flight = SingleFlight("financial_ratios")
 
 class FundamentalAnalysis:
     """
@@ -7,8 +20,13 @@ class FundamentalAnalysis:
     
     Methods:
     - get_financial_ratios: Fetch and return key financial ratios for a given stock ticker.
+    - get_financial_ratios_many: The same for several tickers, fetching cache misses concurrently.
+
+    Ratios are served from the persistent fundamentals cache while fresh.
     """
 
+    MAX_WORKERS = 8  # Max concurrent `.info` requests in get_financial_ratios_many
+
     def __init__(self):
         self.logger = logging.getLogger("FundamentalAnalysis")
         logging.basicConfig(level=logging.INFO)
@@ -24,13 +42,60 @@ class FundamentalAnalysis:
         Returns:
             dict: Dictionary of financial ratios or error message if unable to fetch.
         """
+        ticker = ticker.strip().upper()
+        cached = get_fundamentals_cache().get(ticker)
+        if cached is not None:
+            return cached
+        return FundamentalAnalysis._fetch_shared(ticker)
+
+    @staticmethod
+    def get_financial_ratios_many(tickers: List[str]) -> Dict[str, dict]:
+        """
+        Fetch and return fundamental financial ratios for several stocks.
+
+        Cached tickers are answered immediately; the misses are fetched concurrently on
+        at most ``MAX_WORKERS`` threads.
+
+        Args:
+            tickers (List[str]): Stock ticker symbols.
+
+        Returns:
+            Dict[str, dict]: Financial ratios (or error message) per ticker.
+        """
+        symbols = {ticker: ticker.strip().upper() for ticker in tickers}
+        cache = get_fundamentals_cache()
+        found = {symbol: cache.get(symbol) for symbol in dict.fromkeys(symbols.values())}
+        misses = [symbol for symbol, ratios in found.items() if ratios is None]
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(FundamentalAnalysis.MAX_WORKERS, len(misses))) as executor:
+                found.update(zip(misses, executor.map(FundamentalAnalysis._fetch_shared, misses)))
+        return {ticker: found[symbol] for ticker, symbol in symbols.items()}
+
+    @staticmethod
+    def _fetch_shared(ticker: str) -> dict:
+        """Fetch ratios for a cache miss, sharing the request with concurrent lookups of the ticker."""
+        ticker = ticker.strip().upper()
+        ratios, shared = _ratios_flight.do(ticker, FundamentalAnalysis._fetch_financial_ratios, ticker)
+        return dict(ratios) if shared else ratios
+
+    @staticmethod
+    def is_cached(ticker: str) -> bool:
+        """Return True if fresh ratios for a ticker are cached."""
+        return get_fundamentals_cache().is_cached(ticker.strip().upper())
+
+    @staticmethod
+    def _fetch_financial_ratios(ticker: str) -> dict:
+        """Fetch the financial ratios for one ``get_financial_ratios`` request (``ticker`` is normalized)."""
+        negative_cache = get_negative_cache()
+        if negative_cache.is_known_missing(("ratios", ticker)):
+            return {"Error": f"Invalid ticker symbol or data unavailable for {ticker}."}
         try:
             # Fetch stock data
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = get_quote_service().get(ticker)
             
             # Check if 'info' contains valid data
             if not info or "symbol" not in info or info["symbol"] != ticker:
+                negative_cache.mark_missing(("ratios", ticker))
                 return {"Error": f"Invalid ticker symbol or data unavailable for {ticker}."}
 
             # Extract key financial ratios
@@ -63,7 +128,8 @@ class FundamentalAnalysis:
                     else "N/A"
                 ),
             }
-            
+
+            get_fundamentals_cache().put(ticker, ratios)
             return ratios
 
         except Exception as e:
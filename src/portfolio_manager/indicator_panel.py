@@ -0,0 +1,492 @@
+from typing import Dict, Optional, Union
+import numpy as np
+import pandas as pd
+
+Panel = Union[pd.DataFrame, np.ndarray]
+
+
+class _EWMStep:
+    """
+    One row-at-a-time step of ``ewm(alpha=alpha, adjust=False).mean()`` for every column.
+
+    Kernels that need several averages (MACD's three, ADX's four) advance them together
+    in a single pass over the dates.
+    """
+
+    def __init__(self, alpha: float, width: int):
+        self.alpha = alpha
+        self.decay = 1.0 - alpha
+        self.weighted = np.full(width, np.nan)
+        self.old_weight = np.ones(width)
+
+    def __call__(self, current: np.ndarray) -> np.ndarray:
+        observed = ~np.isnan(current)
+        started = ~np.isnan(self.weighted)
+        np.multiply(self.old_weight, self.decay, out=self.old_weight, where=started)
+        blend = started & observed
+        blended = (self.old_weight * self.weighted + self.alpha * current) / (self.old_weight + self.alpha)
+        np.copyto(self.weighted, blended, where=blend & (self.weighted != current))
+        np.copyto(self.weighted, current, where=observed & ~started)
+        self.old_weight[blend] = 1.0
+        return self.weighted
+
+
+class IndicatorPanel:
+    """
+    Technical indicators for many tickers at once.
+
+    A panel is a 2D array of closing prices, one row per date and one column per ticker
+    (a DataFrame or a NumPy array; missing prices are NaN). Every indicator runs as
+    NumPy operations over whole rows or prefix sums, so the cost per ticker is a few array
+    elements instead of a pandas call. Results match the single-ticker functions:
+
+    - rsi: ``TechnicalAnalysis.calculate_rsi``
+    - macd: ``TechnicalAnalysis.calculate_macd``
+    - moving_average: ``MetricsCalculator.calculate_moving_average``
+    - volatility: ``MetricsCalculator.calculate_volatility``
+    - bollinger_bands, atr, stochastic, obv, vwap, adx: the ``TechnicalAnalysis`` functions of the same name
+
+    Each indicator is one kernel: window statistics share a single set of prefix sums,
+    and recursive averages advance together in one pass over the dates.
+
+    DataFrame inputs return DataFrames with the same index and columns; arrays return arrays.
+    """
+
+    DATE_COLUMNS = ("Date", "Datetime")
+
+    @staticmethod
+    def with_date_index(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Index a price frame by its dates.
+
+        ``DataFetcher`` returns frames with the dates in a ``Date`` (daily) or ``Datetime``
+        (intraday) column; frames already indexed by date are returned unchanged.
+
+        Raises:
+            ValueError: If the frame has neither a date column nor a DatetimeIndex.
+        """
+        if isinstance(frame.index, pd.DatetimeIndex):
+            return frame
+        for column in IndicatorPanel.DATE_COLUMNS:
+            if column in frame.columns:
+                return frame.set_index(pd.DatetimeIndex(frame[column], name=column)).drop(columns=column)
+        raise ValueError("Price frame has no 'Date'/'Datetime' column or DatetimeIndex.")
+
+    @staticmethod
+    def from_frames(frames: Dict[str, Optional[pd.DataFrame]], column: str = "Close") -> pd.DataFrame:
+        """
+        Build a panel from per-ticker price frames, e.g. the result of ``DataFetcher.fetch_many``.
+
+        Each frame is aligned on its dates (see ``with_date_index``), never on row position.
+
+        Args:
+            frames (Dict[str, Optional[pd.DataFrame]]): Price history per ticker.
+            column (str): Column to take from each frame.
+
+        Returns:
+            pd.DataFrame: Dates × tickers panel on the union of the dates.
+        """
+        columns = {ticker: IndicatorPanel.with_date_index(frame)[column] for ticker, frame in frames.items()
+                   if frame is not None and not frame.empty and column in frame}
+        if not columns:
+            return pd.DataFrame()
+        return pd.DataFrame(columns).sort_index()
+
+    @staticmethod
+    def _values(panel: Panel) -> np.ndarray:
+        values = np.ascontiguousarray(panel, dtype="f8")
+        if values.ndim == 1:
+            values = values[:, None]
+        if values.ndim != 2:
+            raise ValueError("Panel must be a 2D dates × tickers array.")
+        return values
+
+    @staticmethod
+    def _wrap(panel: Panel, values: np.ndarray) -> Panel:
+        if isinstance(panel, pd.DataFrame):
+            return pd.DataFrame(values, index=panel.index, columns=panel.columns)
+        return values
+
+    @staticmethod
+    def _window_diff(prefix: np.ndarray, window: int) -> np.ndarray:
+        """Turn prefix sums into trailing window sums in place."""
+        prefix[window:] -= prefix[:-window].copy()
+        return prefix
+
+    @staticmethod
+    def _rolling_sums(values: np.ndarray, window: int, center: np.ndarray, squares: bool = True) -> tuple:
+        """
+        Return the rolling count, sum and sum of squares of ``values - center`` per column.
+
+        Each window sum is the difference of two prefix sums; NaNs count as zero and are
+        left out of the count.
+        """
+        valid = ~np.isnan(values)
+        if valid.all():
+            shifted = values - center
+            count = np.minimum(np.arange(1, len(values) + 1, dtype="f8"), window)[:, None]
+        else:
+            shifted = np.where(valid, values - center, 0.0)
+            count = IndicatorPanel._window_diff(np.cumsum(valid, axis=0, dtype="f8"), window)
+        total = IndicatorPanel._window_diff(np.cumsum(shifted, axis=0), window)
+        total_sq = IndicatorPanel._window_diff(np.cumsum(shifted * shifted, axis=0), window) if squares else None
+        return count, total, total_sq
+
+    @staticmethod
+    def _column_center(values: np.ndarray) -> np.ndarray:
+        """Per-column mean, subtracted before summing to limit cancellation in long prefix sums."""
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        total = np.where(valid, values, 0.0).sum(axis=0)
+        return np.divide(total, count, out=np.zeros(values.shape[1]), where=count > 0)
+
+    @staticmethod
+    def _constant_windows(values: np.ndarray, window: int) -> np.ndarray:
+        """
+        Mark the windows holding one repeated value, like pandas' same-value check.
+
+        Their mean is that value and their deviation exactly zero, rather than the rounding
+        residue left by differencing prefix sums.
+        """
+        equal = np.zeros(values.shape, dtype=bool)
+        equal[1:] = values[1:] == values[:-1]
+        steps = np.cumsum(equal, axis=0)
+        run = steps - np.maximum.accumulate(np.where(equal, 0, steps), axis=0)
+        length = np.minimum(np.arange(1, len(values) + 1), window)
+        return run >= (length - 1)[:, None]
+
+    @staticmethod
+    def _rolling_mean(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+        center = IndicatorPanel._column_center(values)
+        count, total, _ = IndicatorPanel._rolling_sums(values, window, center, squares=False)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count + center
+        mean = np.where(IndicatorPanel._constant_windows(values, window), values, mean)
+        return np.where(count >= max(min_periods, 1), mean, np.nan)
+
+    @staticmethod
+    def _rolling_mean_std(values: np.ndarray, window: int, min_periods: int) -> tuple:
+        """Rolling mean and sample standard deviation from one set of prefix sums."""
+        center = IndicatorPanel._column_center(values)
+        count, total, total_sq = IndicatorPanel._rolling_sums(values, window, center)
+        constant = IndicatorPanel._constant_windows(values, window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(constant, values, total / count + center)
+            variance = np.maximum(total_sq - total * total / count, 0.0) / (count - 1)
+        variance[constant] = 0.0
+        return (np.where(count >= max(min_periods, 1), mean, np.nan),
+                np.where(count >= max(min_periods, 2), np.sqrt(variance), np.nan))
+
+    @staticmethod
+    def _rolling_std(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+        return IndicatorPanel._rolling_mean_std(values, window, min_periods)[1]
+
+    @staticmethod
+    def _rolling_extreme(values: np.ndarray, window: int, reducer) -> np.ndarray:
+        """Rolling min or max over full windows (NaN if the window holds a NaN)."""
+        out = np.full_like(values, np.nan)
+        if len(values) >= window:
+            windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+            reducer(windows, axis=-1, out=out[window - 1:])
+        return out
+
+    @staticmethod
+    def _ewm(values: np.ndarray, span: int) -> np.ndarray:
+        """
+        Exponentially weighted mean with ``adjust=False``, like ``Series.ewm(span=span, adjust=False)``.
+
+        The recursion runs over the dates and is vectorized across the tickers. Each column
+        starts at its first price; gaps decay the previous weight as pandas does.
+        """
+        step = _EWMStep(2.0 / (span + 1.0), values.shape[1])
+        out = np.empty_like(values)
+        for i in range(len(values)):
+            out[i] = step(values[i])
+        return out
+
+    @staticmethod
+    def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        """True range; the first row (no previous close) is the high-low range."""
+        tr = high - low
+        prev_close = close[:-1]
+        np.fmax(tr[1:], np.abs(high[1:] - prev_close), out=tr[1:])
+        np.fmax(tr[1:], np.abs(low[1:] - prev_close), out=tr[1:])
+        return tr
+
+    @staticmethod
+    def moving_average(panel: Panel, window: int) -> Panel:
+        """
+        Calculate the moving average of every column.
+
+        Args:
+            panel (Panel): Dates × tickers closing prices.
+            window (int): Rolling window size.
+
+        Returns:
+            Panel: Moving averages (NaN until ``window`` prices are available).
+        """
+        values = IndicatorPanel._values(panel)
+        return IndicatorPanel._wrap(panel, IndicatorPanel._rolling_mean(values, window, window))
+
+    @staticmethod
+    def volatility(panel: Panel, window: int) -> Panel:
+        """
+        Calculate the rolling standard deviation of every column.
+
+        Args:
+            panel (Panel): Dates × tickers closing prices.
+            window (int): Rolling window size.
+
+        Returns:
+            Panel: Rolling standard deviations (sample, ``ddof=1``).
+        """
+        values = IndicatorPanel._values(panel)
+        return IndicatorPanel._wrap(panel, IndicatorPanel._rolling_std(values, window, window))
+
+    @staticmethod
+    def rsi(panel: Panel, window: int = 14) -> Panel:
+        """
+        Calculate the Relative Strength Index of every column.
+
+        Args:
+            panel (Panel): Dates × tickers closing prices.
+            window (int): Period for RSI calculation (default: 14).
+
+        Returns:
+            Panel: RSI values.
+        """
+        values = IndicatorPanel._values(panel)
+        delta = np.full_like(values, np.nan)
+        delta[1:] = values[1:] - values[:-1]
+        with np.errstate(invalid="ignore"):
+            gain = np.where(delta > 0, delta, 0.0)
+            loss = np.where(delta < 0, -delta, 0.0)
+        avg_gain = IndicatorPanel._rolling_mean(gain, window, 1)
+        avg_loss = IndicatorPanel._rolling_mean(loss, window, 1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        return IndicatorPanel._wrap(panel, rsi)
+
+    @staticmethod
+    def macd(panel: Panel, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> tuple:
+        """
+        Calculate the MACD line and Signal line of every column.
+
+        Args:
+            panel (Panel): Dates × tickers closing prices.
+            fast_period (int): Short-term EMA period (default: 12).
+            slow_period (int): Long-term EMA period (default: 26).
+            signal_period (int): Signal line EMA period (default: 9).
+
+        Returns:
+            tuple: MACD line and Signal line panels.
+        """
+        values = IndicatorPanel._values(panel)
+        width = values.shape[1]
+        fast = _EWMStep(2.0 / (fast_period + 1.0), width)
+        slow = _EWMStep(2.0 / (slow_period + 1.0), width)
+        smooth = _EWMStep(2.0 / (signal_period + 1.0), width)
+        macd = np.empty_like(values)
+        signal = np.empty_like(values)
+        for i in range(len(values)):
+            np.subtract(fast(values[i]), slow(values[i]), out=macd[i])
+            signal[i] = smooth(macd[i])
+        return IndicatorPanel._wrap(panel, macd), IndicatorPanel._wrap(panel, signal)
+
+    @staticmethod
+    def bollinger_bands(panel: Panel, window: int = 20, num_std: float = 2.0) -> tuple:
+        """
+        Calculate the Bollinger Bands of every column.
+
+        Args:
+            panel (Panel): Dates × tickers closing prices.
+            window (int): Rolling window size (default: 20).
+            num_std (float): Band width in rolling standard deviations (default: 2).
+
+        Returns:
+            tuple: Middle, upper and lower band panels.
+        """
+        values = IndicatorPanel._values(panel)
+        middle, std = IndicatorPanel._rolling_mean_std(values, window, window)
+        std *= num_std
+        return (IndicatorPanel._wrap(panel, middle), IndicatorPanel._wrap(panel, middle + std),
+                IndicatorPanel._wrap(panel, middle - std))
+
+    @staticmethod
+    def atr(high: Panel, low: Panel, close: Panel, window: int = 14) -> Panel:
+        """
+        Calculate the Average True Range of every column with Wilder's smoothing.
+
+        Args:
+            high (Panel): Dates × tickers high prices.
+            low (Panel): Dates × tickers low prices.
+            close (Panel): Dates × tickers closing prices.
+            window (int): Smoothing period (default: 14).
+
+        Returns:
+            Panel: ATR values.
+        """
+        values = IndicatorPanel._values
+        tr = IndicatorPanel._true_range(values(high), values(low), values(close))
+        step = _EWMStep(1.0 / window, tr.shape[1])
+        for i in range(len(tr)):
+            tr[i] = step(tr[i])
+        return IndicatorPanel._wrap(close, tr)
+
+    @staticmethod
+    def stochastic(high: Panel, low: Panel, close: Panel, k_window: int = 14, d_window: int = 3) -> tuple:
+        """
+        Calculate the stochastic oscillator of every column.
+
+        Args:
+            high (Panel): Dates × tickers high prices.
+            low (Panel): Dates × tickers low prices.
+            close (Panel): Dates × tickers closing prices.
+            k_window (int): Look-back period of %K (default: 14).
+            d_window (int): Moving average period of %D (default: 3).
+
+        Returns:
+            tuple: %K and %D panels.
+        """
+        values = IndicatorPanel._values
+        lowest = IndicatorPanel._rolling_extreme(values(low), k_window, np.min)
+        highest = IndicatorPanel._rolling_extreme(values(high), k_window, np.max)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            k = values(close) - lowest
+            k *= 100
+            k /= highest - lowest
+        d = IndicatorPanel._rolling_mean(k, d_window, d_window)
+        return IndicatorPanel._wrap(close, k), IndicatorPanel._wrap(close, d)
+
+    @staticmethod
+    def obv(close: Panel, volume: Panel) -> Panel:
+        """
+        Calculate the On-Balance Volume of every column.
+
+        Args:
+            close (Panel): Dates × tickers closing prices.
+            volume (Panel): Dates × tickers volumes.
+
+        Returns:
+            Panel: OBV values (NaN where the volume is missing).
+        """
+        values = IndicatorPanel._values(close)
+        flow = np.zeros_like(values)
+        np.sign(values[1:] - values[:-1], out=flow[1:])
+        flow[np.isnan(flow)] = 0.0
+        flow *= IndicatorPanel._values(volume)
+        missing = np.isnan(flow)
+        flow[missing] = 0.0
+        np.cumsum(flow, axis=0, out=flow)
+        flow[missing] = np.nan
+        return IndicatorPanel._wrap(close, flow)
+
+    @staticmethod
+    def vwap(high: Panel, low: Panel, close: Panel, volume: Panel, sessions: Optional[np.ndarray] = None) -> Panel:
+        """
+        Calculate the Volume-Weighted Average Price of the typical price for every column.
+
+        Args:
+            high (Panel): Dates × tickers high prices.
+            low (Panel): Dates × tickers low prices.
+            close (Panel): Dates × tickers closing prices.
+            volume (Panel): Dates × tickers volumes.
+            sessions (Optional[np.ndarray]): Session label per row (e.g. the trading day);
+                the average restarts whenever it changes. For DataFrames it defaults to the
+                day of the index, like ``TechnicalAnalysis.calculate_vwap``.
+
+        Returns:
+            Panel: VWAP values (NaN where a price or the volume is missing; missing bars
+            are skipped by the running sums).
+        """
+        values = IndicatorPanel._values
+        volume_values = values(volume)
+        weighted = values(high) + values(low)
+        weighted += values(close)
+        weighted /= 3
+        weighted *= volume_values
+        if sessions is None and isinstance(close, pd.DataFrame):
+            sessions = np.asarray(pd.DatetimeIndex(close.index).normalize(), dtype="datetime64[ns]")
+        missing = np.isnan(weighted)
+        cum_weighted = np.cumsum(np.where(missing, 0.0, weighted), axis=0)
+        cum_volume = np.cumsum(np.where(np.isnan(volume_values), 0.0, volume_values), axis=0)
+        if sessions is not None:
+            sessions = np.asarray(sessions)
+            starts = np.flatnonzero(sessions[1:] != sessions[:-1]) + 1
+            session_start = np.zeros(len(sessions), dtype=np.intp)
+            session_start[starts] = starts
+            np.maximum.accumulate(session_start, out=session_start)
+            previous = session_start - 1
+            offset = previous >= 0
+            cum_weighted[offset] -= cum_weighted[previous[offset]]
+            cum_volume[offset] -= cum_volume[previous[offset]]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cum_weighted /= cum_volume
+        cum_weighted[missing] = np.nan
+        return IndicatorPanel._wrap(close, cum_weighted)
+
+    @staticmethod
+    def adx(high: Panel, low: Panel, close: Panel, window: int = 14) -> tuple:
+        """
+        Calculate the Average Directional Index of every column with Wilder's smoothing.
+
+        The true range, both directional movements and the ADX itself are smoothed in a
+        single pass over the dates.
+
+        Args:
+            high (Panel): Dates × tickers high prices.
+            low (Panel): Dates × tickers low prices.
+            close (Panel): Dates × tickers closing prices.
+            window (int): Smoothing period (default: 14).
+
+        Returns:
+            tuple: ADX, +DI and -DI panels.
+        """
+        values = IndicatorPanel._values
+        high_values, low_values = values(high), values(low)
+        tr = IndicatorPanel._true_range(high_values, low_values, values(close))
+        up = np.full_like(high_values, np.nan)
+        down = np.full_like(low_values, np.nan)
+        np.subtract(high_values[1:], high_values[:-1], out=up[1:])
+        np.subtract(low_values[:-1], low_values[1:], out=down[1:])
+        with np.errstate(invalid="ignore"):
+            plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+            minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+
+        alpha, width = 1.0 / window, tr.shape[1]
+        atr, plus, minus, smooth = (_EWMStep(alpha, width) for _ in range(4))
+        adx = np.empty_like(tr)
+        plus_di = np.empty_like(tr)
+        minus_di = np.empty_like(tr)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for i in range(len(tr)):
+                average_range = atr(tr[i])
+                np.divide(100 * plus(plus_dm[i]), average_range, out=plus_di[i])
+                np.divide(100 * minus(minus_dm[i]), average_range, out=minus_di[i])
+                dx = 100 * np.abs(plus_di[i] - minus_di[i]) / (plus_di[i] + minus_di[i])
+                adx[i] = smooth(dx)
+        return (IndicatorPanel._wrap(close, adx), IndicatorPanel._wrap(close, plus_di),
+                IndicatorPanel._wrap(close, minus_di))
+
+    @staticmethod
+    def compute(panel: Panel, moving_avg_window: int = 20, volatility_window: int = 20, rsi_window: int = 14) -> dict:
+        """
+        Calculate every panel indicator in one call.
+
+        Args:
+            panel (Panel): Dates × tickers closing prices.
+            moving_avg_window (int): Moving average window.
+            volatility_window (int): Volatility window.
+            rsi_window (int): RSI period.
+
+        Returns:
+            dict: ``rsi``, ``macd``, ``signal``, ``moving_average`` and ``volatility`` panels.
+        """
+        macd, signal = IndicatorPanel.macd(panel)
+        return {
+            "rsi": IndicatorPanel.rsi(panel, rsi_window),
+            "macd": macd,
+            "signal": signal,
+            "moving_average": IndicatorPanel.moving_average(panel, moving_avg_window),
+            "volatility": IndicatorPanel.volatility(panel, volatility_window),
+        }
@@ -0,0 +1,181 @@
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import pandas as pd
+
+from portfolio_manager.indicator_panel import IndicatorPanel
+
+
+class IndicatorRegistry:
+    """
+    Registry of indicators and the inputs each one is computed from.
+
+    Every node is a function of other nodes; the base nodes are the price columns
+    (``Open``, ``High``, ``Low``, ``Close``, ``Volume``). Nodes operate on dates × tickers
+    panels, so evaluating a batch of tickers computes every node once for all of them.
+    For a request, ``plan`` orders just the nodes the wanted outputs depend on, and
+    ``evaluate`` computes each of them once, sharing intermediates such as the EMAs of
+    MACD or the rolling sums behind the moving average, volatility and Bollinger Bands.
+    Nodes whose name starts with an underscore are intermediates and not offered to callers.
+    """
+
+    BASE_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+    def __init__(self):
+        self._nodes: Dict[str, Tuple[Tuple[str, ...], Callable]] = {}
+
+    def register(self, name: str, inputs: Iterable[str], func: Callable) -> None:
+        """
+        Register an indicator.
+
+        Args:
+            name (str): Indicator name.
+            inputs (Iterable[str]): Names of the base columns or indicators it is computed from.
+            func (Callable): Called with the input panels in order; returns the indicator panel.
+        """
+        if name in self.BASE_COLUMNS:
+            raise ValueError(f"'{name}' is a base price column.")
+        self._nodes[name] = (tuple(inputs), func)
+
+    def available(self) -> List[str]:
+        """Return the names of the indicators callers can request."""
+        return sorted(name for name in self._nodes if not name.startswith("_"))
+
+    def plan(self, outputs: Iterable[str]) -> List[str]:
+        """
+        Order the nodes needed for ``outputs`` so every node follows its inputs.
+
+        Args:
+            outputs (Iterable[str]): Requested indicator names.
+
+        Returns:
+            List[str]: Base columns and indicators to compute, in evaluation order.
+
+        Raises:
+            ValueError: If an output is unknown or the dependencies form a cycle.
+        """
+        order, visiting, done = [], set(), set()
+
+        def visit(name: str):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Indicator dependency cycle at '{name}'.")
+            if name not in self._nodes and name not in self.BASE_COLUMNS:
+                raise ValueError(f"Unknown indicator '{name}'. Available: {', '.join(self.available())}.")
+            visiting.add(name)
+            for dependency in self._nodes.get(name, ((), None))[0]:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for output in outputs:
+            if output.startswith("_"):
+                raise ValueError(f"Unknown indicator '{output}'. Available: {', '.join(self.available())}.")
+            visit(output)
+        return order
+
+    def required_columns(self, outputs: Iterable[str]) -> List[str]:
+        """Return the price columns the outputs are computed from."""
+        return [name for name in self.plan(outputs) if name in self.BASE_COLUMNS]
+
+    def evaluate(self, panels: Dict[str, pd.DataFrame], outputs: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Compute the requested indicators.
+
+        Args:
+            panels (Dict[str, pd.DataFrame]): Dates × tickers panel per base column.
+            outputs (Iterable[str]): Requested indicator names.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Panel per requested indicator (and nothing else).
+        """
+        outputs = list(dict.fromkeys(outputs))
+        results = {}
+        for name in self.plan(outputs):
+            if name in self.BASE_COLUMNS:
+                if name not in panels:
+                    raise ValueError(f"Missing '{name}' prices for the requested indicators.")
+                results[name] = panels[name]
+            else:
+                inputs, func = self._nodes[name]
+                results[name] = func(*(results[dependency] for dependency in inputs))
+        return {name: results[name] for name in outputs}
+
+    def evaluate_frame(self, frame: pd.DataFrame, outputs: Iterable[str]) -> pd.DataFrame:
+        """
+        Compute the requested indicators for one ticker's price frame, e.g. from ``fetch_stock_data``.
+
+        Args:
+            frame (pd.DataFrame): Price history with a ``Date``/``Datetime`` column or DatetimeIndex.
+            outputs (Iterable[str]): Requested indicator names.
+
+        Returns:
+            pd.DataFrame: Date-indexed frame with one column per requested indicator.
+        """
+        frame = IndicatorPanel.with_date_index(frame)
+        outputs = list(dict.fromkeys(outputs))
+        panels = {column: frame[[column]] for column in self.required_columns(outputs) if column in frame}
+        results = self.evaluate(panels, outputs)
+        return pd.DataFrame({name: results[name].iloc[:, 0] for name in outputs}, index=frame.index)
+
+    def evaluate_frames(self, frames: Dict[str, Optional[pd.DataFrame]], outputs: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Compute the requested indicators for per-ticker price frames, e.g. from ``fetch_many``.
+
+        Only the price columns the plan needs are assembled into panels.
+        """
+        outputs = list(outputs)
+        panels = {column: IndicatorPanel.from_frames(frames, column) for column in self.required_columns(outputs)}
+        return self.evaluate(panels, outputs)
+
+
+def _ewm(span: int) -> Callable:
+    return lambda panel: IndicatorPanel._wrap(panel, IndicatorPanel._ewm(IndicatorPanel._values(panel), span))
+
+
+def _rolling_stats(panel: pd.DataFrame) -> tuple:
+    mean, std = IndicatorPanel._rolling_mean_std(IndicatorPanel._values(panel), 20, 20)
+    return IndicatorPanel._wrap(panel, mean), IndicatorPanel._wrap(panel, std)
+
+
+def _item(index: int) -> Callable:
+    return lambda values: values[index]
+
+
+def _register_defaults(registry: IndicatorRegistry) -> IndicatorRegistry:
+    register = registry.register
+    register("ema12", ["Close"], _ewm(12))
+    register("ema26", ["Close"], _ewm(26))
+    register("macd", ["ema12", "ema26"], lambda fast, slow: fast - slow)
+    register("signal", ["macd"], _ewm(9))
+    register("rsi", ["Close"], IndicatorPanel.rsi)
+    register("_rolling_stats_20", ["Close"], _rolling_stats)
+    register("moving_average", ["_rolling_stats_20"], _item(0))
+    register("volatility", ["_rolling_stats_20"], _item(1))
+    register("bollinger_upper", ["moving_average", "volatility"], lambda mean, std: mean + 2.0 * std)
+    register("bollinger_lower", ["moving_average", "volatility"], lambda mean, std: mean - 2.0 * std)
+    register("atr", ["High", "Low", "Close"], IndicatorPanel.atr)
+    register("_stochastic", ["High", "Low", "Close"], IndicatorPanel.stochastic)
+    register("stochastic_k", ["_stochastic"], _item(0))
+    register("stochastic_d", ["_stochastic"], _item(1))
+    register("obv", ["Close", "Volume"], IndicatorPanel.obv)
+    register("vwap", ["High", "Low", "Close", "Volume"], IndicatorPanel.vwap)
+    register("_adx", ["High", "Low", "Close"], IndicatorPanel.adx)
+    register("adx", ["_adx"], _item(0))
+    register("plus_di", ["_adx"], _item(1))
+    register("minus_di", ["_adx"], _item(2))
+    return registry
+
+
+_default_registry = None
+_default_lock = threading.Lock()
+
+
+def get_indicator_registry() -> IndicatorRegistry:
+    """Return the process-wide registry with the built-in indicators."""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = _register_defaults(IndicatorRegistry())
+        return _default_registry
@@ -0,0 +1,258 @@
+import os
+import sys
+import json
+import time
+import random
+import threading
+from typing import Dict, List, Optional
+import pandas as pd
+import yfinance as yf
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+
+
+class MarketDataProvider:
+    """
+    Interface for the upstream source of prices and company information.
+
+    Methods:
+    - history: OHLCV bars (daily by default) for one ticker over a half-open ``[start, end)``
+      range. ``start`` may be a date string or, for intraday intervals, an exchange-local
+      timestamp to resume from.
+    - history_many: The same for several tickers, ideally in one upstream request. Tickers
+      the upstream did not answer for map to None rather than to an empty frame.
+    - info: Quote and company information for one ticker (the ``yf.Ticker.info`` dict).
+    """
+
+    name = "base"
+
+    def history(self, ticker: str, start_date, end_date: str, interval: str = "1d") -> pd.DataFrame:
+        raise NotImplementedError
+
+    def history_many(self, tickers: List[str], start_date, end_date: str,
+                     interval: str = "1d") -> Dict[str, Optional[pd.DataFrame]]:
+        return {ticker: self.history(ticker, start_date, end_date, interval) for ticker in tickers}
+
+    def info(self, ticker: str) -> dict:
+        raise NotImplementedError
+
+
+class YahooFinanceProvider(MarketDataProvider):
+    """Market data provider backed by yfinance."""
+
+    name = "yahoo"
+
+    def history(self, ticker: str, start_date, end_date: str, interval: str = "1d") -> pd.DataFrame:
+        """
+        Fetch bars for one ticker with ``yf.Ticker.history``.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+            start_date: Start date in YYYY-MM-DD format or exchange-local timestamp (inclusive).
+            end_date (str): End date in YYYY-MM-DD format (exclusive).
+            interval (str): Bar interval, e.g. "1d" or "5m".
+
+        Returns:
+            pd.DataFrame: Date-indexed price rows (possibly empty).
+        """
+        return yf.Ticker(ticker).history(start=start_date, end=end_date, interval=interval)
+
+    def history_many(self, tickers: List[str], start_date, end_date: str,
+                     interval: str = "1d") -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Fetch bars for several tickers with a single ``yf.download`` call.
+
+        ``yf.download`` reports a ticker that failed (unknown symbol, throttling, a dropped
+        connection) as a missing or all-NaN column group, indistinguishable from a range
+        without rows. Such tickers map to None so the caller retries them instead of
+        recording the range as covered. Only a download that answered with no rows at all
+        yields empty frames.
+
+        Args:
+            tickers (List[str]): Stock ticker symbols.
+            start_date: Start date in YYYY-MM-DD format or exchange-local timestamp (inclusive).
+            end_date (str): End date in YYYY-MM-DD format (exclusive).
+            interval (str): Bar interval, e.g. "1d" or "5m".
+
+        Returns:
+            Dict[str, Optional[pd.DataFrame]]: Date-indexed price rows per ticker (possibly
+                empty), or None for tickers missing from the download.
+        """
+        data = yf.download(
+            tickers,
+            start=start_date,
+            end=end_date,
+            interval=interval,
+            group_by="ticker",
+            actions=True,
+            auto_adjust=True,
+            progress=False,
+            threads=True,
+        )
+        if data is None:
+            return {ticker: None for ticker in tickers}
+        if data.empty:
+            return {ticker: pd.DataFrame() for ticker in tickers}
+        frames = {}
+        for ticker in tickers:
+            if ticker not in data.columns.get_level_values(0):
+                frames[ticker] = None
+                continue
+            frame = data[ticker].dropna(how="all")
+            frame.columns.name = None
+            frames[ticker] = frame if not frame.empty else None
+        return frames
+
+    def info(self, ticker: str) -> dict:
+        """Return ``yf.Ticker(ticker).info``."""
+        return yf.Ticker(ticker).info or {}
+
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Market data provider that replays recorded fixtures from a local directory.
+
+    Layout of ``fixture_dir``:
+    - ``history/{ticker}.parquet`` or ``history/{ticker}.csv``: date-indexed daily OHLCV rows.
+    - ``history/{interval}/{ticker}.parquet`` or ``.csv``: intraday bars, e.g. ``history/5m/AAPL.csv``.
+    - ``info/{ticker}.json``: the info dict for the ticker.
+
+    Every call sleeps for ``latency`` seconds (plus up to ``jitter`` seconds) to stand in
+    for upstream round-trips when load-testing or benchmarking without network access.
+    """
+
+    name = "replay"
+
+    def __init__(self, fixture_dir: str, latency: float = 0.0, jitter: float = 0.0):
+        """
+        Initialize the ReplayProvider instance.
+
+        Args:
+            fixture_dir (str): Directory containing the recorded fixtures.
+            latency (float): Artificial delay per call in seconds.
+            jitter (float): Maximum random delay added to ``latency`` in seconds.
+        """
+        self.fixture_dir = fixture_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.logger = Logger("ReplayProvider")
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def _simulate_latency(self):
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _load_history(self, ticker: str, interval: str = "1d") -> pd.DataFrame:
+        """Load (and memoize) the full recorded history for a ticker and interval."""
+        with self._lock:
+            if (ticker, interval) in self._frames:
+                return self._frames[(ticker, interval)]
+        history_dir = os.path.join(self.fixture_dir, "history", *([] if interval == "1d" else [interval]))
+        parquet_file = os.path.join(history_dir, f"{ticker}.parquet")
+        csv_file = os.path.join(history_dir, f"{ticker}.csv")
+        if os.path.isfile(parquet_file):
+            data = pd.read_parquet(parquet_file)
+        elif os.path.isfile(csv_file):
+            data = pd.read_csv(csv_file, index_col=0, parse_dates=True)
+        else:
+            self.logger.log_warning(f"No recorded history for {ticker} in {history_dir}.")
+            data = pd.DataFrame()
+        if not data.empty:
+            data.index = pd.DatetimeIndex(data.index, name="Date" if interval == "1d" else "Datetime")
+        with self._lock:
+            self._frames[(ticker, interval)] = data
+        return data
+
+    @staticmethod
+    def _slice(data: pd.DataFrame, start_date, end_date: str) -> pd.DataFrame:
+        if data.empty:
+            return data
+        index = data.index.tz_localize(None) if data.index.tz is not None else data.index
+        return data[(index >= pd.Timestamp(start_date)) & (index < pd.Timestamp(end_date))]
+
+    def history(self, ticker: str, start_date, end_date: str, interval: str = "1d") -> pd.DataFrame:
+        """Replay recorded bars for one ticker."""
+        self._simulate_latency()
+        return self._slice(self._load_history(ticker, interval), start_date, end_date)
+
+    def history_many(self, tickers: List[str], start_date, end_date: str,
+                     interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """Replay recorded bars for several tickers at the cost of one round-trip."""
+        self._simulate_latency()
+        return {ticker: self._slice(self._load_history(ticker, interval), start_date, end_date) for ticker in tickers}
+
+    def info(self, ticker: str) -> dict:
+        """Replay the recorded info dict for one ticker (empty if none was recorded)."""
+        self._simulate_latency()
+        info_file = os.path.join(self.fixture_dir, "info", f"{ticker}.json")
+        if not os.path.isfile(info_file):
+            return {}
+        with open(info_file, "r") as f:
+            return json.load(f)
+
+    @staticmethod
+    def record(source: MarketDataProvider, fixture_dir: str, tickers: List[str], start_date: str, end_date: str):
+        """
+        Record history and info for tickers from another provider as CSV/JSON fixtures.
+
+        Args:
+            source (MarketDataProvider): Provider to record from.
+            fixture_dir (str): Destination directory.
+            tickers (List[str]): Stock ticker symbols.
+            start_date (str): Start date in YYYY-MM-DD format (inclusive).
+            end_date (str): End date in YYYY-MM-DD format (exclusive).
+        """
+        os.makedirs(os.path.join(fixture_dir, "history"), exist_ok=True)
+        os.makedirs(os.path.join(fixture_dir, "info"), exist_ok=True)
+        for ticker, data in source.history_many(tickers, start_date, end_date).items():
+            data.to_csv(os.path.join(fixture_dir, "history", f"{ticker}.csv"))
+        for ticker in tickers:
+            with open(os.path.join(fixture_dir, "info", f"{ticker}.json"), "w") as f:
+                json.dump(source.info(ticker), f, indent=4, default=str)
+
+
+def create_provider(config: Optional[dict] = None) -> MarketDataProvider:
+    """
+    Build a provider from the ``market_data`` section of config.json.
+
+    Args:
+        config (Optional[dict]): e.g. ``{"provider": "replay", "fixture_dir": "...", "latency_ms": 150}``.
+
+    Returns:
+        MarketDataProvider: The configured provider (yfinance by default).
+    """
+    config = config or {}
+    provider = config.get("provider", YahooFinanceProvider.name)
+    if provider == YahooFinanceProvider.name:
+        return YahooFinanceProvider()
+    if provider == ReplayProvider.name:
+        return ReplayProvider(
+            fixture_dir=config.get("fixture_dir", "data/sys_file/fixtures"),
+            latency=config.get("latency_ms", 0) / 1000,
+            jitter=config.get("jitter_ms", 0) / 1000,
+        )
+    raise ValueError(f"Unknown market data provider: {provider}")
+
+
+_default_provider = None
+_default_lock = threading.Lock()
+
+
+def set_default_provider(provider: MarketDataProvider) -> None:
+    """Replace the provider used by every component that is not given one explicitly."""
+    global _default_provider
+    with _default_lock:
+        _default_provider = provider
+
+
+def get_default_provider() -> MarketDataProvider:
+    """Return the process-wide provider, defaulting to yfinance."""
+    global _default_provider
+    with _default_lock:
+        if _default_provider is None:
+            _default_provider = YahooFinanceProvider()
+        return _default_provider
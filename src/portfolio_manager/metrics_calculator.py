@@ -8,6 +8,7 @@ class MetricsCalculator:
     Metrics Explained:
     - Moving Average: Smooths out stock price data by calculating the average over a rolling window.
     - Volatility: Measures the standard deviation of stock prices over a rolling window.
+    - Rolling Statistics: Moving averages and volatilities for several windows in one pass.
     - Total Revenue: The total value of goods and services sold by a company.
     - Capital Expenditure (CapEx): Total spending on purchasing or maintaining fixed assets.
     - Total Assets: Total value of capital items owned by a company.
@@ -22,6 +23,7 @@ class MetricsCalculator:
     METRICS_EXPLANATION = {
         "calculate_moving_average": "Calculates the rolling average of stock prices over a specified window.",
         "calculate_volatility": "Calculates the standard deviation of stock prices over a rolling window.",
+        "calculate_rolling_statistics": "Calculates moving averages and volatilities for several windows at once.",
         "calculate_price_to_earnings": "Calculates the Price-to-Earnings (P/E) ratio to evaluate stock valuation.",
         "calculate_debt_to_equity_ratio": "Calculates the Debt-to-Equity (D/E) ratio to assess financial leverage.",
         "calculate_return_on_equity": "Calculates Return on Equity (ROE) to measure profitability relative to shareholders' equity.",
@@ -56,6 +58,82 @@ class MetricsCalculator:
         """
         return data['Close'].rolling(window=window).std()
 
+    # Relative rounding error of a window mean or variance above which it is recomputed from the window itself.
+    STABLE_ROUNDING_TOLERANCE = 1e-8
+
+    @staticmethod
+    def calculate_rolling_statistics(data: pd.DataFrame, windows: list) -> tuple:
+        """
+        Calculate moving averages and volatilities for several windows at once.
+
+        The cumulative sums and sums of squares of the closes (centered on their mean) are
+        computed once and every window is derived from them by differencing, so each extra
+        window costs O(n). Where differencing would cancel too many digits (long histories
+        whose prices drift far from the mean, with little movement inside the window),
+        the affected entries are recomputed from their window with a two-pass mean and
+        variance. Values match ``calculate_moving_average`` and ``calculate_volatility``.
+
+        Args:
+            data (pd.DataFrame): Stock data with a 'Close' column.
+            windows (list): Rolling window sizes, e.g. ``[5, 10, 20, 50, 100, 200]``.
+
+        Returns:
+            tuple: Moving averages and volatilities as np.ndarray of shape (dates, windows),
+                one column per window in the given order.
+        """
+        if 'Close' not in data:
+            raise ValueError("Input DataFrame must contain a 'Close' column.")
+        windows = np.asarray(windows, dtype=int)
+        if windows.ndim != 1 or (windows < 1).any():
+            raise ValueError("Windows must be a list of positive integers.")
+
+        values = data['Close'].to_numpy(dtype="f8")
+        n = len(values)
+        valid = ~np.isnan(values)
+        center = values[valid].mean() if valid.any() else 0.0
+        shifted = np.where(valid, values - center, 0.0)
+
+        def prefix(x):
+            out = np.zeros(n + 1)
+            np.cumsum(x, out=out[1:])
+            return out
+
+        count_prefix, sum_prefix, sq_prefix = prefix(valid), prefix(shifted), prefix(shifted * shifted)
+        end = np.arange(1, n + 1)
+        start = np.maximum(end[:, None] - windows[None, :], 0)
+        count = count_prefix[end][:, None] - count_prefix[start]
+        total = sum_prefix[end][:, None] - sum_prefix[start]
+        total_sq = sq_prefix[end][:, None] - sq_prefix[start]
+
+        # Windows holding one repeated value get that value and a zero deviation exactly.
+        equal = np.zeros(n, dtype=bool)
+        equal[1:] = values[1:] == values[:-1]
+        steps = np.cumsum(equal)
+        run = steps - np.maximum.accumulate(np.where(equal, 0, steps))
+        constant = run[:, None] >= np.minimum(end[:, None], windows[None, :]) - 1
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(constant, values[:, None], total / count + center)
+            deviation = np.maximum(total_sq - total * total / count, 0.0)
+            variances = deviation / (count - 1)
+            scale = np.abs(sum_prefix[end])[:, None] + np.abs(sum_prefix[start])
+            rounding = np.finfo("f8").eps * np.maximum(total_sq / deviation, scale / np.abs(total / count + center) / count)
+        variances[constant] = 0.0
+
+        full = count >= windows[None, :]
+        means[~full] = np.nan
+        variances[~full | (count < 2)] = np.nan
+        volatilities = np.sqrt(variances)
+
+        unstable = (rounding > MetricsCalculator.STABLE_ROUNDING_TOLERANCE) & full & ~constant
+        for column in np.flatnonzero(unstable.any(axis=0)):
+            window = int(windows[column])
+            rows = np.flatnonzero(unstable[:, column])
+            block = np.lib.stride_tricks.sliding_window_view(values, window)[rows - window + 1]
+            means[rows, column] = block.mean(axis=1)
+            volatilities[rows, column] = block.std(axis=1, ddof=1) if window > 1 else np.nan
+        return means, volatilities
+
     @staticmethod
     def calculate_price_to_earnings(price: float, earnings_per_share: float) -> float:
         """
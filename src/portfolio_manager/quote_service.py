@@ -0,0 +1,152 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+from portfolio_manager.single_flight import SingleFlight
+from portfolio_manager.market_data_provider import MarketDataProvider, get_default_provider
+
+
+class QuoteService:
+    """
+    Short-lived snapshots of the provider's quote/info dict, shared by every caller.
+
+    A snapshot is served for ``ttl`` seconds after it was fetched. Concurrent requests for
+    the same ticker share one upstream call, and ``get_many`` fetches each distinct
+    missing ticker exactly once, concurrently on at most ``max_workers`` threads.
+    """
+
+    def __init__(self, provider: Optional[MarketDataProvider] = None, ttl: float = 60, max_workers: int = 8):
+        """
+        Initialize the QuoteService instance.
+
+        Args:
+            provider (Optional[MarketDataProvider]): Upstream data source (defaults to the shared one).
+            ttl (float): Seconds a snapshot stays valid.
+            max_workers (int): Max concurrent `.info` requests in ``get_many``.
+        """
+        self.provider = provider
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self.logger = Logger("QuoteService")
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._snapshots: Dict[str, tuple] = {}
+        self._flight = SingleFlight("quote")
+
+    @staticmethod
+    def _key(ticker: str) -> str:
+        return ticker.strip().upper()
+
+    def _cached(self, key: str) -> Optional[dict]:
+        with self.lock:
+            entry = self._snapshots.get(key)
+            if entry is not None and time.time() - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def _fetch(self, ticker: str) -> dict:
+        info = (self.provider or get_default_provider()).info(ticker) or {}
+        with self.lock:
+            self._snapshots[self._key(ticker)] = (time.time(), info)
+        return info
+
+    def is_cached(self, ticker: str) -> bool:
+        """Return True if a fresh snapshot for the ticker is held (without counting a hit or miss)."""
+        with self.lock:
+            entry = self._snapshots.get(self._key(ticker))
+            return entry is not None and time.time() - entry[0] < self.ttl
+
+    def get(self, ticker: str) -> dict:
+        """
+        Return the quote/info snapshot for a ticker.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+
+        Returns:
+            dict: A copy of the provider's info dict (empty for unknown symbols).
+
+        Raises:
+            Exception: Whatever the provider raised while fetching a missing snapshot.
+        """
+        key = self._key(ticker)
+        info = self._cached(key)
+        if info is None:
+            info, _ = self._flight.do(key, self._fetch, ticker)
+        return dict(info)
+
+    def get_many(self, tickers: List[str]) -> Dict[str, dict]:
+        """
+        Return the snapshots for several tickers.
+
+        Args:
+            tickers (List[str]): Stock ticker symbols.
+
+        Returns:
+            Dict[str, dict]: Snapshot per ticker; tickers whose fetch failed map to an empty dict.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        snapshots = {}
+        misses = []
+        for ticker in tickers:
+            info = self._cached(self._key(ticker))
+            if info is None:
+                misses.append(ticker)
+            else:
+                snapshots[ticker] = dict(info)
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(misses))) as executor:
+                for ticker, info in zip(misses, executor.map(self._get_or_empty, misses)):
+                    snapshots[ticker] = info
+        return {ticker: snapshots[ticker] for ticker in tickers}
+
+    def _get_or_empty(self, ticker: str) -> dict:
+        try:
+            return self.get(ticker)
+        except Exception as e:
+            self.logger.log_error(f"Error fetching quote for {ticker}: {e}")
+            return {}
+
+    def invalidate(self, ticker: Optional[str] = None) -> None:
+        """Drop the snapshot for a ticker, or all snapshots."""
+        with self.lock:
+            if ticker is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(self._key(ticker), None)
+
+    def get_stats(self) -> dict:
+        """Return hit/miss counters and the number of snapshots held."""
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._snapshots),
+                    "coalesced": self._flight.coalesced}
+
+
+_default_service = None
+_default_lock = threading.Lock()
+
+
+def configure_quote_service(ttl: float = 60, max_workers: int = 8) -> QuoteService:
+    """Replace the process-wide quote service."""
+    global _default_service
+    with _default_lock:
+        _default_service = QuoteService(ttl=ttl, max_workers=max_workers)
+        return _default_service
+
+
+def get_quote_service() -> QuoteService:
+    """Return the process-wide quote service."""
+    global _default_service
+    with _default_lock:
+        if _default_service is None:
+            _default_service = QuoteService()
+        return _default_service
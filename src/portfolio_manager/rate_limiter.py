@@ -0,0 +1,186 @@
+import os
+import sys
+import time
+import sqlite3
+import threading
+from typing import Optional
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a non-blocking caller would have to wait for a rate-limit token."""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(f"Upstream rate limit reached. Retry after {retry_after:.2f} seconds.")
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared by every market-data fetcher.
+
+    The bucket holds up to ``capacity`` tokens and refills at ``max_requests`` tokens per
+    ``period`` seconds. When ``state_path`` is given, the bucket lives in a small SQLite
+    database so worker processes draw from the same budget; each take runs inside an
+    ``IMMEDIATE`` transaction, which serializes concurrent writers across processes.
+    Without it the bucket is kept in memory and guarded by a lock.
+
+    Background callers pass a ``reserve``: they are only granted tokens while at least that
+    many stay in the bucket, so the rest of the burst is left for user requests.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 10,
+        period: float = 60,
+        capacity: Optional[int] = None,
+        state_path: Optional[str] = None,
+        name: str = "upstream",
+    ):
+        """
+        Initialize the RateLimiter instance.
+
+        Args:
+            max_requests (int): Tokens refilled per period.
+            period (float): Refill period in seconds.
+            capacity (Optional[int]): Burst capacity (defaults to ``max_requests``).
+            state_path (Optional[str]): SQLite file holding the shared bucket state.
+            name (str): Bucket name, so several limits can share one state file.
+        """
+        self.rate = max_requests / period
+        self.capacity = capacity if capacity is not None else max_requests
+        self.state_path = state_path
+        self.name = name
+        self.logger = Logger("RateLimiter")
+        self._lock = threading.Lock()
+        self._tokens = float(self.capacity)
+        self._updated = time.time()
+        self._connection = None
+        if self.state_path:
+            self._initialize_state()
+
+    def _initialize_state(self):
+        """Create the shared bucket table if it does not exist."""
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.state_path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS buckets (
+                name TEXT PRIMARY KEY,
+                tokens REAL,
+                updated REAL
+            )
+        """)
+
+    def _refill(self, tokens: float, updated: float, now: float) -> float:
+        return min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+
+    def _take(self, tokens: float, available: float, reserve: float = 0.0) -> tuple:
+        """Return the remaining tokens and the wait time for a take request."""
+        if available - tokens >= reserve:
+            return available - tokens, 0.0
+        return available, (tokens + reserve - available) / self.rate
+
+    def try_acquire(self, tokens: int = 1, reserve: float = 0.0) -> float:
+        """
+        Take tokens from the bucket without blocking.
+
+        Args:
+            tokens (int): Number of tokens to take.
+            reserve (float): Tokens that must remain in the bucket after the take.
+
+        Returns:
+            float: 0.0 if the tokens were granted, otherwise the seconds until they will be.
+        """
+        with self._lock:
+            now = time.time()
+            if self._connection is None:
+                available = self._refill(self._tokens, self._updated, now)
+                self._tokens, wait_time = self._take(tokens, available, reserve)
+                self._updated = now
+                return wait_time
+
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute("SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,))
+                row = cursor.fetchone()
+                available = self._refill(*row, now) if row else float(self.capacity)
+                remaining, wait_time = self._take(tokens, available, reserve)
+                cursor.execute(
+                    "REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                    (self.name, remaining, now),
+                )
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            return wait_time
+
+    def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> None:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens (int): Number of tokens to take.
+            timeout (Optional[float]): Maximum seconds to wait (None waits indefinitely).
+
+        Raises:
+            RateLimitExceeded: If the tokens cannot be granted within the timeout.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            wait_time = self.try_acquire(tokens)
+            if wait_time == 0:
+                return
+            if deadline is not None and time.time() + wait_time > deadline:
+                raise RateLimitExceeded(wait_time)
+            self.logger.log_info(f"Rate limit exceeded. Waiting {wait_time:.2f} seconds.")
+            time.sleep(wait_time)
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+DEFAULT_STATE_PATH = "data/sys_file/rate_limit_dir/rate_limit.db"
+
+
+def configure_shared_rate_limiter(
+    max_requests: int = 10,
+    period: float = 60,
+    capacity: Optional[int] = None,
+    state_path: Optional[str] = DEFAULT_STATE_PATH,
+) -> RateLimiter:
+    """
+    Replace the process-wide limiter used by all fetchers.
+
+    Args:
+        max_requests (int): Tokens refilled per period.
+        period (float): Refill period in seconds.
+        capacity (Optional[int]): Burst capacity (defaults to ``max_requests``).
+        state_path (Optional[str]): SQLite file shared between processes (None keeps state in memory).
+
+    Returns:
+        RateLimiter: The new shared limiter.
+    """
+    global _shared_limiter
+    with _shared_lock:
+        _shared_limiter = RateLimiter(
+            max_requests=max_requests, period=period, capacity=capacity, state_path=state_path
+        )
+        return _shared_limiter
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """Return the process-wide limiter, creating it with default settings on first use."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(state_path=DEFAULT_STATE_PATH)
+        return _shared_limiter
@@ -0,0 +1,182 @@
+from statistics import NormalDist
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+
+from portfolio_manager.indicator_panel import IndicatorPanel
+
+
+class RiskAnalytics:
+    """
+    Risk metrics of a portfolio and of each of its holdings.
+
+    Prices come in as a dates × tickers panel (see ``IndicatorPanel.from_frames``), so the
+    history already held in the price store is reused. Every metric is computed for all
+    holdings and the portfolio at once as NumPy operations over the aligned return
+    matrix, which keeps hundreds of positions over many years interactive.
+
+    Metrics:
+    - annualized_return, annualized_volatility, sharpe, sortino, max_drawdown
+    - var_historical / cvar_historical: empirical loss quantile and mean loss beyond it
+    - var_parametric / cvar_parametric: the same under a normal distribution
+    - beta and rolling beta against a benchmark
+
+    VaR and CVaR are one-period losses expressed as positive fractions. The portfolio is
+    buy-and-hold: its returns follow the value of the shares held over the period.
+    """
+
+    TRADING_DAYS = 252
+
+    @staticmethod
+    def return_matrix(prices: pd.DataFrame) -> pd.DataFrame:
+        """
+        Build the aligned matrix of simple returns.
+
+        Gaps in a holding's history are forward-filled, so a move is booked when trading
+        resumes. Dates before every column has a price are dropped, so each row is complete.
+
+        Args:
+            prices (pd.DataFrame): Dates × tickers prices.
+
+        Returns:
+            pd.DataFrame: Dates × tickers returns.
+        """
+        values = prices.ffill().to_numpy(dtype="f8")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            returns = values[1:] / values[:-1] - 1.0
+        complete = ~np.isnan(returns).any(axis=1)
+        return pd.DataFrame(returns[complete], index=prices.index[1:][complete], columns=prices.columns)
+
+    @staticmethod
+    def _column_metrics(returns: np.ndarray, risk_free_rate: float, confidence: float, periods_per_year: int) -> dict:
+        """Per-column metrics of a dates × series return matrix."""
+        periods = len(returns)
+        mean = returns.mean(axis=0)
+        std = returns.std(axis=0, ddof=1)
+        growth = np.log1p(returns).sum(axis=0)
+        excess = returns - ((1.0 + risk_free_rate) ** (1.0 / periods_per_year) - 1.0)
+        downside = np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2, axis=0))
+
+        wealth = np.exp(np.cumsum(np.log1p(returns), axis=0))
+        peak = np.maximum(np.maximum.accumulate(wealth, axis=0), 1.0)
+
+        cutoff = np.quantile(returns, 1.0 - confidence, axis=0)
+        tail = returns <= cutoff
+        normal = NormalDist()
+        z = normal.inv_cdf(1.0 - confidence)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return {
+                "annualized_return": np.expm1(growth * periods_per_year / periods),
+                "annualized_volatility": std * np.sqrt(periods_per_year),
+                "sharpe": excess.mean(axis=0) / std * np.sqrt(periods_per_year),
+                "sortino": excess.mean(axis=0) / downside * np.sqrt(periods_per_year),
+                "max_drawdown": (wealth / peak - 1.0).min(axis=0),
+                "var_historical": -cutoff,
+                "cvar_historical": -(returns * tail).sum(axis=0) / tail.sum(axis=0),
+                "var_parametric": -(mean + z * std),
+                "cvar_parametric": -(mean - std * normal.pdf(z) / (1.0 - confidence)),
+            }
+
+    @staticmethod
+    def _betas(returns: np.ndarray, benchmark: np.ndarray, window: int) -> tuple:
+        """Full-period and rolling betas of every column, the rolling ones from windowed prefix sums."""
+        centered = benchmark - benchmark.mean()
+        full = (returns - returns.mean(axis=0)).T @ centered / (centered @ centered)
+
+        prefix = np.cumsum(np.column_stack([returns * benchmark[:, None], returns]), axis=0)
+        cross, total = np.split(IndicatorPanel._window_diff(prefix, window), 2, axis=1)
+        bench = IndicatorPanel._window_diff(np.cumsum(np.column_stack([benchmark, benchmark * benchmark]), axis=0), window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rolling = (cross - total * bench[:, :1] / window) / (bench[:, 1:] - bench[:, :1] ** 2 / window)
+        rolling[:window - 1] = np.nan
+        return full, rolling
+
+    @staticmethod
+    def analyze(
+        prices: pd.DataFrame,
+        shares: Dict[str, float],
+        benchmark: Optional[pd.Series] = None,
+        risk_free_rate: float = 0.0,
+        confidence: float = 0.95,
+        beta_window: int = 63,
+        periods_per_year: int = TRADING_DAYS,
+    ) -> dict:
+        """
+        Calculate the risk metrics of a portfolio and its holdings.
+
+        Args:
+            prices (pd.DataFrame): Dates × tickers closing prices of the holdings.
+            shares (Dict[str, float]): Shares held per ticker.
+            benchmark (Optional[pd.Series]): Benchmark closing prices for beta (None to skip).
+            risk_free_rate (float): Annual risk-free rate for Sharpe and Sortino (default: 0).
+            confidence (float): VaR/CVaR confidence level (default: 0.95).
+            beta_window (int): Rolling beta window in periods (default: 63).
+            periods_per_year (int): Periods per year used to annualize (default: 252).
+
+        Returns:
+            dict: ``portfolio`` and ``holdings`` metrics, the annualized ``covariance`` and the
+                ``correlation`` matrices, ``rolling_beta`` per holding and ``portfolio_rolling_beta``,
+                the period covered and the ``missing`` tickers without prices.
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1.")
+        if not isinstance(prices.index, pd.DatetimeIndex) or (
+                benchmark is not None and not isinstance(benchmark.index, pd.DatetimeIndex)):
+            raise ValueError("Prices must be indexed by date.")
+        tickers = [ticker for ticker in shares if ticker in prices.columns and prices[ticker].notna().any()]
+        missing = [ticker for ticker in shares if ticker not in tickers]
+        if not tickers:
+            raise ValueError("No price history available for the portfolio's holdings.")
+
+        panel = prices[tickers]
+        if benchmark is not None:
+            panel = pd.concat([panel, benchmark.rename("__benchmark__")], axis=1).sort_index()
+        filled = panel.ffill()
+        complete = filled.notna().all(axis=1).to_numpy()
+        filled = filled[complete]
+        returns_frame = RiskAnalytics.return_matrix(filled)
+        if len(returns_frame) < 2:
+            raise ValueError("Not enough overlapping price history to measure risk.")
+
+        values = filled[tickers].to_numpy(dtype="f8")
+        held = np.array([shares[ticker] for ticker in tickers], dtype="f8")
+        portfolio_value = values @ held
+        returns = returns_frame[tickers].to_numpy()
+        portfolio_returns = portfolio_value[1:] / portfolio_value[:-1] - 1.0
+        combined = np.column_stack([returns, portfolio_returns])
+
+        metrics = RiskAnalytics._column_metrics(combined, risk_free_rate, confidence, periods_per_year)
+        weights = values[-1] * held / portfolio_value[-1]
+        covariance = np.cov(returns, rowvar=False, ddof=1).reshape(len(tickers), len(tickers)) * periods_per_year
+        volatility = np.sqrt(np.diag(covariance))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            correlation = covariance / np.outer(volatility, volatility)
+            marginal = covariance @ weights
+            contribution = weights * marginal / (weights @ marginal)
+
+        result = {
+            "start": returns_frame.index[0],
+            "end": returns_frame.index[-1],
+            "observations": len(returns),
+            "missing": missing,
+            "covariance": pd.DataFrame(covariance, index=tickers, columns=tickers),
+            "correlation": pd.DataFrame(correlation, index=tickers, columns=tickers),
+        }
+        if benchmark is not None:
+            full, rolling = RiskAnalytics._betas(combined, returns_frame["__benchmark__"].to_numpy(), beta_window)
+            metrics["beta"] = full
+            result["rolling_beta"] = pd.DataFrame(rolling[:, :-1], index=returns_frame.index, columns=tickers)
+            result["portfolio_rolling_beta"] = pd.Series(rolling[:, -1], index=returns_frame.index)
+
+        result["portfolio"] = {name: float(column[-1]) for name, column in metrics.items()}
+        result["portfolio"]["value"] = float(portfolio_value[-1])
+        result["holdings"] = {
+            ticker: {
+                "shares": float(held[i]),
+                "weight": float(weights[i]),
+                "risk_contribution": float(contribution[i]),
+                **{name: float(column[i]) for name, column in metrics.items()},
+            }
+            for i, ticker in enumerate(tickers)
+        }
+        return result
@@ -1,46 +1,73 @@
-import yfinance as yf
-import sqlite3
+import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
 
 
 # Add the `src` directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 from file_manager.fileManager import FileManager
+from portfolio_manager.single_flight import SingleFlight
+from portfolio_manager.market_data_provider import MarketDataProvider
+from portfolio_manager.quote_service import QuoteService, get_quote_service
+from file_manager.negative_cache import get_negative_cache
+from file_manager.sqlite_pool import SQLiteConnectionPool
+from portfolio_manager.rate_limiter import RateLimiter, RateLimitExceeded, get_shared_rate_limiter
+
+# Concurrent lookups of the same ticker share one cache check and `.info` request
+_metadata_flight = SingleFlight("metadata")  # fetch_metadata: cache read, provider request, cache write
+_request_flight = SingleFlight("metadata_request")  # search misses: provider request only
 
 class StockSearcher:
-    """Class for searching stocks with caching and API integration."""
+    """
+    Class for searching stocks with caching and API integration.
+
+    Metadata is cached as JSON rows in SQLite. Each thread uses its own connection from a
+    pool, so one searcher can serve concurrent requests. Cache misses of a search are
+    requested concurrently on a bounded worker pool, each taking a token from the rate limiter.
+    """
 
     CACHE_EXPIRY = timedelta(days=1)  # Cache expiry time
+    MAX_SQL_VARIABLES = 500  # Tickers per `IN (...)` lookup
 
-    def __init__(self, tickers: list, base_dir: str, db_path: str = "data/cache.db"):
+    def __init__(self, tickers: list, base_dir: str, db_path: str = "data/cache.db", provider: MarketDataProvider = None,
+                 rate_limiter: Optional[RateLimiter] = None, max_workers: int = 8):
         """
         Initialize the StockSearcher instance.
 
         Args:
             tickers (list): List of stock ticker symbols.
             db_path (str): Path to the SQLite database for caching.
+            provider (MarketDataProvider): Upstream data source (defaults to the shared quote service).
+            rate_limiter (Optional[RateLimiter]): Limiter for the requests of ``search`` (defaults to the shared one).
+            max_workers (int): Max concurrent `.info` requests across all searches.
         """
         self.tickers = tickers
+        self.quotes = QuoteService(provider=provider) if provider else get_quote_service()
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.max_workers = max_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self.negative_cache = get_negative_cache()
         self.db_path = db_path
         self.file_manager = FileManager(base_dir=base_dir)
-        self.connection = None
+        self.pool = SQLiteConnectionPool(db_path)
         self._initialize_cache()
 
     def _initialize_cache(self):
         """Initialize the SQLite cache database."""
-        self.file_manager.ensure_directory_exists(self.db_path)
-        self.connection = sqlite3.connect(self.db_path)
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS cache (
-                ticker TEXT PRIMARY KEY,
-                data TEXT,
-                timestamp DATETIME
-            )
-        """)
-        self.connection.commit()
+        with self.pool.connection() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    ticker TEXT PRIMARY KEY,
+                    data TEXT,
+                    timestamp DATETIME
+                )
+            """)
 
     def _is_cache_valid(self, timestamp: str) -> bool:
         """
@@ -58,51 +85,212 @@ class StockSearcher:
         except ValueError:
             return False
 
+    def get_cached_metadata(self, tickers: Iterable[str]) -> Dict[str, dict]:
+        """
+        Look up the valid cached metadata for several tickers.
+
+        Args:
+            tickers (Iterable[str]): Stock ticker symbols.
+
+        Returns:
+            Dict[str, dict]: Metadata per cached ticker; missing, expired and unreadable
+            rows (such as those written before rows were stored as JSON) are left out.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        connection = self.pool.connection()
+        cached = {}
+        for i in range(0, len(tickers), self.MAX_SQL_VARIABLES):
+            chunk = tickers[i:i + self.MAX_SQL_VARIABLES]
+            rows = connection.execute(
+                f"SELECT ticker, data, timestamp FROM cache WHERE ticker IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            for ticker, data, timestamp in rows:
+                if not self._is_cache_valid(timestamp):
+                    continue
+                try:
+                    cached[ticker] = json.loads(data)
+                except (TypeError, ValueError):
+                    continue
+        return cached
+
+    def save_metadata(self, metadata: Dict[str, dict]) -> None:
+        """
+        Cache metadata for several tickers in one transaction.
+
+        Args:
+            metadata (Dict[str, dict]): Metadata per ticker.
+        """
+        if not metadata:
+            return
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.pool.connection() as connection:
+            connection.executemany(
+                "REPLACE INTO cache (ticker, data, timestamp) VALUES (?, ?, ?)",
+                [(ticker, json.dumps(data, default=str), timestamp) for ticker, data in metadata.items()],
+            )
+
+    def is_cached(self, ticker: str) -> bool:
+        """
+        Check if valid metadata for a ticker is cached, without calling the provider.
+
+        Args:
+            ticker (str): Stock ticker symbol.
+
+        Returns:
+            bool: True if the cached metadata is still valid.
+        """
+        ticker = ticker.strip().upper()
+        return ticker in self.get_cached_metadata([ticker])
+
     def fetch_metadata(self, ticker: str) -> dict:
         """
-        Fetch stock metadata using Yahoo Finance, with caching.
+        Fetch stock metadata from the market data provider, with caching.
 
         Args:
             ticker (str): Stock ticker symbol.
 
         Returns:
-            dict: Metadata for the stock.
+            dict: Metadata for the stock (empty for unknown symbols).
+        """
+        ticker = ticker.strip().upper()
+        metadata, shared = _metadata_flight.do(ticker, self._fetch_metadata, ticker)
+        return dict(metadata) if shared else metadata
+
+    def search(self, tickers: List[str], timeout: Optional[float] = None) -> Dict[str, dict]:
         """
+        Look up metadata for several stocks within a deadline.
+
+        Cached tickers are read with one query. The misses are requested concurrently on
+        the worker pool, and whatever was fetched by the deadline is written back in one
+        transaction. Requests still running at the deadline finish in the background and
+        cache their result for the next search.
+
+        Args:
+            tickers (List[str]): Stock ticker symbols.
+            timeout (Optional[float]): Seconds to wait for the misses (None waits for all).
+
+        Returns:
+            Dict[str, dict]: ``{"status": ..., "data": metadata}`` per ticker, where status is
+            one of "cached", "fetched", "not_found", "rate_limited", "timeout" or "error".
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        requested = {ticker: ticker.strip().upper() for ticker in tickers}
+        tickers = list(dict.fromkeys(requested.values()))
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT data, timestamp FROM cache WHERE ticker = ?", (ticker,))
-            row = cursor.fetchone()
-
-            if row:
-                cached_data, cached_time = row
-                if self._is_cache_valid(cached_time):
-                    print(f"Cache hit for {ticker}")
-                    return eval(cached_data)  # Convert cached string back to dictionary
-
-            print(f"Cache miss for {ticker}, fetching from API...")
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            metadata = {
-                "ticker": ticker,
-                "name": info.get("longName"),
-                "industry": info.get("industry"),
-                "sector": info.get("sector"),
-                "dividend_yield": info.get("dividendYield", 0) * 100 if info.get("dividendYield") else None,
-                "market_cap": info.get("marketCap")
-            }
-
-            # Update cache
-            cursor.execute(
-                "REPLACE INTO cache (ticker, data, timestamp) VALUES (?, ?, ?)",
-                (ticker, str(metadata), datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            )
-            self.connection.commit()
+            cached = self.get_cached_metadata(tickers)
+        except Exception as e:
+            print(f"Error reading metadata cache: {e}")
+            cached = {}
+        results = {ticker: {"status": "cached", "data": cached[ticker]} for ticker in tickers if ticker in cached}
+        misses = [ticker for ticker in tickers if ticker not in cached]
+        if not misses:
+            return {ticker: results[symbol] for ticker, symbol in requested.items()}
+
+        executor = self._get_executor()
+        futures = {executor.submit(self._resolve_miss, ticker, deadline): ticker for ticker in misses}
+        done, pending = wait(futures, timeout=None if deadline is None else max(0.0, deadline - time.time()))
+        fetched = {}
+        for future in done:
+            ticker = futures[future]
+            status, metadata = future.result()
+            results[ticker] = {"status": status, "data": metadata}
+            if status == "fetched":
+                fetched[ticker] = metadata
+        for future in pending:
+            results[futures[future]] = {"status": "timeout", "data": {}}
+            if not future.cancel():
+                future.add_done_callback(self._save_late_result)
+        try:
+            self.save_metadata(fetched)
+        except Exception as e:
+            print(f"Error saving metadata cache: {e}")
+        return {ticker: results[symbol] for ticker, symbol in requested.items()}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="metadata")
+            return self._executor
+
+    def _resolve_miss(self, ticker: str, deadline: Optional[float]) -> tuple:
+        """Request one missed (normalized) ticker on a worker thread, returning ``(status, metadata)``."""
+        if self.negative_cache.is_known_missing(("metadata", ticker)):
+            return "not_found", {}
+        try:
+            metadata, shared = _request_flight.do(ticker, self._request_limited, ticker, deadline)
+        except RateLimitExceeded:
+            return "rate_limited", {}
+        except Exception as e:
+            print(f"Error fetching metadata for {ticker}: {e}")
+            return "error", {}
+        if not metadata:
+            return "not_found", {}
+        return "fetched", dict(metadata) if shared else metadata
+
+    def _request_limited(self, ticker: str, deadline: Optional[float]) -> dict:
+        """
+        Request a missed ticker's metadata as the single-flight leader.
+
+        A rate-limit token is only taken when the quote has to come from upstream, so
+        coalesced callers and quote-cache hits cost nothing.
+
+        Raises:
+            RateLimitExceeded: If no token becomes available before the deadline.
+        """
+        if not self.quotes.is_cached(ticker):
+            self.rate_limiter.acquire(timeout=None if deadline is None else max(0.0, deadline - time.time()))
+        return self._request_metadata(ticker)
+
+    def _save_late_result(self, future) -> None:
+        """Cache metadata fetched after its search's deadline."""
+        try:
+            status, metadata = future.result()
+            if status == "fetched":
+                self.save_metadata({metadata["ticker"]: metadata})
+        except Exception as e:
+            print(f"Error saving metadata cache: {e}")
+
+    def _fetch_metadata(self, ticker: str) -> dict:
+        """Resolve one ``fetch_metadata`` request against the cache and the provider."""
+        try:
+            cached = self.get_cached_metadata([ticker])
+            if ticker in cached:
+                print(f"Cache hit for {ticker}")
+                return cached[ticker]
+
+            metadata = self._request_metadata(ticker)
+            if metadata:
+                self.save_metadata({ticker: metadata})
             return metadata
         except Exception as e:
             print(f"Error fetching metadata for {ticker}: {e}")
             return {}
 
+    def _request_metadata(self, ticker: str) -> dict:
+        """Request a ticker's metadata from the provider, without touching the SQLite cache."""
+        if self.negative_cache.is_known_missing(("metadata", ticker)):
+            print(f"Known missing ticker {ticker}, skipping API")
+            return {}
+
+        print(f"Cache miss for {ticker}, fetching from API...")
+        info = self.quotes.get(ticker)
+        if not (info and (info.get("symbol") or info.get("longName") or info.get("shortName"))):
+            self.negative_cache.mark_missing(("metadata", ticker))
+            return {}
+        return {
+            "ticker": ticker,
+            "name": info.get("longName"),
+            "industry": info.get("industry"),
+            "sector": info.get("sector"),
+            "dividend_yield": info.get("dividendYield", 0) * 100 if info.get("dividendYield") else None,
+            "market_cap": info.get("marketCap")
+        }
+
     def close_connection(self):
-        """Close the SQLite database connection."""
-        if self.connection:
-            self.connection.close()
\ No newline at end of file
+        """Stop the worker pool and close the SQLite connections of every thread (call on shutdown only)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.pool.close_all()
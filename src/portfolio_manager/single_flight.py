@@ -0,0 +1,79 @@
+import os
+import sys
+import threading
+from typing import Any, Callable, Hashable, Tuple
+
+# Add the `src` directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+from logs.logger import Logger
+
+
+class _Call:
+    """An upstream call in progress and the outcome shared with its waiters."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it is still in
+    flight wait for it and receive the same result, or the same exception. Once the call
+    finishes the key is released, so later callers go through the normal cache path again.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the SingleFlight group.
+
+        Args:
+            name (str): Group name used in log messages.
+        """
+        self.name = name
+        self.logger = Logger("SingleFlight")
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        Run ``func`` once per key among concurrent callers.
+
+        Args:
+            key (Hashable): Normalized key identifying the call.
+            func (Callable): Function to run when no identical call is in flight.
+            *args, **kwargs: Arguments forwarded to ``func``.
+
+        Returns:
+            Tuple[Any, bool]: The result and whether it was shared from another caller's call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            self.logger.log_info(f"[{self.name}] Waiting on in-flight call for {key}.")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,316 @@
+import math
+from collections import deque
+from typing import Iterable, Optional
+
+
+class StreamingEMA:
+    """
+    Exponential moving average updated one value at a time.
+
+    Follows ``Series.ewm(span=span, adjust=False).mean()``: the average starts at the
+    first observed value, and NaNs leave it unchanged while decaying its weight.
+    """
+
+    def __init__(self, span: int):
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = math.nan
+        self.old_weight = 1.0
+
+    def update(self, x: float) -> float:
+        """Add a value and return the new average."""
+        observed = not math.isnan(x)
+        if not math.isnan(self.value):
+            self.old_weight *= 1.0 - self.alpha
+            if observed:
+                if self.value != x:
+                    self.value = (self.old_weight * self.value + self.alpha * x) / (self.old_weight + self.alpha)
+                self.old_weight = 1.0
+        elif observed:
+            self.value = x
+        return self.value
+
+    def snapshot(self) -> dict:
+        return {"span": self.span, "value": self.value, "old_weight": self.old_weight}
+
+    @classmethod
+    def restore(cls, state: dict) -> "StreamingEMA":
+        ema = cls(state["span"])
+        ema.value = state["value"]
+        ema.old_weight = state["old_weight"]
+        return ema
+
+
+class StreamingRollingMean:
+    """
+    Rolling mean over the last ``window`` values, updated in constant time.
+
+    Mirrors pandas' fixed-window mean: values leaving the window are subtracted and new
+    values added with separate Kahan compensation, NaNs are skipped, and a window of one
+    repeated value returns that value exactly.
+    """
+
+    def __init__(self, window: int, min_periods: Optional[int] = None):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.values = deque()
+        self.nobs = 0
+        self.sum = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.neg_count = 0
+        self.same_count = 0
+        self.prev_value = math.nan
+
+    def _add(self, x: float) -> None:
+        if math.isnan(x):
+            return
+        self.nobs += 1
+        y = x - self.compensation_add
+        t = self.sum + y
+        self.compensation_add = t - self.sum - y
+        self.sum = t
+        if math.copysign(1.0, x) < 0:
+            self.neg_count += 1
+        self.same_count = self.same_count + 1 if x == self.prev_value else 1
+        self.prev_value = x
+
+    def _remove(self, x: float) -> None:
+        if math.isnan(x):
+            return
+        self.nobs -= 1
+        y = -x - self.compensation_remove
+        t = self.sum + y
+        self.compensation_remove = t - self.sum - y
+        self.sum = t
+        if math.copysign(1.0, x) < 0:
+            self.neg_count -= 1
+
+    def update(self, x: float) -> float:
+        """Add a value and return the mean of the current window."""
+        if len(self.values) == self.window:
+            self._remove(self.values.popleft())
+        self.values.append(x)
+        self._add(x)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.nobs < max(self.min_periods, 1):
+            return math.nan
+        if self.same_count >= self.nobs:
+            return self.prev_value
+        result = self.sum / self.nobs
+        if self.neg_count == 0 and result < 0:
+            return 0.0
+        if self.neg_count == self.nobs and result > 0:
+            return 0.0
+        return result
+
+    def snapshot(self) -> dict:
+        return {"window": self.window, "min_periods": self.min_periods, "values": list(self.values),
+                "nobs": self.nobs, "sum": self.sum, "compensation_add": self.compensation_add,
+                "compensation_remove": self.compensation_remove, "neg_count": self.neg_count,
+                "same_count": self.same_count, "prev_value": self.prev_value}
+
+    @classmethod
+    def restore(cls, state: dict) -> "StreamingRollingMean":
+        mean = cls(state["window"], state["min_periods"])
+        mean.values = deque(state["values"])
+        for name in ("nobs", "sum", "compensation_add", "compensation_remove", "neg_count", "same_count", "prev_value"):
+            setattr(mean, name, state[name])
+        return mean
+
+
+class StreamingRollingStd:
+    """
+    Rolling sample standard deviation over the last ``window`` values, updated in constant time.
+
+    Keeps the window's mean and sum of squared deviations with Welford's add/remove
+    updates, like pandas' fixed-window variance.
+    """
+
+    def __init__(self, window: int, min_periods: Optional[int] = None, ddof: int = 1):
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.ddof = ddof
+        self.values = deque()
+        self.nobs = 0
+        self.mean = 0.0
+        self.ssqdm = 0.0
+        self.same_count = 0
+        self.prev_value = math.nan
+
+    def _add(self, x: float) -> None:
+        if math.isnan(x):
+            return
+        self.nobs += 1
+        self.same_count = self.same_count + 1 if x == self.prev_value else 1
+        self.prev_value = x
+        prev_mean = self.mean
+        self.mean += (x - prev_mean) / self.nobs
+        self.ssqdm += (x - prev_mean) * (x - self.mean)
+
+    def _remove(self, x: float) -> None:
+        if math.isnan(x):
+            return
+        self.nobs -= 1
+        if self.nobs:
+            prev_mean = self.mean
+            self.mean -= (x - prev_mean) / self.nobs
+            self.ssqdm -= (x - prev_mean) * (x - self.mean)
+        else:
+            self.mean = 0.0
+            self.ssqdm = 0.0
+
+    def update(self, x: float) -> float:
+        """Add a value and return the standard deviation of the current window."""
+        if len(self.values) == self.window:
+            self._remove(self.values.popleft())
+        self.values.append(x)
+        self._add(x)
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self.nobs < max(self.min_periods, 1) or self.nobs <= self.ddof:
+            return math.nan
+        if self.nobs == 1 or self.same_count >= self.nobs:
+            return 0.0
+        return math.sqrt(max(self.ssqdm, 0.0) / (self.nobs - self.ddof))
+
+    def snapshot(self) -> dict:
+        return {"window": self.window, "min_periods": self.min_periods, "ddof": self.ddof,
+                "values": list(self.values), "nobs": self.nobs, "mean": self.mean, "ssqdm": self.ssqdm,
+                "same_count": self.same_count, "prev_value": self.prev_value}
+
+    @classmethod
+    def restore(cls, state: dict) -> "StreamingRollingStd":
+        std = cls(state["window"], state["min_periods"], state["ddof"])
+        std.values = deque(state["values"])
+        for name in ("nobs", "mean", "ssqdm", "same_count", "prev_value"):
+            setattr(std, name, state[name])
+        return std
+
+
+class StreamingRSI:
+    """RSI from rolling means of gains and losses, like ``TechnicalAnalysis.calculate_rsi``."""
+
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.prev_close = math.nan
+        self.gains = StreamingRollingMean(window, min_periods=1)
+        self.losses = StreamingRollingMean(window, min_periods=1)
+
+    def update(self, close: float) -> float:
+        """Add a closing price and return the new RSI."""
+        delta = close - self.prev_close
+        self.prev_close = close
+        avg_gain = self.gains.update(delta if delta > 0 else 0.0)
+        avg_loss = self.losses.update(-delta if delta < 0 else 0.0)
+        if avg_loss == 0:
+            return math.nan if avg_gain == 0 or math.isnan(avg_gain) else 100.0
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+    def snapshot(self) -> dict:
+        return {"window": self.window, "prev_close": self.prev_close,
+                "gains": self.gains.snapshot(), "losses": self.losses.snapshot()}
+
+    @classmethod
+    def restore(cls, state: dict) -> "StreamingRSI":
+        rsi = cls(state["window"])
+        rsi.prev_close = state["prev_close"]
+        rsi.gains = StreamingRollingMean.restore(state["gains"])
+        rsi.losses = StreamingRollingMean.restore(state["losses"])
+        return rsi
+
+
+class StreamingMACD:
+    """MACD line and Signal line, like ``TechnicalAnalysis.calculate_macd``."""
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self.fast = StreamingEMA(fast_period)
+        self.slow = StreamingEMA(slow_period)
+        self.signal = StreamingEMA(signal_period)
+
+    def update(self, close: float) -> tuple:
+        """Add a closing price and return ``(macd, signal)``."""
+        macd = self.fast.update(close) - self.slow.update(close)
+        return macd, self.signal.update(macd)
+
+    def snapshot(self) -> dict:
+        return {"fast": self.fast.snapshot(), "slow": self.slow.snapshot(), "signal": self.signal.snapshot()}
+
+    @classmethod
+    def restore(cls, state: dict) -> "StreamingMACD":
+        macd = cls()
+        macd.fast = StreamingEMA.restore(state["fast"])
+        macd.slow = StreamingEMA.restore(state["slow"])
+        macd.signal = StreamingEMA.restore(state["signal"])
+        return macd
+
+
+class StreamingIndicators:
+    """
+    The analysis indicators of one price series, updated bar by bar.
+
+    Feeding the closes one at a time yields the same values as the batch functions in
+    ``TechnicalAnalysis`` and ``MetricsCalculator`` over the whole history, at constant
+    cost per bar. The state, including the timestamp of the last bar consumed, can be
+    snapshotted to a JSON-serializable dict and restored later.
+    """
+
+    def __init__(self, moving_avg_window: int = 20, volatility_window: int = 20, rsi_window: int = 14):
+        self.moving_average = StreamingRollingMean(moving_avg_window)
+        self.volatility = StreamingRollingStd(volatility_window)
+        self.rsi = StreamingRSI(rsi_window)
+        self.macd = StreamingMACD()
+        self.last_timestamp = None
+        self.latest = {}
+
+    def update(self, close: float, timestamp: Optional[str] = None) -> dict:
+        """
+        Add a closing price.
+
+        Args:
+            close (float): Closing price of the new bar.
+            timestamp (Optional[str]): ISO timestamp of the bar, remembered as ``last_timestamp``.
+
+        Returns:
+            dict: ``moving_average``, ``volatility``, ``rsi``, ``macd`` and ``signal`` after the bar.
+        """
+        close = float(close)
+        macd, signal = self.macd.update(close)
+        self.latest = {
+            "moving_average": self.moving_average.update(close),
+            "volatility": self.volatility.update(close),
+            "rsi": self.rsi.update(close),
+            "macd": macd,
+            "signal": signal,
+        }
+        if timestamp is not None:
+            self.last_timestamp = timestamp
+        return self.latest
+
+    def update_many(self, closes: Iterable[float], timestamps: Optional[Iterable[str]] = None) -> dict:
+        """Add several closing prices in order and return the indicators after the last one."""
+        timestamps = iter(timestamps) if timestamps is not None else None
+        for close in closes:
+            self.update(close, next(timestamps) if timestamps is not None else None)
+        return self.latest
+
+    def snapshot(self) -> dict:
+        return {"moving_average": self.moving_average.snapshot(), "volatility": self.volatility.snapshot(),
+                "rsi": self.rsi.snapshot(), "macd": self.macd.snapshot(),
+                "last_timestamp": self.last_timestamp, "latest": self.latest}
+
+    @classmethod
+    def restore(cls, state: dict) -> "StreamingIndicators":
+        indicators = cls()
+        indicators.moving_average = StreamingRollingMean.restore(state["moving_average"])
+        indicators.volatility = StreamingRollingStd.restore(state["volatility"])
+        indicators.rsi = StreamingRSI.restore(state["rsi"])
+        indicators.macd = StreamingMACD.restore(state["macd"])
+        indicators.last_timestamp = state["last_timestamp"]
+        indicators.latest = state["latest"]
+        return indicators
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 class TechnicalAnalysis:
@@ -7,6 +8,14 @@ class TechnicalAnalysis:
     Methods:
     - calculate_rsi: Calculates the Relative Strength Index (RSI).
     - calculate_macd: Calculates the MACD line and Signal line.
+    - calculate_bollinger_bands: Calculates the middle, upper and lower Bollinger Bands.
+    - calculate_atr: Calculates the Average True Range (ATR).
+    - calculate_stochastic: Calculates the stochastic oscillator (%K and %D).
+    - calculate_obv: Calculates On-Balance Volume (OBV).
+    - calculate_vwap: Calculates the Volume-Weighted Average Price (VWAP).
+    - calculate_adx: Calculates the Average Directional Index (ADX) and directional indicators.
+
+    ``IndicatorPanel`` computes the same indicators for many tickers at once.
     """
 
     @staticmethod
@@ -73,3 +82,134 @@ class TechnicalAnalysis:
         signal = macd.ewm(span=signal_period, adjust=False).mean()
 
         return macd, signal
+
+    @staticmethod
+    def calculate_bollinger_bands(data: pd.DataFrame, window: int = 20, num_std: float = 2.0) -> tuple:
+        """
+        Calculate Bollinger Bands.
+
+        Args:
+            data (pd.DataFrame): Stock data with a 'Close' column.
+            window (int): Rolling window size (default: 20).
+            num_std (float): Band width in rolling standard deviations (default: 2).
+
+        Returns:
+            tuple: Middle, upper and lower band as pd.Series.
+        """
+        if 'Close' not in data:
+            raise ValueError("Input DataFrame must contain a 'Close' column.")
+
+        middle = data['Close'].rolling(window=window).mean()
+        std = data['Close'].rolling(window=window).std()
+        return middle, middle + num_std * std, middle - num_std * std
+
+    @staticmethod
+    def _true_range(data: pd.DataFrame) -> pd.Series:
+        prev_close = data['Close'].shift(1)
+        return pd.concat(
+            [data['High'] - data['Low'], (data['High'] - prev_close).abs(), (data['Low'] - prev_close).abs()],
+            axis=1,
+        ).max(axis=1)
+
+    @staticmethod
+    def calculate_atr(data: pd.DataFrame, window: int = 14) -> pd.Series:
+        """
+        Calculate the Average True Range (ATR) with Wilder's smoothing.
+
+        Args:
+            data (pd.DataFrame): Stock data with 'High', 'Low' and 'Close' columns.
+            window (int): Smoothing period (default: 14).
+
+        Returns:
+            pd.Series: ATR values.
+        """
+        if not {'High', 'Low', 'Close'}.issubset(data.columns):
+            raise ValueError("Input DataFrame must contain 'High', 'Low' and 'Close' columns.")
+
+        return TechnicalAnalysis._true_range(data).ewm(alpha=1 / window, adjust=False).mean()
+
+    @staticmethod
+    def calculate_stochastic(data: pd.DataFrame, k_window: int = 14, d_window: int = 3) -> tuple:
+        """
+        Calculate the stochastic oscillator.
+
+        Args:
+            data (pd.DataFrame): Stock data with 'High', 'Low' and 'Close' columns.
+            k_window (int): Look-back period of %K (default: 14).
+            d_window (int): Moving average period of %D (default: 3).
+
+        Returns:
+            tuple: %K and %D as pd.Series.
+        """
+        if not {'High', 'Low', 'Close'}.issubset(data.columns):
+            raise ValueError("Input DataFrame must contain 'High', 'Low' and 'Close' columns.")
+
+        lowest = data['Low'].rolling(window=k_window).min()
+        highest = data['High'].rolling(window=k_window).max()
+        k = 100 * (data['Close'] - lowest) / (highest - lowest)
+        return k, k.rolling(window=d_window).mean()
+
+    @staticmethod
+    def calculate_obv(data: pd.DataFrame) -> pd.Series:
+        """
+        Calculate On-Balance Volume (OBV).
+
+        Args:
+            data (pd.DataFrame): Stock data with 'Close' and 'Volume' columns.
+
+        Returns:
+            pd.Series: OBV values.
+        """
+        if not {'Close', 'Volume'}.issubset(data.columns):
+            raise ValueError("Input DataFrame must contain 'Close' and 'Volume' columns.")
+
+        direction = np.sign(data['Close'].diff()).fillna(0)
+        return (direction * data['Volume']).cumsum()
+
+    @staticmethod
+    def calculate_vwap(data: pd.DataFrame, reset_daily: bool = True) -> pd.Series:
+        """
+        Calculate the Volume-Weighted Average Price (VWAP) of the typical price.
+
+        Args:
+            data (pd.DataFrame): Stock data with 'High', 'Low', 'Close' and 'Volume' columns.
+            reset_daily (bool): Restart the average every trading day (for intraday bars).
+
+        Returns:
+            pd.Series: VWAP values.
+        """
+        if not {'High', 'Low', 'Close', 'Volume'}.issubset(data.columns):
+            raise ValueError("Input DataFrame must contain 'High', 'Low', 'Close' and 'Volume' columns.")
+
+        typical = (data['High'] + data['Low'] + data['Close']) / 3
+        weighted = typical * data['Volume']
+        if reset_daily:
+            days = pd.DatetimeIndex(data.index).normalize()
+            return weighted.groupby(days).cumsum() / data['Volume'].groupby(days).cumsum()
+        return weighted.cumsum() / data['Volume'].cumsum()
+
+    @staticmethod
+    def calculate_adx(data: pd.DataFrame, window: int = 14) -> tuple:
+        """
+        Calculate the Average Directional Index (ADX) with Wilder's smoothing.
+
+        Args:
+            data (pd.DataFrame): Stock data with 'High', 'Low' and 'Close' columns.
+            window (int): Smoothing period (default: 14).
+
+        Returns:
+            tuple: ADX, +DI and -DI as pd.Series.
+        """
+        if not {'High', 'Low', 'Close'}.issubset(data.columns):
+            raise ValueError("Input DataFrame must contain 'High', 'Low' and 'Close' columns.")
+
+        up = data['High'].diff()
+        down = -data['Low'].diff()
+        plus_dm = up.where((up > down) & (up > 0), 0.0)
+        minus_dm = down.where((down > up) & (down > 0), 0.0)
+
+        atr = TechnicalAnalysis.calculate_atr(data, window)
+        plus_di = 100 * plus_dm.ewm(alpha=1 / window, adjust=False).mean() / atr
+        minus_di = 100 * minus_dm.ewm(alpha=1 / window, adjust=False).mean() / atr
+        dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di)
+        return dx.ewm(alpha=1 / window, adjust=False).mean(), plus_di, minus_di
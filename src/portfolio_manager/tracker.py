@@ -1,50 +1,97 @@
 import time
 import schedule
 import json
-from portfolio_manager.data_fetcher import DataFetcher
-from datetime import datetime
+from portfolio_manager.async_data_fetcher import ConcurrentDataFetcher
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 import os
 import sys
+import pandas as pd
 
 # Add the `src` directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 from logs.logger import Logger
+from file_manager.indicator_state_cache import IndicatorStateCache
+from portfolio_manager.streaming_indicators import StreamingIndicators
+from portfolio_manager.indicator_panel import IndicatorPanel
 
 
 class Tracker:
     """Class for tracking stock prices."""
 
-    def __init__(self, base_dir:str):
+    MARKET_TIMEZONE = ZoneInfo("America/New_York")  # Intraday bars are stored per exchange-local day
+
+    def __init__(self, base_dir:str, interval: str = "5m"):
         """
         Initialize the Tracker instance.
+        :param interval: Intraday bar interval to track (e.g. "1m", "5m", "15m", "1h").
         """
-        self.fetcher = DataFetcher(base_dir=base_dir)
+        self.fetcher = ConcurrentDataFetcher(base_dir=base_dir)
+        self.interval = interval
         self.logger =  Logger("Tracker")
         self.watchlist = []
+        self.indicator_states = IndicatorStateCache()
     
 
 
+    def update_indicators(self, ticker: str, data: pd.DataFrame) -> dict:
+        """
+        Feed the bars newer than the last ones seen into the ticker's streaming indicators.
+
+        ``data`` is a fetched frame with the bar times in its ``Datetime``/``Date`` column
+        (or index). The indicator state is restored from the cache and saved back after the update,
+        so each poll costs time proportional to the new bars only.
+
+        Returns:
+            dict: The latest moving average, volatility, RSI, MACD and signal values.
+        """
+        key = f"{ticker}_{self.interval}"
+        state = self.indicator_states.get(key)
+        indicators = StreamingIndicators.restore(state) if state else StreamingIndicators()
+        data = IndicatorPanel.with_date_index(data)
+        bars = data if indicators.last_timestamp is None else data[data.index > pd.Timestamp(indicators.last_timestamp)]
+        if not bars.empty:
+            indicators.update_many(bars["Close"], (timestamp.isoformat() for timestamp in bars.index))
+            self.indicator_states.put(key, indicators.snapshot())
+        return indicators.latest
+
     def check_price(self):
         """Fetch the latest stock prices and check against thresholds."""
+        if not self.watchlist:
+            return
+        now = datetime.now(self.MARKET_TIMEZONE)
+        current_date = now.strftime('%Y-%m-%d')
+        current_time = now.strftime('%H:%M:%S')  # Add timestamp
+        next_date = (now + timedelta(days=1)).strftime('%Y-%m-%d')  # End dates are exclusive
+        prices = self.fetcher.fetch_many([ticker for ticker, _ in self.watchlist], current_date, next_date,
+                                         interval=self.interval)
+
         for ticker, threshold in self.watchlist:
             try:
-                current_date = datetime.now().strftime('%Y-%m-%d')
-                current_time = datetime.now().strftime('%H:%M:%S')  # Add timestamp
-                data = self.fetcher.fetch_stock_data(ticker, current_date, current_date)
+                data = prices.get(ticker.strip().upper())
 
                 if data is None or data.empty:
-                    logging.warning(f"No data available for {ticker} on {current_date}.")
+                    self.logger.log_warning(f"No data available for {ticker} on {current_date}.")
                     continue
 
                 latest_price = data['Close'].iloc[-1]
+                try:
+                    indicators = self.update_indicators(ticker, data)
+                    self.logger.log_info(
+                        f"{ticker} RSI: {indicators.get('rsi', float('nan')):.2f}, "
+                        f"MACD: {indicators.get('macd', float('nan')):.4f} (signal {indicators.get('signal', float('nan')):.4f})"
+                    )
+                except Exception as e:
+                    # Indicators are informational; never let them block the threshold alert.
+                    self.logger.log_error(f"Error updating indicators for {ticker}: {e}")
 
                 if latest_price > threshold:
-                    logging.info(f"Alert: {ticker} crossed the threshold! Latest Price: {latest_price} at {current_time}")
+                    self.logger.log_info(f"Alert: {ticker} crossed the threshold! Latest Price: {latest_price} at {current_time}")
                 else:
-                    logging.info(f"{ticker} is below the threshold. Latest Price: {latest_price} at {current_time}")
+                    self.logger.log_info(f"{ticker} is below the threshold. Latest Price: {latest_price} at {current_time}")
 
             except Exception as e:
-                logging.error(f"Error while checking price for {ticker}: {e}")
+                self.logger.log_error(f"Error while checking price for {ticker}: {e}")
 
     def start_tracking(self, interval_minutes: int):
         """
@@ -52,11 +99,11 @@ class Tracker:
         :param interval_minutes: Interval in minutes for checking the prices.
         """
         schedule.every(interval_minutes).minutes.do(self.check_price)
-        logging.info(f"Started tracking stocks every {interval_minutes} minutes.")
+        self.logger.log_info(f"Started tracking stocks every {interval_minutes} minutes.")
 
         try:
             while True:
                 schedule.run_pending()
                 time.sleep(1)
         except KeyboardInterrupt:
-            logging.info("Stopped tracking.")
+            self.logger.log_info("Stopped tracking.")
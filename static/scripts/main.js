@@ -54,6 +54,46 @@ document.addEventListener("DOMContentLoaded", function () {
         });
     });
 
+    // Typeahead for ticker inputs, served from the local symbol directory
+    document.querySelectorAll('input[name="ticker"], input[name="trackingTicker"]').forEach((input) => {
+        const datalist = document.createElement("datalist");
+        datalist.id = `${input.id || input.name}-symbols`;
+        input.setAttribute("list", datalist.id);
+        input.setAttribute("autocomplete", "off");
+        input.after(datalist);
+
+        let debounceTimer = null;
+        let controller = null;
+        input.addEventListener("input", () => {
+            clearTimeout(debounceTimer);
+            const query = input.value.trim();
+            if (!query) {
+                datalist.innerHTML = "";
+                return;
+            }
+            debounceTimer = setTimeout(async () => {
+                if (controller) controller.abort();
+                controller = new AbortController();
+                try {
+                    const response = await fetch(`/api/symbols?q=${encodeURIComponent(query)}&limit=10`, {
+                        signal: controller.signal,
+                    });
+                    if (!response.ok) return;
+                    const data = await response.json();
+                    datalist.innerHTML = "";
+                    (data.data || []).forEach((entry) => {
+                        const option = document.createElement("option");
+                        option.value = entry.symbol;
+                        option.label = entry.name;
+                        datalist.appendChild(option);
+                    });
+                } catch (error) {
+                    if (error.name !== "AbortError") console.warn("Symbol lookup failed:", error);
+                }
+            }, 150);
+        });
+    });
+
     function updateUI(responseData) {
         console.log("Updating UI with stock data:", responseData);
     
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from portfolio_manager.async_data_fetcher import AsyncDataFetcher, ConcurrentDataFetcher
+from portfolio_manager.rate_limiter import RateLimiter
+
+
+def _bars(start, end):
+    index = pd.bdate_range(start, end, inclusive="left", name="Date")
+    return pd.DataFrame({"Close": range(len(index))}, index=index, dtype=float)
+
+
+def test_batches_run_concurrently_under_the_semaphore(tmp_path, monkeypatch):
+    fetcher = ConcurrentDataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache", ""),
+                                    rate_limiter=RateLimiter(max_requests=100, period=1), max_concurrency=2)
+    fetcher.BATCH_SIZE = 1
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_request_many(tickers, start_date, end_date, interval="1d"):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return {ticker: _bars(start_date, end_date) for ticker in tickers}
+
+    monkeypatch.setattr(fetcher, "_request_history_many", fake_request_many)
+    results = fetcher.fetch_many(["A", "b", "C", "d "], "2020-01-01", "2020-02-01")
+
+    assert peak[0] == 2
+    assert list(results) == ["A", "B", "C", "D"] and all(frame is not None for frame in results.values())
+    assert fetcher.price_store.missing_ranges("C", "2020-01-01", "2020-02-01") == []
+
+
+def test_async_single_ticker_shares_the_price_store(tmp_path, monkeypatch):
+    fetcher = ConcurrentDataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache", ""),
+                                    rate_limiter=RateLimiter())
+    fetcher.price_store.merge("AAPL", _bars("2020-02-01", "2020-03-01"), "2020-02-01", "2020-03-01")
+    calls = []
+
+    def fake_request(ticker, start_date, end_date, interval="1d"):
+        calls.append((start_date, end_date))
+        return _bars(start_date, end_date)
+
+    monkeypatch.setattr(fetcher, "_request_history", fake_request)
+
+    data = asyncio.run(AsyncDataFetcher(fetcher).fetch_stock_data("AAPL", "2020-01-01", "2020-04-01"))
+
+    assert sorted(calls) == [("2020-01-01", "2020-02-01"), ("2020-03-01", "2020-04-01")]
+    assert len(data) == len(_bars("2020-01-01", "2020-04-01"))
+
+
+def test_concurrent_identical_requests_share_one_fetch(tmp_path, monkeypatch):
+    fetcher = ConcurrentDataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache", ""),
+                                    rate_limiter=RateLimiter())
+    calls = []
+
+    def slow_request(ticker, start_date, end_date, interval="1d"):
+        calls.append((ticker, start_date, end_date))
+        time.sleep(0.2)
+        return _bars(start_date, end_date)
+
+    monkeypatch.setattr(fetcher, "_request_history", slow_request)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(fetcher.fetch_stock_data("AAPL", "2020-01-01", "2020-02-01")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [("AAPL", "2020-01-01", "2020-02-01")]
+    assert len(results) == 5 and all(len(frame) == len(results[0]) for frame in results)
+
+
+def test_concurrency_bound_holds_across_sync_callers(tmp_path, monkeypatch):
+    fetcher = ConcurrentDataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache", ""),
+                                    rate_limiter=RateLimiter(max_requests=100, period=1), max_concurrency=2)
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fake_request_many(tickers, start_date, end_date, interval="1d"):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return {ticker: _bars(start_date, end_date) for ticker in tickers}
+
+    monkeypatch.setattr(fetcher, "_request_history_many", fake_request_many)
+    # Each thread runs its own event loop through run_sync
+    threads = [threading.Thread(target=fetcher.fetch_many, args=([ticker], "2020-01-01", "2020-02-01"))
+               for ticker in "ABCDEF"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+    assert all(fetcher.price_store.missing_ranges(ticker, "2020-01-01", "2020-02-01") == [] for ticker in "ABCDEF")
@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager.cache_manager import CacheManager
+
+
+def _write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+
+def test_lru_eviction_on_write_keeps_recent_entries(tmp_path):
+    manager = CacheManager(str(tmp_path), max_bytes=3000, sweep_interval=0, low_watermark=1.0)
+    for name in ("A", "B", "C"):
+        _write(os.path.join(tmp_path, "store", name, "col0.1.npy"), 1000)
+        manager.record_write(os.path.join(tmp_path, "store", name))
+        time.sleep(0.01)
+    manager.record_access(os.path.join(tmp_path, "store", "A"))
+
+    _write(os.path.join(tmp_path, "store", "D", "col0.1.npy"), 1000)
+    manager.record_write(os.path.join(tmp_path, "store", "D"))
+
+    assert sorted(os.listdir(os.path.join(tmp_path, "store"))) == ["A", "C", "D"]
+    assert manager.get_stats()["evictions"] == 1
+    assert manager.total_bytes() == 3000
+
+
+def test_lfu_sweep_picks_up_external_files_and_persists_index(tmp_path):
+    for name in ("hot.pkl", "cold.pkl"):
+        _write(os.path.join(tmp_path, name), 1000)
+    manager = CacheManager(str(tmp_path), max_bytes=10_000, policy="lfu", sweep_interval=0,
+                           low_watermark=1.0)
+    for _ in range(3):
+        manager.record_access(os.path.join(tmp_path, "hot.pkl"))
+
+    _write(os.path.join(tmp_path, "new.pkl"), 1500)
+    manager.max_bytes = 2600
+    manager.sweep()
+
+    assert sorted(f for f in os.listdir(tmp_path) if not f.startswith(".")) == ["hot.pkl", "new.pkl"]
+    restarted = CacheManager(str(tmp_path), max_bytes=10_000, sweep_interval=0)
+    assert restarted._entries["hot.pkl"]["accesses"] == 3
@@ -0,0 +1,46 @@
+import os
+import sys
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager.cache_policy import FreshnessPolicy
+from file_manager.price_store import PriceStore
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def _at(*args) -> float:
+    return datetime(*args, tzinfo=NEW_YORK).timestamp()
+
+
+def test_session_cutoff_and_expiry():
+    policy = FreshnessPolicy(live_ttl=60)
+    during_session = _at(2024, 3, 6, 11, 0)
+    after_close = _at(2024, 3, 6, 17, 0)
+
+    assert policy.session_cutoff(during_session) == "2024-03-06"
+    assert policy.session_cutoff(after_close) == "2024-03-07"
+    assert policy.session_cutoff(_at(2024, 3, 9, 11, 0)) == "2024-03-10"  # Saturday
+    assert policy.expires_at("2024-03-06", during_session) is None
+    assert policy.expires_at("2024-03-07", during_session) == during_session + 60
+    assert policy.expires_at("2024-03-07", after_close) is None
+    assert policy.expires_at("2024-03-07", _at(2024, 3, 6, 11, 2, 30), interval="5m") == _at(2024, 3, 6, 11, 5)
+
+
+def test_live_ranges_expire_while_history_stays_covered(tmp_path, monkeypatch):
+    store = PriceStore(store_dir=str(tmp_path), freshness_policy=FreshnessPolicy(live_ttl=60))
+    fetched_at = _at(2024, 3, 6, 11, 0)
+    monkeypatch.setattr("file_manager.price_store.time.time", lambda: fetched_at)
+    index = pd.bdate_range("2024-03-01", "2024-03-07", inclusive="left", name="Date")
+    store.merge("AAPL", pd.DataFrame({"Close": range(len(index))}, index=index, dtype=float), "2024-03-01", "2024-03-07")
+
+    assert store.missing_ranges("AAPL", "2024-03-01", "2024-03-07") == []
+
+    monkeypatch.setattr("file_manager.price_store.time.time", lambda: fetched_at + 61)
+    assert store.missing_ranges("AAPL", "2024-03-01", "2024-03-07") == [("2024-03-06", "2024-03-07")]
+
+    store.merge("AAPL", pd.DataFrame({"Close": [99.0]}, index=pd.DatetimeIndex(["2024-03-06"], name="Date")),
+                "2024-03-06", "2024-03-07")
+    assert store.load_range("AAPL", "2024-03-06", "2024-03-07")["Close"].tolist() == [99.0]
@@ -0,0 +1,104 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import pytest
+from portfolio_manager.cache_warmer import CacheWarmer, RequestHistory
+from portfolio_manager.rate_limiter import RateLimiter, RateLimitExceeded
+
+
+class _Limiter:
+    capacity = 10
+
+    def __init__(self):
+        self.calls = 0
+        self.rejections = 1
+
+    def try_acquire(self, tokens=1, reserve=0.0):
+        assert reserve == 5
+        if self.rejections:
+            self.rejections -= 1
+            return 0.01
+        self.calls += 1
+        return 0.0
+
+
+class _Fetcher:
+    BATCH_SIZE = 2
+
+    def __init__(self, rate_limiter=None):
+        self.rate_limiter = rate_limiter or _Limiter()
+        self.batches = []
+        self.stored = []
+
+    def _plan_batches(self, tickers, start_date, end_date):
+        return [(start_date, end_date, tickers)]
+
+    def _request_history_many(self, tickers, start_date, end_date):
+        self.batches.append(tuple(tickers))
+        return {}
+
+    def _store_fetched(self, ticker, data, start_date, end_date):
+        self.stored.append(ticker)
+
+
+class _Fundamentals:
+    def __init__(self):
+        self.fetched = []
+
+    def is_cached(self, ticker):
+        return False
+
+    def get_financial_ratios(self, ticker):
+        self.fetched.append(ticker)
+
+
+class _Searcher:
+    def __init__(self):
+        self.fetched = []
+
+    def is_cached(self, ticker):
+        return ticker == "AAPL"
+
+    def fetch_metadata(self, ticker):
+        self.fetched.append(ticker)
+
+
+def test_warm_cycle_covers_configured_and_popular_tickers():
+    history = RequestHistory()
+    for ticker in ["tsla", "TSLA", "NVDA", "aapl"]:
+        history.record(ticker)
+    fetcher, searcher = _Fetcher(), _Searcher()
+    warmer = CacheWarmer(fetcher, ticker_source=lambda: ["AAPL", "msft"], request_history=history,
+                         searcher_factory=lambda: searcher, top_n=1)
+
+    warmer.warm_once()
+
+    assert fetcher.batches == [("AAPL", "MSFT"), ("TSLA",)]
+    assert searcher.fetched == ["MSFT", "TSLA"]
+    assert fetcher.rate_limiter.calls == 4  # two price batches, two quotes
+    progress = warmer.get_progress()
+    assert progress["cycles"] == 1 and progress["completed"] == progress["total"] == 6
+    assert progress["last_error"] is None and not progress["running"]
+
+
+def test_warmer_leaves_the_reserved_burst_to_user_requests():
+    limiter = RateLimiter(max_requests=10, period=60)
+    fetcher, searcher, fundamentals = _Fetcher(limiter), _Searcher(), _Fundamentals()
+    fetcher.BATCH_SIZE = 50
+    warmer = CacheWarmer(fetcher, ticker_source=lambda: ["AAPL", "MSFT", "GOOGL"],
+                         searcher_factory=lambda: searcher, fundamentals=fundamentals)
+
+    warmer.warm_once()
+
+    # One bulk price request, then one quote per ticker shared by metadata and ratios
+    assert fetcher.batches == [("AAPL", "MSFT", "GOOGL")]
+    assert searcher.fetched == ["MSFT", "GOOGL"] and fundamentals.fetched == ["AAPL", "MSFT", "GOOGL"]
+    assert limiter.try_acquire(tokens=6) == 0.0
+    assert limiter.try_acquire() > 0
+
+    drained = RateLimiter(max_requests=10, period=60)
+    assert drained.try_acquire(tokens=5) == 0.0
+    with pytest.raises(RateLimitExceeded):
+        CacheWarmer(_Fetcher(drained), ticker_source=list)._acquire_token()
+    assert drained.try_acquire(tokens=5) == 0.0
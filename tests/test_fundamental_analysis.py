@@ -0,0 +1,49 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager import fundamentals_cache
+from file_manager.fundamentals_cache import FundamentalsCache
+from portfolio_manager import market_data_provider, quote_service
+from portfolio_manager.fundamental_analysis import FundamentalAnalysis
+from portfolio_manager.market_data_provider import MarketDataProvider
+from portfolio_manager.quote_service import QuoteService
+
+
+class _InfoProvider(MarketDataProvider):
+    def __init__(self):
+        self.calls = []
+
+    def info(self, ticker):
+        self.calls.append(ticker)
+        return {"symbol": ticker, "trailingPE": 25.0, "marketCap": 10 ** 12}
+
+
+def test_ratios_are_cached_persistently_and_batched(tmp_path, monkeypatch):
+    provider = _InfoProvider()
+    monkeypatch.setattr(market_data_provider, "_default_provider", provider)
+    monkeypatch.setattr(quote_service, "_default_service", QuoteService(ttl=60))
+    monkeypatch.setattr(fundamentals_cache, "_default_cache", FundamentalsCache(cache_dir=str(tmp_path), ttl=3600))
+
+    assert FundamentalAnalysis.get_financial_ratios("AAPL")["P/E Ratio (Trailing)"] == 25.0
+    many = FundamentalAnalysis.get_financial_ratios_many(["AAPL", "MSFT", "GOOGL"])
+
+    assert sorted(provider.calls) == ["AAPL", "GOOGL", "MSFT"]
+    assert set(many) == {"AAPL", "MSFT", "GOOGL"} and many["MSFT"]["Market Cap"] == 10 ** 12
+    restarted = FundamentalsCache(cache_dir=str(tmp_path), ttl=3600)
+    assert restarted.get("GOOGL")["P/E Ratio (Trailing)"] == 25.0
+    assert FundamentalsCache(cache_dir=str(tmp_path), ttl=0).get("GOOGL") is None
+
+
+def test_ticker_case_variants_share_one_request(tmp_path, monkeypatch):
+    provider = _InfoProvider()
+    monkeypatch.setattr(market_data_provider, "_default_provider", provider)
+    monkeypatch.setattr(quote_service, "_default_service", QuoteService(ttl=60))
+    monkeypatch.setattr(fundamentals_cache, "_default_cache", FundamentalsCache(cache_dir=str(tmp_path), ttl=3600))
+
+    many = FundamentalAnalysis.get_financial_ratios_many(["aapl", " AAPL"])
+
+    assert provider.calls == ["AAPL"]
+    assert set(many) == {"aapl", " AAPL"}
+    assert all(ratios["P/E Ratio (Trailing)"] == 25.0 for ratios in many.values())
+    assert FundamentalAnalysis.get_financial_ratios("Aapl")["Market Cap"] == 10 ** 12
@@ -0,0 +1,95 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from portfolio_manager.indicator_panel import IndicatorPanel
+from portfolio_manager.metrics_calculator import MetricsCalculator
+from portfolio_manager.technical_analysis import TechnicalAnalysis
+
+
+def _panel():
+    rng = np.random.default_rng(7)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (400, 4)), axis=0))
+    values[:60, 1] = np.nan  # listed later
+    values[200:204, 2] = np.nan  # trading halt
+    values[300:340, 3] = values[300, 3]  # stale price
+    return pd.DataFrame(values, index=pd.bdate_range("2020-01-01", periods=400), columns=["A", "B", "C", "D"])
+
+
+def test_panel_matches_single_ticker_indicators():
+    panel = _panel()
+    results = IndicatorPanel.compute(panel, moving_avg_window=20, volatility_window=10)
+
+    for ticker in panel.columns:
+        data = panel[[ticker]].rename(columns={ticker: "Close"})
+        macd, signal = TechnicalAnalysis.calculate_macd(data)
+        expected = {
+            "rsi": TechnicalAnalysis.calculate_rsi(data),
+            "macd": macd,
+            "signal": signal,
+            "moving_average": MetricsCalculator.calculate_moving_average(data, 20),
+            "volatility": MetricsCalculator.calculate_volatility(data, 10),
+        }
+        for name, series in expected.items():
+            np.testing.assert_allclose(results[name][ticker].to_numpy(), series.to_numpy(), rtol=1e-8, atol=1e-5,
+                                       err_msg=f"{name} of {ticker}")
+
+
+def test_panel_accepts_arrays_and_fetched_frames():
+    panel = _panel()
+    frames = {ticker: panel[[ticker]].rename(columns={ticker: "Close"}).dropna() for ticker in panel.columns}
+    rebuilt = IndicatorPanel.from_frames({**frames, "EMPTY": None})
+
+    assert list(rebuilt.columns) == ["A", "B", "C", "D"]
+    np.testing.assert_allclose(IndicatorPanel.moving_average(rebuilt.to_numpy(), 5),
+                               IndicatorPanel.moving_average(panel, 5).to_numpy())
+
+
+def test_panel_aligns_fetched_frames_by_date():
+    panel = _panel().rename_axis("Date")
+    # DataFetcher.fetch_many shape: a RangeIndex and the dates in a "Date" column
+    frames = {ticker: panel[[ticker]].rename(columns={ticker: "Close"}).dropna().reset_index() for ticker in panel.columns}
+    rebuilt = IndicatorPanel.from_frames(frames)
+
+    pd.testing.assert_frame_equal(rebuilt, panel, check_names=False, check_freq=False)
+    with pytest.raises(ValueError):
+        IndicatorPanel.from_frames({"A": pd.DataFrame({"Close": [1.0, 2.0]})})
+
+
+def test_ohlcv_kernels_match_pandas_references():
+    rng = np.random.default_rng(11)
+    index = pd.date_range("2024-01-02 09:30", periods=300, freq="30min")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (300, 3)), axis=0))
+    high = close * (1 + np.abs(rng.normal(0, 0.01, close.shape)))
+    low = close * (1 - np.abs(rng.normal(0, 0.01, close.shape)))
+    volume = rng.integers(10 ** 5, 10 ** 7, close.shape).astype(float)
+    for values in (close, high, low, volume):
+        values[:30, 1] = np.nan  # listed later
+    frames = [pd.DataFrame(values, index=index, columns=["A", "B", "C"]) for values in (high, low, close, volume)]
+    high, low, close, volume = frames
+
+    panel = {
+        "bollinger": IndicatorPanel.bollinger_bands(close),
+        "atr": (IndicatorPanel.atr(high, low, close),),
+        "stochastic": IndicatorPanel.stochastic(high, low, close),
+        "obv": (IndicatorPanel.obv(close, volume),),
+        "vwap": (IndicatorPanel.vwap(high, low, close, volume),),
+        "adx": IndicatorPanel.adx(high, low, close),
+    }
+    for ticker in close.columns:
+        data = pd.DataFrame({"High": high[ticker], "Low": low[ticker], "Close": close[ticker], "Volume": volume[ticker]})
+        reference = {
+            "bollinger": TechnicalAnalysis.calculate_bollinger_bands(data),
+            "atr": (TechnicalAnalysis.calculate_atr(data),),
+            "stochastic": TechnicalAnalysis.calculate_stochastic(data),
+            "obv": (TechnicalAnalysis.calculate_obv(data),),
+            "vwap": (TechnicalAnalysis.calculate_vwap(data),),
+            "adx": TechnicalAnalysis.calculate_adx(data),
+        }
+        for name, expected in reference.items():
+            for got, series in zip(panel[name], expected):
+                np.testing.assert_allclose(got[ticker].to_numpy(), series.to_numpy(), rtol=1e-9, atol=1e-9,
+                                           err_msg=f"{name} of {ticker}")
@@ -0,0 +1,94 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from portfolio_manager.data_fetcher import DataFetcher
+from portfolio_manager.indicator_registry import IndicatorRegistry, get_indicator_registry
+from portfolio_manager.market_data_provider import MarketDataProvider
+from portfolio_manager.rate_limiter import RateLimiter
+from portfolio_manager.technical_analysis import TechnicalAnalysis
+
+
+def _closes():
+    rng = np.random.default_rng(11)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (120, 3)), axis=0))
+    return pd.DataFrame(values, index=pd.bdate_range("2021-01-01", periods=120), columns=["A", "B", "C"])
+
+
+def test_plan_computes_only_requested_nodes_once():
+    registry = IndicatorRegistry()
+    calls = []
+
+    def node(name, func):
+        def wrapped(*inputs):
+            calls.append(name)
+            return func(*inputs)
+        return wrapped
+
+    registry.register("ema12", ["Close"], node("ema12", lambda close: close.ewm(span=12, adjust=False).mean()))
+    registry.register("ema26", ["Close"], node("ema26", lambda close: close.ewm(span=26, adjust=False).mean()))
+    registry.register("macd", ["ema12", "ema26"], node("macd", lambda fast, slow: fast - slow))
+    registry.register("signal", ["macd"], node("signal", lambda macd: macd.ewm(span=9, adjust=False).mean()))
+    registry.register("obv", ["Close", "Volume"], node("obv", lambda close, volume: volume.cumsum()))
+
+    assert registry.plan(["signal", "macd"]) == ["Close", "ema12", "ema26", "macd", "signal"]
+    assert registry.required_columns(["signal"]) == ["Close"]
+
+    results = registry.evaluate({"Close": _closes()}, ["signal", "macd", "ema12"])
+    assert list(results) == ["signal", "macd", "ema12"]
+    assert sorted(calls) == ["ema12", "ema26", "macd", "signal"]
+
+    with pytest.raises(ValueError):
+        registry.plan(["unknown"])
+    with pytest.raises(ValueError):
+        registry.evaluate({"Close": _closes()}, ["obv"])
+
+
+def test_default_registry_matches_technical_analysis():
+    panel = _closes()
+    registry = get_indicator_registry()
+    with pytest.raises(ValueError):
+        registry.plan(["_rolling_stats_20"])
+
+    results = registry.evaluate({"Close": panel}, ["macd", "signal", "rsi", "bollinger_upper"])
+    for ticker in panel.columns:
+        data = panel[[ticker]].rename(columns={ticker: "Close"})
+        macd, signal = TechnicalAnalysis.calculate_macd(data)
+        upper = TechnicalAnalysis.calculate_bollinger_bands(data)[1]
+        np.testing.assert_allclose(results["macd"][ticker], macd, rtol=1e-10)
+        np.testing.assert_allclose(results["signal"][ticker], signal, rtol=1e-10)
+        np.testing.assert_allclose(results["rsi"][ticker], TechnicalAnalysis.calculate_rsi(data), rtol=1e-8)
+        np.testing.assert_allclose(results["bollinger_upper"][ticker], upper, rtol=1e-8)
+
+
+class _HistoryProvider(MarketDataProvider):
+    def __init__(self, bars):
+        self.bars = bars
+
+    def history(self, ticker, start_date, end_date, interval="1d"):
+        return self.bars[(self.bars.index >= start_date) & (self.bars.index < end_date)]
+
+
+def test_fetched_frames_are_evaluated_by_date(tmp_path):
+    rng = np.random.default_rng(4)
+    index = pd.bdate_range("2024-01-01", periods=80, name="Date")
+    close = 100 + np.cumsum(rng.normal(0, 1, 80))
+    bars = pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                         "Volume": rng.integers(1000, 5000, 80).astype(float)}, index=index)
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache_dir", ""),
+                          rate_limiter=RateLimiter(), provider=_HistoryProvider(bars))
+    registry = get_indicator_registry()
+    outputs = ["vwap", "macd"]
+
+    data = fetcher.fetch_stock_data("AAPL", "2024-01-01", "2024-06-01", columns=registry.required_columns(outputs))
+    assert "Date" in data.columns  # the fetch_stock_data shape
+    series = registry.evaluate_frame(data, outputs)
+
+    assert list(series.columns) == outputs
+    pd.testing.assert_index_equal(series.index, index, check_names=False, exact=False)
+    expected = bars.rename_axis(None)
+    np.testing.assert_allclose(series["vwap"], TechnicalAnalysis.calculate_vwap(expected), rtol=1e-12)
+    np.testing.assert_allclose(series["macd"], TechnicalAnalysis.calculate_macd(expected)[0], rtol=1e-10)
@@ -0,0 +1,68 @@
+import os
+import sys
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager.cache_policy import FreshnessPolicy
+from file_manager.intraday_store import IntradayStore
+from portfolio_manager.data_fetcher import DataFetcher
+from portfolio_manager.rate_limiter import RateLimiter
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def _at(hour, minute):
+    return datetime(2024, 3, 6, hour, minute, tzinfo=NEW_YORK).timestamp()
+
+
+def _bars(start, end):
+    index = pd.date_range(f"2024-03-06 {start}", f"2024-03-06 {end}", freq="5min", tz=NEW_YORK, name="Datetime")
+    return pd.DataFrame({"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": range(len(index)), "Volume": 100}, index=index)
+
+
+def test_polling_appends_only_completed_new_bars(tmp_path):
+    store = IntradayStore(store_dir=str(tmp_path), freshness_policy=FreshnessPolicy())
+    assert store.missing_ranges("AAPL", "5m", "2024-03-06", "2024-03-07", now=_at(10, 12)) == [
+        (pd.Timestamp("2024-03-06"), "2024-03-07")
+    ]
+    assert store.append("AAPL", "5m", _bars("09:30", "10:10"), "2024-03-06", "2024-03-07", fetched_at=_at(10, 12)) == 8
+    segment = os.path.join(tmp_path, "AAPL", "5m", "2024-03-06.bin")
+    with open(segment, "rb") as f:
+        first_poll = f.read()
+
+    assert store.missing_ranges("AAPL", "5m", "2024-03-06", "2024-03-07", now=_at(10, 13)) == []
+    gaps = store.missing_ranges("AAPL", "5m", "2024-03-06", "2024-03-07", now=_at(10, 16))
+    assert gaps == [(pd.Timestamp("2024-03-06 10:10"), "2024-03-07")]
+    assert store.append("AAPL", "5m", _bars("09:30", "10:15"), gaps[0][0], "2024-03-07", fetched_at=_at(10, 16)) == 1
+
+    with open(segment, "rb") as f:
+        assert f.read().startswith(first_poll)
+    loaded = store.load_range("AAPL", "5m", "2024-03-06", "2024-03-07", columns=["Close"])
+    assert list(loaded.columns) == ["Close"]
+    assert loaded.index[-1] == pd.Timestamp("2024-03-06 10:10") and len(loaded) == 9
+
+
+def test_fetcher_resumes_intraday_bulk_fetch_after_last_bar(tmp_path, monkeypatch):
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache_dir", ""),
+                          rate_limiter=RateLimiter())
+    fetcher.intraday_store.freshness_policy = FreshnessPolicy()
+    clock = {"now": _at(10, 12)}
+    monkeypatch.setattr("file_manager.intraday_store.time.time", lambda: clock["now"])
+    calls = []
+
+    def fake_download_many(tickers, start_date, end_date, interval="1d"):
+        calls.append((tuple(tickers), start_date, interval))
+        return {ticker: _bars("09:30", "10:15") for ticker in tickers}
+
+    monkeypatch.setattr(fetcher, "_download_many", fake_download_many)
+    fetcher.fetch_many(["AAPL", "MSFT"], "2024-03-06", "2024-03-07", interval="5m")
+    clock["now"] = _at(10, 16)
+    results = fetcher.fetch_many(["AAPL", "MSFT"], "2024-03-06", "2024-03-07", interval="5m")
+
+    assert calls == [
+        (("AAPL", "MSFT"), pd.Timestamp("2024-03-06"), "5m"),
+        (("AAPL", "MSFT"), pd.Timestamp("2024-03-06 10:10"), "5m"),
+    ]
+    assert len(results["AAPL"]) == 9 and "Datetime" in results["AAPL"].columns
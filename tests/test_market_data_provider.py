@@ -0,0 +1,79 @@
+import os
+import sys
+import json
+import time
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from portfolio_manager import market_data_provider
+from portfolio_manager.market_data_provider import ReplayProvider, YahooFinanceProvider, create_provider
+from portfolio_manager.data_fetcher import DataFetcher
+from portfolio_manager.rate_limiter import RateLimiter
+
+
+def _write_fixtures(fixture_dir):
+    os.makedirs(os.path.join(fixture_dir, "history"))
+    os.makedirs(os.path.join(fixture_dir, "info"))
+    index = pd.bdate_range("2020-01-01", "2020-03-01", inclusive="left", name="Date")
+    pd.DataFrame({"Close": range(len(index))}, index=index, dtype=float).to_csv(
+        os.path.join(fixture_dir, "history", "AAPL.csv")
+    )
+    with open(os.path.join(fixture_dir, "info", "AAPL.json"), "w") as f:
+        json.dump({"symbol": "AAPL", "regularMarketPrice": 123.0}, f)
+
+
+def test_replay_provider_serves_fixtures_with_latency(tmp_path):
+    _write_fixtures(str(tmp_path))
+    provider = create_provider({"provider": "replay", "fixture_dir": str(tmp_path), "latency_ms": 50})
+
+    started = time.perf_counter()
+    history = provider.history("AAPL", "2020-02-01", "2020-03-01")
+    assert time.perf_counter() - started >= 0.05
+    assert history.index.min() >= pd.Timestamp("2020-02-01")
+    assert provider.info("AAPL")["regularMarketPrice"] == 123.0
+    assert provider.info("MISSING") == {}
+    assert provider.history_many(["AAPL", "MISSING"], "2020-01-01", "2020-03-01")["MISSING"].empty
+
+
+def test_data_fetcher_runs_against_replay_provider(tmp_path):
+    fixture_dir = os.path.join(tmp_path, "fixtures")
+    _write_fixtures(fixture_dir)
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache", ""),
+                          rate_limiter=RateLimiter(), provider=ReplayProvider(fixture_dir))
+
+    data = fetcher.fetch_stock_data("AAPL", "2020-01-15", "2020-02-15")
+
+    assert data["Date"].min() >= pd.Timestamp("2020-01-15")
+    assert data["Date"].max() < pd.Timestamp("2020-02-15")
+
+
+def test_yahoo_history_many_maps_failed_tickers_to_none(monkeypatch):
+    index = pd.bdate_range("2023-01-02", periods=3, name="Date")
+    columns = pd.MultiIndex.from_product([["AAPL", "FAIL"], ["Close", "Volume"]])
+    download = pd.DataFrame([[1.0, 10.0, None, None]] * 3, index=index, columns=columns)
+    monkeypatch.setattr(market_data_provider.yf, "download", lambda *args, **kwargs: download)
+
+    frames = YahooFinanceProvider().history_many(["AAPL", "FAIL", "GONE"], "2023-01-02", "2023-01-05")
+
+    assert list(frames["AAPL"].columns) == ["Close", "Volume"] and len(frames["AAPL"]) == 3
+    assert frames["FAIL"] is None and frames["GONE"] is None
+
+
+def test_fetch_many_retries_tickers_the_download_did_not_answer(tmp_path):
+    class FlakyProvider(ReplayProvider):
+        calls = 0
+
+        def history_many(self, tickers, start_date, end_date, interval="1d"):
+            FlakyProvider.calls += 1
+            if FlakyProvider.calls == 1:
+                return {ticker: None for ticker in tickers}
+            return super().history_many(tickers, start_date, end_date, interval)
+
+    fixture_dir = os.path.join(tmp_path, "fixtures")
+    _write_fixtures(fixture_dir)
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache", ""),
+                          rate_limiter=RateLimiter(), provider=FlakyProvider(fixture_dir))
+
+    assert fetcher.fetch_many(["AAPL"], "2020-01-01", "2020-03-01")["AAPL"] is None
+    assert fetcher.price_store.covered_ranges("AAPL") == []
+    assert len(fetcher.fetch_many(["AAPL"], "2020-01-01", "2020-03-01")["AAPL"]) == 43
@@ -0,0 +1,66 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager.memory_cache import MemoryCache
+from file_manager.price_store import PriceStore
+
+
+def _frame(rows):
+    return pd.DataFrame({"Close": np.arange(rows, dtype=float)})
+
+
+def test_lru_evicts_by_bytes():
+    size = MemoryCache.sizeof(_frame(100))
+    cache = MemoryCache(max_bytes=2 * size)
+    cache.put("A", _frame(100))
+    cache.put("B", _frame(100))
+    assert cache.get("A") is not None
+    cache.put("C", _frame(100))
+
+    assert cache.get("B") is None
+    assert cache.get("A") is not None and cache.get("C") is not None
+    assert not cache.put("huge", _frame(1000))
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1 and stats["bytes"] == 2 * size
+
+
+def test_store_serves_hot_reads_from_memory(tmp_path, monkeypatch):
+    store = PriceStore(store_dir=str(tmp_path))
+    index = pd.bdate_range("2020-01-01", "2020-03-01", inclusive="left", name="Date")
+    store.merge("AAPL", pd.DataFrame({"Close": range(len(index)), "Open": 1.0}, index=index, dtype=float),
+                "2020-01-01", "2020-03-01")
+    first = store.load_range("AAPL", "2020-01-15", "2020-02-15", columns=["Close"])
+
+    def no_disk(*args, **kwargs):
+        raise AssertionError("disk read")
+
+    monkeypatch.setattr("file_manager.price_store.np.load", no_disk)
+    monkeypatch.setattr("file_manager.price_store.PriceStore._read_manifest", no_disk)
+    assert store.missing_ranges("AAPL", "2020-01-15", "2020-02-15") == []
+    pd.testing.assert_frame_equal(store.load_range("AAPL", "2020-01-15", "2020-02-15", columns=["Close"]), first)
+    assert store.memory_cache.get_stats()["hits"] >= 2
+
+
+def test_compact_frames_halve_memory_within_float32_tolerance(tmp_path):
+    index = pd.bdate_range("2000-01-03", periods=2520, name="Date")
+    close = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.01, len(index))))
+    frame = pd.DataFrame(
+        {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+         "Volume": np.full(len(index), 12_345_678, dtype=np.int64), "Dividends": 0.0, "Stock Splits": 0.0},
+        index=index,
+    )
+    frame.loc[index[100], "Dividends"] = 0.24
+    store = PriceStore(store_dir=str(tmp_path), float32_prices=True)
+    store.merge("AAPL", frame, "2000-01-01", "2011-01-01")
+
+    loaded = store.load_range("AAPL", "2000-01-01", "2011-01-01")
+    cached = store.memory_cache.get("AAPL")["data"]
+
+    assert MemoryCache.sizeof(cached) < MemoryCache.sizeof(frame) / 2
+    assert list(loaded.columns) == list(frame.columns)
+    assert loaded["Volume"].dtype == np.uint32
+    assert loaded["Dividends"].sum() == 0.24 and loaded["Stock Splits"].eq(0).all()
+    np.testing.assert_allclose(loaded["Close"], frame["Close"], rtol=1e-7)
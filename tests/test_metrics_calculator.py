@@ -0,0 +1,37 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from portfolio_manager.metrics_calculator import MetricsCalculator
+
+
+def _assert_matches_single_window(data, windows, atol):
+    means, volatilities = MetricsCalculator.calculate_rolling_statistics(data, windows)
+    assert means.shape == volatilities.shape == (len(data), len(windows))
+    for column, window in enumerate(windows):
+        np.testing.assert_allclose(means[:, column], MetricsCalculator.calculate_moving_average(data, window),
+                                   rtol=1e-10, atol=atol, err_msg=f"mean {window}")
+        np.testing.assert_allclose(volatilities[:, column], MetricsCalculator.calculate_volatility(data, window),
+                                   rtol=1e-7, atol=atol, err_msg=f"std {window}")
+
+
+def test_rolling_statistics_match_single_window_functions():
+    rng = np.random.default_rng(3)
+    closes = 20 * np.exp(np.cumsum(rng.normal(0.001, 0.02, 1500)))
+    closes[100:103] = np.nan  # trading halt
+    closes[700:760] = closes[700]  # stale price
+    data = pd.DataFrame({"Close": closes}, index=pd.bdate_range("2015-01-01", periods=1500))
+    _assert_matches_single_window(data, [5, 10, 20, 50, 100, 200], atol=1e-5)
+
+
+def test_rolling_statistics_stay_accurate_when_differencing_cancels():
+    rng = np.random.default_rng(5)
+    closes = np.concatenate([np.full(300, 1e9), np.full(300, 1.0)]) + rng.normal(0, 1e-3, 600)
+    means, volatilities = MetricsCalculator.calculate_rolling_statistics(pd.DataFrame({"Close": closes}), [10, 200])
+
+    for column, window in enumerate([10, 200]):
+        windows = np.lib.stride_tricks.sliding_window_view(closes, window)
+        np.testing.assert_allclose(means[window - 1:, column], windows.mean(axis=1), rtol=1e-12)
+        np.testing.assert_allclose(volatilities[window - 1:, column], windows.std(axis=1, ddof=1), rtol=1e-6)
@@ -0,0 +1,204 @@
+import os
+import re
+import sys
+import multiprocessing
+import time
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager.price_store import PriceStore
+from portfolio_manager.data_fetcher import DataFetcher
+from portfolio_manager.rate_limiter import RateLimiter
+from file_manager.negative_cache import NegativeCache
+
+
+def _bars(start, end):
+    index = pd.bdate_range(start, end, inclusive="left", name="Date")
+    return pd.DataFrame({"Close": range(len(index))}, index=index, dtype=float)
+
+
+def test_missing_ranges_subtracts_covered_spans(tmp_path):
+    store = PriceStore(store_dir=str(tmp_path))
+    store.merge("AAPL", _bars("2020-01-01", "2020-03-01"), "2020-01-01", "2020-03-01")
+    store.merge("AAPL", _bars("2020-04-01", "2020-05-01"), "2020-04-01", "2020-05-01")
+
+    assert store.missing_ranges("AAPL", "2020-02-01", "2020-04-15") == [("2020-03-01", "2020-04-01")]
+    assert store.missing_ranges("AAPL", "2020-01-10", "2020-02-10") == []
+    assert store.missing_ranges("AAPL", "2019-12-01", "2020-06-01") == [
+        ("2019-12-01", "2020-01-01"),
+        ("2020-03-01", "2020-04-01"),
+        ("2020-05-01", "2020-06-01"),
+    ]
+
+
+def test_merge_coalesces_adjacent_ranges_and_slices(tmp_path):
+    store = PriceStore(store_dir=str(tmp_path))
+    store.merge("AAPL", _bars("2020-01-01", "2020-02-01"), "2020-01-01", "2020-02-01")
+    store.merge("AAPL", _bars("2020-02-01", "2020-03-01"), "2020-02-01", "2020-03-01")
+
+    assert store.covered_ranges("AAPL") == [["2020-01-01", "2020-03-01"]]
+    sliced = store.load_range("AAPL", "2020-01-15", "2020-02-15")
+    assert sliced.index.min() >= pd.Timestamp("2020-01-15")
+    assert sliced.index.max() < pd.Timestamp("2020-02-15")
+
+
+def test_legacy_files_are_imported(tmp_path):
+    legacy = _bars("2021-01-01", "2021-02-01")
+    pd.to_pickle(legacy, os.path.join(tmp_path, "MSFT_2021-01-01_2021-02-01.pkl"))
+    store = PriceStore(store_dir=os.path.join(tmp_path, "store"), legacy_dir=str(tmp_path))
+
+    assert store.covered_ranges("MSFT") == [["2021-01-01", "2021-02-01"]]
+    assert not os.path.exists(os.path.join(tmp_path, "MSFT_2021-01-01_2021-02-01.pkl"))
+
+
+def test_fetcher_downloads_only_gaps(tmp_path, monkeypatch):
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache_dir", ""),
+                          rate_limiter=RateLimiter())
+    calls = []
+
+    def fake_download(ticker, start_date, end_date, interval="1d"):
+        calls.append((start_date, end_date))
+        return _bars(start_date, end_date)
+
+    monkeypatch.setattr(fetcher, "_download", fake_download)
+
+    fetcher.fetch_stock_data("AAPL", "2020-01-01", "2020-06-01")
+    data = fetcher.fetch_stock_data("AAPL", "2020-01-01", "2020-06-30")
+
+    assert calls == [("2020-01-01", "2020-06-01"), ("2020-06-01", "2020-06-30")]
+    assert "Date" in data.columns
+    assert data["Date"].max() < pd.Timestamp("2020-06-30")
+
+
+def test_fetch_many_groups_tickers_by_gap(tmp_path, monkeypatch):
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache_dir", ""),
+                          rate_limiter=RateLimiter())
+    fetcher.price_store.merge("AAPL", _bars("2020-01-01", "2020-02-01"), "2020-01-01", "2020-02-01")
+    calls = []
+
+    def fake_download_many(tickers, start_date, end_date, interval="1d"):
+        calls.append((tuple(tickers), start_date, end_date))
+        return {ticker: _bars(start_date, end_date) for ticker in tickers if ticker != "NOPE"}
+
+    monkeypatch.setattr(fetcher, "_download_many", fake_download_many)
+    results = fetcher.fetch_many(["AAPL", "MSFT", "NOPE"], "2020-01-01", "2020-03-01")
+
+    assert sorted(calls) == [
+        (("AAPL",), "2020-02-01", "2020-03-01"),
+        (("MSFT", "NOPE"), "2020-01-01", "2020-03-01"),
+    ]
+    assert results["NOPE"] is None
+    assert len(results["AAPL"]) == len(results["MSFT"])
+
+
+def test_fetch_many_normalizes_tickers(tmp_path, monkeypatch):
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache_dir", ""),
+                          rate_limiter=RateLimiter())
+    calls = []
+
+    def fake_download_many(tickers, start_date, end_date, interval="1d"):
+        calls.append(tuple(tickers))
+        return {ticker: _bars(start_date, end_date) for ticker in tickers}
+
+    monkeypatch.setattr(fetcher, "_download_many", fake_download_many)
+    results = fetcher.fetch_many(["spy", " SPY", "Spy"], "2020-01-01", "2020-02-01")
+
+    assert calls == [("SPY",)] and list(results) == ["SPY"]
+    assert sorted(os.listdir(fetcher.price_store.store_dir)) == ["SPY"]
+    assert list(fetcher.fetch_many(["spy"], "2020-01-01", "2020-02-01")) == ["SPY"] and len(calls) == 1
+
+
+def test_columnar_store_projects_columns_and_converts_pickled_store(tmp_path):
+    frame = _bars("2020-01-01", "2020-03-01").assign(Volume=1000)
+    pd.to_pickle({"data": frame, "ranges": [["2020-01-01", "2020-03-01"]]}, os.path.join(tmp_path, "AAPL.pkl"))
+    store = PriceStore(store_dir=str(tmp_path))
+
+    close = store.load_range("AAPL", "2020-02-01", "2020-02-15", columns=["Close"])
+
+    assert list(close.columns) == ["Close"]
+    pd.testing.assert_frame_equal(close, frame.loc["2020-02-01":"2020-02-14", ["Close"]],
+                                  check_freq=False, check_index_type=False)
+    assert not os.path.exists(os.path.join(tmp_path, "AAPL.pkl"))
+    assert os.path.isfile(os.path.join(tmp_path, "AAPL", PriceStore.MANIFEST_FILE))
+
+    store.merge("AAPL", _bars("2020-03-01", "2020-04-01").assign(Volume=5), "2020-03-01", "2020-04-01")
+    files = sorted(os.listdir(os.path.join(tmp_path, "AAPL")))
+    assert [re.sub(r"\.2\.[0-9a-f]+\.", ".2.", name) for name in files] == [
+        ".lock", "col0.2.npy", "col1.2.npy", "index.2.npy", "manifest.json"]
+
+
+def _merge_month(store_dir, month):
+    start, end = f"2020-{month:02d}-01", f"2020-{month + 1:02d}-01"
+    PriceStore(store_dir=store_dir).merge("AAPL", _bars(start, end), start, end)
+
+
+def test_processes_merging_one_ticker_keep_every_range(tmp_path):
+    store_dir = str(tmp_path)
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        pool.starmap(_merge_month, [(store_dir, month) for month in range(1, 9)])
+
+    store = PriceStore(store_dir=store_dir)
+    assert store.covered_ranges("AAPL") == [["2020-01-01", "2020-09-01"]]
+    assert len(store.load_range("AAPL", "2020-01-01", "2020-09-01")) == len(_bars("2020-01-01", "2020-09-01"))
+    files = [name for name in os.listdir(os.path.join(store_dir, "AAPL")) if name.endswith(".npy")]
+    assert len(files) == 2 and not any(name.endswith(".tmp") for name in os.listdir(os.path.join(store_dir, "AAPL")))
+
+
+def test_empty_answers_for_unknown_tickers_are_negatively_cached(tmp_path, monkeypatch):
+    negative_cache = NegativeCache(ttl=300)
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache_dir", ""),
+                          rate_limiter=RateLimiter(), negative_cache=negative_cache)
+    calls = []
+
+    def fake_download(ticker, start_date, end_date, interval="1d"):
+        calls.append(ticker)
+        return pd.DataFrame()
+
+    monkeypatch.setattr(fetcher, "_download", fake_download)
+    assert fetcher.fetch_stock_data("TYPO", "2020-01-01", "2020-02-01") is None
+    assert fetcher.fetch_stock_data("TYPO", "2020-01-01", "2020-02-01") is None
+
+    assert calls == ["TYPO"]
+    assert fetcher.price_store.covered_ranges("TYPO") == []
+    assert negative_cache.get_stats()["hits"] == 1
+
+
+def test_empty_answer_for_a_known_ticker_is_retried(tmp_path, monkeypatch):
+    negative_cache = NegativeCache(ttl=0.05)
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache_dir", ""),
+                          rate_limiter=RateLimiter(), negative_cache=negative_cache)
+    fetcher.price_store.merge("AAPL", _bars("2023-01-01", "2023-02-01"), "2023-01-01", "2023-02-01")
+    answers = [pd.DataFrame(), _bars("2023-02-01", "2023-03-01")]
+    calls = []
+
+    def fake_download(ticker, start_date, end_date, interval="1d"):
+        calls.append((start_date, end_date))
+        return answers.pop(0)
+
+    monkeypatch.setattr(fetcher, "_download", fake_download)
+    assert len(fetcher.fetch_stock_data("AAPL", "2023-01-01", "2023-03-01")) == len(_bars("2023-01-01", "2023-02-01"))
+    assert fetcher.price_store.missing_ranges("AAPL", "2023-01-01", "2023-03-01") == [("2023-02-01", "2023-03-01")]
+    assert len(fetcher.fetch_stock_data("AAPL", "2023-01-01", "2023-03-01")) == len(_bars("2023-01-01", "2023-02-01"))
+
+    time.sleep(0.1)
+    assert len(fetcher.fetch_stock_data("AAPL", "2023-01-01", "2023-03-01")) == len(_bars("2023-01-01", "2023-03-01"))
+    assert calls == [("2023-02-01", "2023-03-01")] * 2
+    assert fetcher.price_store.missing_ranges("AAPL", "2023-01-01", "2023-03-01") == []
+
+    monkeypatch.setattr(fetcher, "_download", lambda *args, **kwargs: pd.DataFrame())
+    fetcher.fetch_stock_data("AAPL", "2023-03-04", "2023-03-06")  # weekend, no session
+    fetcher.fetch_stock_data("AAPL", "2023-03-06", "2023-03-08")
+    assert fetcher.price_store.missing_ranges("AAPL", "2023-03-04", "2023-03-08") == [("2023-03-06", "2023-03-08")]
+
+
+def test_covered_ranges_reads_only_the_manifest(tmp_path, monkeypatch):
+    store = PriceStore(store_dir=str(tmp_path))
+    store.memory_cache.max_bytes = 0
+    store.merge("AAPL", _bars("2020-01-01", "2020-02-01"), "2020-01-01", "2020-02-01")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("price data was loaded")
+
+    monkeypatch.setattr(store, "_read_frame", fail)
+    assert store.covered_ranges("AAPL") == [["2020-01-01", "2020-02-01"]]
+    assert store.missing_ranges("AAPL", "2020-01-01", "2020-03-01") == [("2020-02-01", "2020-03-01")]
@@ -0,0 +1,36 @@
+import os
+import sys
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from portfolio_manager.market_data_provider import MarketDataProvider
+from portfolio_manager.quote_service import QuoteService
+
+
+class _InfoProvider(MarketDataProvider):
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def info(self, ticker):
+        with self.lock:
+            self.calls.append(ticker)
+        if ticker == "FAIL":
+            raise ConnectionError("upstream down")
+        return {"symbol": ticker, "regularMarketPrice": 100.0}
+
+
+def test_snapshots_are_fetched_once_per_ticker_within_the_ttl():
+    provider = _InfoProvider()
+    quotes = QuoteService(provider=provider, ttl=60)
+
+    many = quotes.get_many(["AAPL", "MSFT", "AAPL", "FAIL"])
+    many["AAPL"]["regularMarketPrice"] = 0.0
+    assert quotes.get("AAPL")["regularMarketPrice"] == 100.0
+    assert many["FAIL"] == {} and set(many) == {"AAPL", "MSFT", "FAIL"}
+    assert sorted(provider.calls) == ["AAPL", "FAIL", "MSFT"]
+
+    expired = QuoteService(provider=provider, ttl=0)
+    expired.get("AAPL")
+    expired.get("AAPL")
+    assert provider.calls.count("AAPL") == 3
@@ -0,0 +1,58 @@
+import os
+import sys
+import threading
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from portfolio_manager.rate_limiter import RateLimiter, RateLimitExceeded
+from portfolio_manager.data_fetcher import DataFetcher
+
+
+def test_bucket_allows_burst_then_reports_retry_after():
+    limiter = RateLimiter(max_requests=2, period=60, capacity=3)
+
+    assert [limiter.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    retry_after = limiter.try_acquire()
+    assert 0 < retry_after <= 30
+
+
+def test_bucket_state_is_shared_through_sqlite(tmp_path):
+    state_path = os.path.join(tmp_path, "rate_limit.db")
+    first = RateLimiter(max_requests=1, period=60, capacity=2, state_path=state_path)
+    second = RateLimiter(max_requests=1, period=60, capacity=2, state_path=state_path)
+
+    assert first.try_acquire() == 0.0
+    assert second.try_acquire() == 0.0
+    assert first.try_acquire() > 0
+    assert second.try_acquire() > 0
+
+
+def test_concurrent_takes_never_exceed_capacity(tmp_path):
+    limiter = RateLimiter(max_requests=1, period=3600, capacity=20, state_path=os.path.join(tmp_path, "rl.db"))
+    granted = []
+
+    def worker():
+        for _ in range(10):
+            if limiter.try_acquire() == 0.0:
+                granted.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(granted) == 20
+
+
+def test_acquire_times_out_and_non_blocking_fetcher_raises(tmp_path):
+    limiter = RateLimiter(max_requests=1, period=60, capacity=1)
+    limiter.acquire()
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire(timeout=0.1)
+
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache", ""),
+                          rate_limiter=limiter, blocking=False)
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        fetcher.fetch_stock_data("AAPL", "2020-01-01", "2020-02-01")
+    assert excinfo.value.retry_after > 0
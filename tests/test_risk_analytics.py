@@ -0,0 +1,98 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from handlers.handlers import PortfolioManager
+from portfolio_manager.data_fetcher import DataFetcher
+from portfolio_manager.market_data_provider import MarketDataProvider
+from portfolio_manager.rate_limiter import RateLimiter
+from portfolio_manager.risk_analytics import RiskAnalytics
+
+
+def _prices():
+    rng = np.random.default_rng(9)
+    index = pd.bdate_range("2019-01-01", periods=600)
+    market = rng.normal(0.0004, 0.01, 600)
+    returns = market[:, None] * np.array([0.5, 1.0, 1.5]) + rng.normal(0, 0.01, (600, 3))
+    prices = pd.DataFrame(50 * np.exp(np.cumsum(returns, axis=0)), index=index, columns=["A", "B", "C"])
+    prices.iloc[:40, 2] = np.nan  # listed later
+    prices.iloc[300:303, 1] = np.nan  # trading halt
+    return prices, pd.Series(100 * np.exp(np.cumsum(market)), index=index)
+
+
+def test_risk_metrics_match_pandas():
+    prices, benchmark = _prices()
+    shares = {"A": 10, "B": 20, "C": 5, "GONE": 1}
+    risk = RiskAnalytics.analyze(prices, shares, benchmark=benchmark, confidence=0.95, beta_window=60)
+
+    filled = prices.ffill().iloc[40:]
+    returns = filled.pct_change().iloc[1:]
+    bench = benchmark.iloc[40:].pct_change().iloc[1:]
+    portfolio_value = (filled * pd.Series(shares).drop("GONE")).sum(axis=1)
+    portfolio = portfolio_value.pct_change().iloc[1:]
+
+    assert risk["missing"] == ["GONE"]
+    assert risk["observations"] == len(returns)
+    np.testing.assert_allclose(risk["covariance"].to_numpy(), returns.cov().to_numpy() * 252, rtol=1e-10)
+    np.testing.assert_allclose(risk["correlation"].to_numpy(), returns.corr().to_numpy(), rtol=1e-10)
+    assert sum(holding["risk_contribution"] for holding in risk["holdings"].values()) == pytest.approx(1.0)
+
+    for name, series, metrics in [(t, returns[t], risk["holdings"][t]) for t in "ABC"] + [("portfolio", portfolio, risk["portfolio"])]:
+        wealth = (1 + series).cumprod()
+        expected = {
+            "annualized_volatility": series.std() * np.sqrt(252),
+            "sharpe": series.mean() / series.std() * np.sqrt(252),
+            "max_drawdown": (wealth / wealth.cummax().clip(lower=1) - 1).min(),
+            "var_historical": -series.quantile(0.05),
+            "cvar_historical": -series[series <= series.quantile(0.05)].mean(),
+            "beta": series.cov(bench) / bench.var(),
+        }
+        for metric, target in expected.items():
+            assert metrics[metric] == pytest.approx(target, rel=1e-9), f"{metric} of {name}"
+
+    rolling = returns["B"].rolling(60).cov(bench) / bench.rolling(60).var()
+    np.testing.assert_allclose(risk["rolling_beta"]["B"], rolling, rtol=1e-8)
+    assert risk["portfolio"]["value"] == pytest.approx(portfolio_value.iloc[-1])
+
+
+def test_risk_rejects_portfolio_without_prices():
+    prices, _ = _prices()
+    with pytest.raises(ValueError):
+        RiskAnalytics.analyze(prices, {"GONE": 1})
+
+
+class _HistoryProvider(MarketDataProvider):
+    def __init__(self, bars):
+        self.bars = bars
+
+    def history(self, ticker, start_date, end_date, interval="1d"):
+        bars = self.bars[ticker]
+        return bars[(bars.index >= start_date) & (bars.index < end_date)]
+
+
+def test_calculate_risk_aligns_fetched_frames_by_date(tmp_path):
+    rng = np.random.default_rng(9)
+    listings = {"OLD": "2024-01-01", "NEW": "2024-07-01", "SPY": "2024-01-01"}
+    bars = {}
+    for ticker, listed in listings.items():
+        index = pd.bdate_range(listed, "2024-12-31", name="Date")
+        bars[ticker] = pd.DataFrame({"Close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))}, index=index)
+    fetcher = DataFetcher(base_dir=str(tmp_path), cache_dir=os.path.join(tmp_path, "cache_dir", ""),
+                          rate_limiter=RateLimiter(), provider=_HistoryProvider(bars))
+    manager = PortfolioManager(base_dir=str(tmp_path))
+    manager.add_to_portfolio("a@b.c", "OLD", 10, 100.0)
+    manager.add_to_portfolio("a@b.c", "NEW", 5, 100.0)
+
+    risk = manager.calculate_risk("a@b.c", fetcher, "2024-01-01", "2025-01-01", benchmark=" spy", beta_window=20)
+
+    prices = pd.DataFrame({ticker: bars[ticker]["Close"] for ticker in ("OLD", "NEW")}).rename_axis(None)
+    expected = RiskAnalytics.analyze(prices, {"OLD": 10, "NEW": 5}, benchmark=bars["SPY"]["Close"], beta_window=20)
+    assert isinstance(risk["start"], pd.Timestamp)
+    assert risk["start"].isoformat() == expected["start"].isoformat()
+    assert risk["start"] > pd.Timestamp("2024-07-01")
+    assert risk["observations"] == expected["observations"] == len(bars["NEW"]) - 1
+    for metric, value in expected["portfolio"].items():
+        assert risk["portfolio"][metric] == pytest.approx(value, rel=1e-9, nan_ok=True), metric
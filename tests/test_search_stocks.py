@@ -0,0 +1,95 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from portfolio_manager.market_data_provider import MarketDataProvider
+from portfolio_manager.rate_limiter import RateLimiter
+from portfolio_manager.searchStocks import StockSearcher
+
+
+class _InfoProvider(MarketDataProvider):
+    def __init__(self, slow=(), unknown=()):
+        self.calls = []
+        self.slow = slow
+        self.unknown = unknown
+        self.release = threading.Event()
+
+    def info(self, ticker):
+        self.calls.append(ticker)
+        if ticker in self.slow:
+            self.release.wait(5)
+        if ticker in self.unknown:
+            return {}
+        return {"symbol": ticker, "longName": f"{ticker} Inc.", "dividendYield": 0.01}
+
+
+def _searcher(tmp_path, provider, **kwargs):
+    return StockSearcher(tickers=[], base_dir=str(tmp_path), db_path=str(tmp_path / "cache.db"), provider=provider,
+                         rate_limiter=RateLimiter(max_requests=100, period=1), **kwargs)
+
+
+def test_metadata_is_cached_as_json_and_shared_across_threads(tmp_path):
+    provider = _InfoProvider()
+    searcher = _searcher(tmp_path, provider)
+    with searcher.pool.connection() as connection:
+        connection.execute("REPLACE INTO cache VALUES ('OLD', \"{'ticker': 'OLD'}\", '2099-01-01 00:00:00')")
+
+    first = searcher.search(["AAPL", "MSFT", "OLD"])
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: searcher.search(["AAPL", "MSFT"]), range(8)))
+
+    assert sorted(provider.calls) == ["AAPL", "MSFT", "OLD"]
+    assert first["AAPL"] == {"status": "fetched", "data": first["AAPL"]["data"]}
+    assert first["OLD"]["data"]["name"] == "OLD Inc."
+    assert all(result["MSFT"] == {"status": "cached", "data": first["MSFT"]["data"]} for result in results)
+    restarted = _searcher(tmp_path, provider)
+    assert restarted.is_cached("OLD") and not restarted.is_cached("GOOGL")
+    assert restarted.fetch_metadata("AAPL")["name"] == "AAPL Inc."
+
+
+def test_search_returns_partial_results_at_the_deadline(tmp_path):
+    provider = _InfoProvider(slow=("SLOW",), unknown=("NOPE",))
+    searcher = _searcher(tmp_path, provider, max_workers=4)
+
+    started = time.time()
+    results = searcher.search(["AAPL", "SLOW", "NOPE"], timeout=0.5)
+
+    assert time.time() - started < 2
+    assert {ticker: result["status"] for ticker, result in results.items()} == {
+        "AAPL": "fetched", "SLOW": "timeout", "NOPE": "not_found"}
+    provider.release.set()
+    searcher.close_connection()
+    assert _searcher(tmp_path, provider).is_cached("SLOW")
+
+
+class _CountingLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__(max_requests=100, period=1)
+        self.taken = 0
+
+    def acquire(self, tokens=1, timeout=None):
+        self.taken += tokens
+        return super().acquire(tokens, timeout)
+
+
+def test_coalesced_misses_and_quote_hits_take_no_token(tmp_path):
+    provider = _InfoProvider(slow=("SLOW",))
+    limiter = _CountingLimiter()
+    searcher = StockSearcher(tickers=[], base_dir=str(tmp_path), db_path=str(tmp_path / "cache.db"),
+                             provider=provider, rate_limiter=limiter, max_workers=4)
+    searcher.quotes.get("AAPL")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        searches = [executor.submit(searcher.search, ["SLOW"]) for _ in range(3)]
+        time.sleep(0.2)
+        provider.release.set()
+        results = [search.result() for search in searches]
+    cached_quote = searcher.search(["AAPL"])
+
+    assert all(result["SLOW"]["status"] in ("fetched", "cached") for result in results)
+    assert cached_quote["AAPL"]["status"] == "fetched"
+    assert provider.calls == ["AAPL", "SLOW"]
+    assert limiter.taken == 1
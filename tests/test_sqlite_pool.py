@@ -0,0 +1,28 @@
+import gc
+import os
+import sys
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager.sqlite_pool import SQLiteConnectionPool
+
+
+def test_connections_close_when_their_thread_exits(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / "cache.db"))
+    with pool.connection() as connection:
+        connection.execute("CREATE TABLE cache (ticker TEXT PRIMARY KEY)")
+
+    def request(i):
+        with pool.connection() as connection:
+            connection.execute("INSERT INTO cache VALUES (?)", (f"T{i}",))
+
+    for i in range(50):
+        thread = threading.Thread(target=request, args=(i,))
+        thread.start()
+        thread.join()
+    gc.collect()
+
+    assert pool.open_connections == 1  # only the main thread's
+    assert pool.connection().execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 50
+    pool.close_all()
+    assert pool.open_connections == 0
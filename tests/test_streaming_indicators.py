@@ -0,0 +1,41 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager.indicator_state_cache import IndicatorStateCache
+from portfolio_manager.metrics_calculator import MetricsCalculator
+from portfolio_manager.streaming_indicators import StreamingIndicators
+from portfolio_manager.technical_analysis import TechnicalAnalysis
+
+
+def test_streaming_indicators_match_batch_across_a_snapshot(tmp_path):
+    rng = np.random.default_rng(3)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 600)))
+    closes[50:55] = np.nan
+    data = pd.DataFrame({"Close": closes}, index=pd.date_range("2024-01-02 09:30", periods=600, freq="5min"))
+    macd, signal = TechnicalAnalysis.calculate_macd(data)
+    expected = {
+        "moving_average": MetricsCalculator.calculate_moving_average(data, 20),
+        "volatility": MetricsCalculator.calculate_volatility(data, 20),
+        "rsi": TechnicalAnalysis.calculate_rsi(data),
+        "macd": macd,
+        "signal": signal,
+    }
+
+    cache = IndicatorStateCache(cache_dir=str(tmp_path))
+    indicators = StreamingIndicators()
+    streamed = {name: [] for name in expected}
+    for i, (timestamp, close) in enumerate(data["Close"].items()):
+        if i == 300:
+            cache.put("AAPL_5m", indicators.snapshot())
+            indicators = StreamingIndicators.restore(IndicatorStateCache(cache_dir=str(tmp_path)).get("AAPL_5m"))
+        latest = indicators.update(close, timestamp.isoformat())
+        for name in expected:
+            streamed[name].append(latest[name])
+
+    for name in ("moving_average", "rsi", "macd", "signal"):
+        np.testing.assert_array_equal(streamed[name], expected[name].to_numpy(), err_msg=name)
+    np.testing.assert_allclose(streamed["volatility"], expected["volatility"].to_numpy(), rtol=1e-9)
+    assert indicators.last_timestamp == data.index[-1].isoformat()
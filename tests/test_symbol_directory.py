@@ -0,0 +1,66 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from file_manager.symbol_directory import SymbolDirectory
+from portfolio_manager.market_data_provider import MarketDataProvider
+from portfolio_manager.quote_service import QuoteService
+
+
+LISTING = """Symbol,Name,Exchange
+AAPL,Apple Inc.,NASDAQ
+BRK.B,Berkshire Hathaway Inc. Class B,NYSE
+MSFT,Microsoft Corporation,NASDAQ
+MS,Morgan Stanley,NYSE
+MSCI,MSCI Inc.,NYSE
+"""
+
+
+def test_directory_resolves_symbols_and_names_offline(tmp_path):
+    listing = tmp_path / "listing.csv"
+    listing.write_text(LISTING)
+    path = str(tmp_path / "symbols.json")
+    directory = SymbolDirectory(path=path)
+    assert directory.refresh_if_stale(str(listing)) and not directory.refresh_if_stale(str(listing))
+
+    restarted = SymbolDirectory(path=path)
+    assert len(restarted) == 5
+    assert restarted.resolve("brk.b") == "BRK-B" and restarted.resolve("BRK-B") == "BRK-B"
+    assert restarted.resolve("apple") == "AAPL" and restarted.resolve("Microsft Corporation") == "MSFT"
+    assert restarted.resolve("TSLA") is None and restarted.resolve("TSLA", lookup=lambda symbol: symbol) == "TSLA"
+    assert restarted.resolve("no such company") is None
+    assert [entry["symbol"] for entry in restarted.prefix_search("ms")] == ["MS", "MSCI", "MSFT"]
+    assert [entry["symbol"] for entry in restarted.suggest("micro corp")] == ["MSFT"]
+
+
+def test_yahoo_symbols_keep_their_suffixes():
+    normalize = SymbolDirectory.normalize_symbol
+    assert normalize(" brk.b ") == "BRK-B" and normalize("BF/B") == "BF-B" and normalize("MOG.A") == "MOG-A"
+    for symbol in ["VOD.L", "SHOP.TO", "0700.HK", "BTC-USD", "^GSPC", "SAP.DE", "BRK-B"]:
+        assert normalize(symbol.lower()) == symbol
+
+
+class _QuoteProvider(MarketDataProvider):
+    LISTED = {"VOD.L", "SHOP.TO", "0700.HK", "BTC-USD", "^GSPC"}
+
+    def __init__(self):
+        self.calls = []
+
+    def info(self, ticker):
+        self.calls.append(ticker)
+        return {"symbol": ticker} if ticker in self.LISTED else {}
+
+
+def test_unlisted_symbols_fall_back_to_the_quote_service(tmp_path):
+    provider = _QuoteProvider()
+    quotes = QuoteService(provider=provider)
+    directory = SymbolDirectory(path=str(tmp_path / "symbols.json"))
+
+    def lookup(symbol):
+        return quotes.get(symbol).get("symbol")
+
+    for query, symbol in [("VOD.L", "VOD.L"), ("shop.to", "SHOP.TO"), ("0700.HK", "0700.HK"),
+                          ("BTC-USD", "BTC-USD"), ("^GSPC", "^GSPC"), ("NOPE", None)]:
+        assert directory.resolve(query) is None
+        assert directory.resolve(query, lookup=lookup) == symbol
+    assert provider.calls == ["VOD.L", "SHOP.TO", "0700.HK", "BTC-USD", "^GSPC", "NOPE"]
@@ -0,0 +1,69 @@
+import os
+import sys
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+from portfolio_manager.streaming_indicators import StreamingIndicators
+from portfolio_manager import tracker as tracker_module
+from portfolio_manager.tracker import Tracker
+
+
+class _Fetcher:
+    """Returns bars in DataFetcher.fetch_many's shape: a RangeIndex and a Datetime column."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.visible = 0
+
+    def fetch_many(self, tickers, start_date, end_date, interval="1d"):
+        self.requested = (start_date, end_date)
+        return {ticker: self.bars.iloc[:self.visible].reset_index() for ticker in tickers}
+
+
+def test_check_price_updates_indicators_from_fetched_bars(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    index = pd.date_range("2024-03-04 09:30", periods=60, freq="5min", name="Datetime")
+    bars = pd.DataFrame({"Close": 100 + np.cumsum(np.random.default_rng(2).normal(0, 0.5, 60))}, index=index)
+    tracker = Tracker(base_dir=str(tmp_path))
+    tracker.fetcher = _Fetcher(bars)
+    tracker.watchlist = [("AAPL", 50.0)]
+    alerts = []
+    log_info = tracker.logger.log_info
+    monkeypatch.setattr(tracker.logger, "log_info",
+                        lambda message: alerts.append(message) if message.startswith("Alert") else log_info(message))
+
+    for visible in (40, 40, 60):  # the repeated poll returns no new bars
+        tracker.fetcher.visible = visible
+        tracker.check_price()
+
+    expected = StreamingIndicators()
+    expected.update_many(bars["Close"])
+    state = tracker.indicator_states.get("AAPL_5m")
+    assert state["last_timestamp"] == index[-1].isoformat()
+    assert state["latest"]["rsi"] == expected.latest["rsi"]
+    assert state["latest"]["macd"] == expected.latest["macd"]
+    assert len(alerts) == 3
+
+
+class _TokyoClock(datetime):
+    """A server in Tokyo at 17:30 New York time on 2024-03-04 (07:30 on the 5th locally)."""
+
+    @classmethod
+    def now(cls, tz=None):
+        instant = datetime(2024, 3, 4, 22, 30, tzinfo=timezone.utc)
+        return instant.astimezone(tz or ZoneInfo("Asia/Tokyo")).replace(tzinfo=tz)
+
+
+def test_check_price_requests_the_exchange_day(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tracker_module, "datetime", _TokyoClock)
+    tracker = Tracker(base_dir=str(tmp_path))
+    tracker.fetcher = _Fetcher(pd.DataFrame({"Close": []}, index=pd.DatetimeIndex([], name="Datetime")))
+    tracker.watchlist = [("AAPL", 50.0)]
+
+    tracker.check_price()
+
+    assert tracker.fetcher.requested == ("2024-03-04", "2024-03-05")